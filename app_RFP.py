@@ -7,20 +7,36 @@ Full document upload support and comprehensive workflow testing
 """
 
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import json
+import numpy as np
+import os
 import re
-from datetime import datetime, timedelta
-import io
+from datetime import date, datetime, timedelta
 import uuid
-from typing import Dict, List, Optional, Tuple, Any
-import base64
-import time
+from typing import Dict, List, NamedTuple, Optional, Tuple, Any
+import sys
 import random
-import zipfile
+from functools import partial, wraps
+
+from rfp_scoring import ScoringEngine
+from rfp_aggregates import WorkflowProgress
+from rfp_ai_scoring import AIScorer, is_available as ai_scoring_available
+from rfp_cache import ExtractionCache
+from rfp_charts import VIEWS as CHART_VIEWS, FigureCache, criterion_label
+from rfp_export import EvaluationSnapshot, ExportResult, export_package, export_path
+from rfp_ingest import SPOOL_DIR, bulk_ingest, ingest_file, spool_upload, text_document
+from rfp_jobs import CANCELLED, DONE, FINISHED, Job, JobManager
+from rfp_matching import RequirementMatcher
+from rfp_persistence import StateBackend, open_backend
+from rfp_portfolio import load_portfolio, new_workspace, verify_rollups
+from rfp_selection import BUNDLE, AwardResult, Bid, optimize_award, parse_budget_range
+from rfp_sensitivity import (DEFAULT_NOISE, SENSITIVITY_WORKERS, analyze as analyze_sensitivity,
+                             ranks_of, reweight)
+from rfp_store import StoreColumn, VendorStore
+from rfp_synthetic import SyntheticVendors, VendorBlock
+from rfp_schedule import Schedule, gantt_figure
+from rfp_templates import (CONSOLIDATED, CRITERIA_WEIGHTS, CSG, CSO, DEFAULT_RFP_TITLE, EVALUATION_CRITERIA,
+                           REQUIREMENT_CATALOG, SERVICES, STANDALONE, WAREHOUSE, WorkflowStage, new_workflow,
+                           rfp_details, workflow_template)
 
 # ========================================
 # CONFIGURATION & INITIALIZATION
@@ -33,23 +49,28 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize session state
-if 'workflow_stages' not in st.session_state:
-    st.session_state.workflow_stages = None
-if 'vendors' not in st.session_state:
-    st.session_state.vendors = {}
-if 'rfp_documents' not in st.session_state:
-    st.session_state.rfp_documents = {}
-if 'vendor_documents' not in st.session_state:
-    st.session_state.vendor_documents = {}
-if 'selected_vendors' not in st.session_state:
-    st.session_state.selected_vendors = {}
-if 'test_data_generated' not in st.session_state:
-    st.session_state.test_data_generated = False
+def init_session_state():
+    """Session defaults; also called by headless harnesses that import this module"""
+    if 'workflow_stages' not in st.session_state:
+        st.session_state.workflow_stages = None
+    if 'vendors' not in st.session_state:
+        st.session_state.vendors = None
+    if 'rfp_documents' not in st.session_state:
+        st.session_state.rfp_documents = {}
+    if 'vendor_documents' not in st.session_state:
+        st.session_state.vendor_documents = {}
+    if 'selected_vendors' not in st.session_state:
+        st.session_state.selected_vendors = {}
+    if 'test_data_generated' not in st.session_state:
+        st.session_state.test_data_generated = False
+    if 'rfp_created' not in st.session_state:
+        # Replaced by the stored creation time when a persistent RFP is opened
+        st.session_state.rfp_created = datetime.now()
+
+init_session_state()
 
 # Professional CSS styling
-st.markdown("""
-<style>
+APP_CSS = """
     :root {
         --primary: #1e3a8a;
         --secondary: #3b82f6;
@@ -206,8 +227,17 @@ st.markdown("""
         border-radius: 10px;
         margin: 1rem 0;
     }
-</style>
-""", unsafe_allow_html=True)
+"""
+
+@st.cache_resource
+def app_style() -> str:
+    """APP_CSS minified into a <style> block once per process"""
+    css = re.sub(r"\s+", " ", APP_CSS)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    return f"<style>{css.strip()}</style>"
+
+# Style-only HTML goes to the event container, so it takes no space in the page
+st.html(app_style())
 
 # ========================================
 # DATA MODELS & CLASSES
@@ -215,8 +245,8 @@ st.markdown("""
 
 class ServiceModel:
     """Represents different service models for RFP"""
-    STANDALONE = "Standalone"
-    CONSOLIDATED = "Consolidated"
+    STANDALONE = STANDALONE
+    CONSOLIDATED = CONSOLIDATED
     
     @staticmethod
     def get_description(model):
@@ -227,87 +257,63 @@ class ServiceModel:
 
 class ServiceType:
     """Types of services being procured"""
-    WAREHOUSE = "Warehouse Services"
-    CSO = "Customer Service Operations"
-    CSG = "Consumer Solutions Group"
+    WAREHOUSE = WAREHOUSE
+    CSO = CSO
+    CSG = CSG
     
     @staticmethod
     def get_all():
-        return [ServiceType.WAREHOUSE, ServiceType.CSO, ServiceType.CSG]
+        return list(SERVICES)
     
     @staticmethod
     def get_requirements(service):
-        requirements = {
-            ServiceType.WAREHOUSE: [
-                "Storage capacity (minimum 500,000 sq ft)",
-                "Temperature-controlled zones (ambient, cooled, frozen)",
-                "24/7 operations capability with 99.9% uptime",
-                "WMS integration (SAP EWM, Manhattan, or equivalent)",
-                "Cross-docking and transloading capabilities",
-                "Security: C-TPAT and TAPA certifications required"
-            ],
-            ServiceType.CSO: [
-                "RMA processing (same-day turnaround)",
-                "Returns management system integration",
-                "Customer support (24/7, multi-channel)",
-                "Replacement fulfillment within 24 hours",
-                "Quality inspection processes (99.5% accuracy)",
-                "Response time SLAs (< 2 hours)"
-            ],
-            ServiceType.CSG: [
-                "Kitting services (10,000+ units/day capacity)",
-                "Custom packaging capabilities",
-                "Assembly operations (electronics, mechanical)",
-                "Labeling services (barcode, RFID)",
-                "Custom fulfillment solutions",
-                "Quality control (Six Sigma processes)"
-            ]
-        }
-        return requirements.get(service, [])
-
-class WorkflowStage:
-    """RFP workflow stages"""
-    def __init__(self, stage_id: str, stage_num: int, name: str, description: str,
-                 required_docs: List[str], deliverables: List[str], duration: str):
-        self.stage_id = stage_id
-        self.stage_num = stage_num
-        self.name = name
-        self.description = description
-        self.required_docs = required_docs
-        self.deliverables = deliverables
-        self.duration = duration
-        self.status = "pending"
-        self.progress = 0
-        self.start_date = None
-        self.end_date = None
-        self.documents = {}
-        
-    def can_start(self, previous_stage) -> bool:
-        if previous_stage is None:
-            return True
-        return previous_stage.status == "complete"
-    
-    def start(self):
-        self.status = "active"
-        self.start_date = datetime.now()
-        self.progress = 10
-        return True
-        
-    def complete(self):
-        self.status = "complete"
-        self.end_date = datetime.now()
-        self.progress = 100
-        return True
-        
-    def update_progress(self, progress: int):
-        self.progress = min(100, max(0, progress))
-        if self.progress == 100 and self.status != "complete":
-            self.complete()
-        return True
+        """Shared, read-only requirement catalog for a service"""
+        return REQUIREMENT_CATALOG.get(service, ())
+
+# Evaluation criteria, weights and SOW requirements come from the process-wide
+# templates in rfp_templates; only the scoring engine is built here
+SCORING_ENGINE = ScoringEngine(EVALUATION_CRITERIA)
+# SOW requirements matched against proposal text, and keywords of the ones that
+# count towards compliance & security
+SOW_REQUIREMENTS = REQUIREMENT_CATALOG
+COMPLIANCE_KEYWORDS = ("certification", "security", "quality", "six sigma", "c-tpat", "tapa")
+# Certifications vendors can hold and the Selection tab can require
+CERTIFICATIONS = ["C-TPAT", "TAPA", "ISO 9001", "ISO 27001", "SOC 2", "Six Sigma"]
+SELECTION_TIE_BREAKS = {"First evaluated": "evaluated_first", "Name": "name", "Vendor ID": "vendor_id"}
+
+class VendorSnapshot(NamedTuple):
+    """Copy of the vendor fields scoring reads, safe to hand to a background job"""
+    vendor_id: str
+    service_model: str
+    services_offered: List[str]
+    
+    @classmethod
+    def of(cls, vendor: 'VendorProfile') -> 'VendorSnapshot':
+        return cls(vendor.vendor_id, vendor.service_model, list(vendor.services_offered))
 
 class VendorProfile:
-    """Vendor profile for RFP response"""
+    """Vendor profile for RFP response
+    
+    Once added to a VendorStore the columnar fields below are read from and
+    written to the store, so the profile acts as a row view. Slots keep the
+    per-vendor footprint to the detail fields; status, model, services and
+    certifications live in the store as interned codes and bitsets.
+    """
+    DETAIL_FIELDS = ("registration_date", "documents", "pricing", "submission_date",
+                     "evaluation_date", "capabilities", "strengths", "weaknesses", "decision")
+    __slots__ = ("_store", "_row", "vendor_id") + tuple(f"_{f}" for f in VendorStore.FIELDS) + DETAIL_FIELDS
+    
+    name = StoreColumn()
+    status = StoreColumn()
+    service_model = StoreColumn()
+    services_offered = StoreColumn()
+    certifications = StoreColumn()
+    overall_score = StoreColumn()
+    scores = StoreColumn()
+    
     def __init__(self, vendor_id: str, name: str, service_model: str):
+        self._store = None
+        self._row = -1
         self.vendor_id = vendor_id
         self.name = name
         self.service_model = service_model
@@ -322,13 +328,13 @@ class VendorProfile:
         self.evaluation_date = None
         self.capabilities = {}
         self.certifications = []
-        self.strengths = []
-        self.weaknesses = []
+        self.strengths = ()
+        self.weaknesses = ()
         self.decision = None
         
     def add_service(self, service_type: str):
         if service_type not in self.services_offered:
-            self.services_offered.append(service_type)
+            self.services_offered = self.services_offered + [service_type]
     
     def submit_proposal(self, documents: Dict = None):
         if documents:
@@ -337,65 +343,100 @@ class VendorProfile:
         self.status = "Submitted"
     
     def evaluate(self, scores: Dict):
+        overall, strengths, weaknesses = SCORING_ENGINE.score(scores)
+        self.apply_evaluation(scores, overall, strengths, weaknesses)
+    
+    def apply_evaluation(self, scores: Dict, overall_score: float,
+                         strengths: List[str], weaknesses: List[str]):
+        """Record results produced by the scoring engine"""
         self.scores = scores
-        self.overall_score = sum(scores.values()) / len(scores) if scores else 0
+        self.overall_score = overall_score
         self.evaluation_date = datetime.now()
         self.status = "Evaluated"
-        
-        self.strengths = [k.replace('_', ' ').title() for k, v in scores.items() if v >= 85]
-        self.weaknesses = [k.replace('_', ' ').title() for k, v in scores.items() if v < 70]
+        self.strengths = tuple(strengths)
+        self.weaknesses = tuple(weaknesses)
+    
+    def to_record(self) -> Dict:
+        """Serializable record: store columns plus lazily loaded details"""
+        return {
+            "vendor_id": self.vendor_id,
+            "name": self.name,
+            "status": self.status,
+            "service_model": self.service_model,
+            "services_offered": self.services_offered,
+            "certifications": self.certifications,
+            "overall_score": self.overall_score,
+            "scores": self.scores,
+            "details": {field: getattr(self, field) for field in self.DETAIL_FIELDS}
+        }
+    
+    # Detail lists drawn from a small vocabulary; loaded copies share one string each
+    INTERNED_LISTS = ("strengths", "weaknesses")
+    
+    def __getstate__(self):
+        # Flat tuple of slot values: smaller and faster to pickle than a slot dict
+        return tuple(getattr(self, slot, None) for slot in self.__slots__)
+    
+    def __setstate__(self, state):
+        for slot, value in zip(self.__slots__, state):
+            setattr(self, slot, value)
+    
+    @classmethod
+    def from_details(cls, vendor_id: str, details: Optional[Dict]) -> 'VendorProfile':
+        """Build a profile whose columnar fields come from the store"""
+        vendor = cls(vendor_id, None, None)
+        for field, value in (details or {}).items():
+            if field in cls.INTERNED_LISTS:
+                value = tuple(sys.intern(item) if isinstance(item, str) else item for item in value or [])
+            if field in cls.DETAIL_FIELDS:
+                setattr(vendor, field, value)
+        return vendor
+
+# Documents each vendor submits with a proposal: doc key -> file name suffix
+PROPOSAL_BUNDLE = {
+    "technical": "Technical_Proposal.pdf",
+    "pricing": "Pricing_Proposal.xlsx",
+    "compliance": "Certifications.pdf",
+    "references": "References.pdf"
+}
 
 class TestDataGenerator:
     """Generate comprehensive test data for workflow testing"""
     
-    def __init__(self):
-        self.vendor_names = [
-            "Global Logistics Partners LLC",
-            "Integrated Warehouse Solutions Inc.",
-            "Premier Distribution Services",
-            "NextGen Fulfillment Corp.",
-            "Strategic Supply Chain Co.",
-            "National Logistics Network",
-            "Express Warehouse Group",
-            "Unified Transport Solutions"
-        ]
-        
-        self.company_names = [
-            "Tech Corp", "Global Industries", "Future Systems", "Prime Solutions",
-            "Advanced Logistics", "Smart Supply", "Digital Warehouse", "Rapid Fulfillment"
-        ]
+    VENDOR_NAMES = (
+        "Global Logistics Partners LLC",
+        "Integrated Warehouse Solutions Inc.",
+        "Premier Distribution Services",
+        "NextGen Fulfillment Corp.",
+        "Strategic Supply Chain Co.",
+        "National Logistics Network",
+        "Express Warehouse Group",
+        "Unified Transport Solutions"
+    )
+    COMPANY_NAMES = (
+        "Tech Corp", "Global Industries", "Future Systems", "Prime Solutions",
+        "Advanced Logistics", "Smart Supply", "Digital Warehouse", "Rapid Fulfillment"
+    )
     
     def generate_sample_rfp_documents(self) -> Dict:
         """Generate sample RFP documents"""
         docs = {
-            "main_rfp": {
-                "name": "RFP_Logistics_Services_2025.pdf",
-                "type": "application/pdf",
-                "size": 2048576,
-                "content": self._generate_rfp_content(),
-                "upload_date": datetime.now()
-            },
-            "warehouse_sow": {
-                "name": "Warehouse_Services_SOW.docx",
-                "type": "application/docx",
-                "size": 1024768,
-                "content": self._generate_sow_content(ServiceType.WAREHOUSE),
-                "upload_date": datetime.now()
-            },
-            "cso_sow": {
-                "name": "CSO_Services_SOW.docx",
-                "type": "application/docx",
-                "size": 896432,
-                "content": self._generate_sow_content(ServiceType.CSO),
-                "upload_date": datetime.now()
-            },
-            "csg_sow": {
-                "name": "CSG_Services_SOW.docx",
-                "type": "application/docx",
-                "size": 754892,
-                "content": self._generate_sow_content(ServiceType.CSG),
-                "upload_date": datetime.now()
-            }
+            "main_rfp": text_document(
+                "RFP_Logistics_Services_2025.pdf", "application/pdf",
+                self._generate_rfp_content(), size=2048576
+            ),
+            "warehouse_sow": text_document(
+                "Warehouse_Services_SOW.docx", "application/docx",
+                self._generate_sow_content(ServiceType.WAREHOUSE), size=1024768
+            ),
+            "cso_sow": text_document(
+                "CSO_Services_SOW.docx", "application/docx",
+                self._generate_sow_content(ServiceType.CSO), size=896432
+            ),
+            "csg_sow": text_document(
+                "CSG_Services_SOW.docx", "application/docx",
+                self._generate_sow_content(ServiceType.CSG), size=754892
+            )
         }
         return docs
     
@@ -455,6 +496,17 @@ class TestDataGenerator:
         - Volume discounts available
         """
     
+    # Population sizes offered by scale mode
+    SCALE_SIZES = [10_000, 50_000, 100_000, 250_000, 500_000, 1_000_000]
+    
+    def synthetic_population(self, count: int, seed: int = 0) -> SyntheticVendors:
+        """Seeded synthetic population scored by the platform's engine and criteria"""
+        return SyntheticVendors(
+            count, seed, engine=SCORING_ENGINE, services=ServiceType.get_all(),
+            certifications=CERTIFICATIONS, price_ranges=self.PRICE_RANGES,
+            requirements=SOW_REQUIREMENTS, document_bundle=PROPOSAL_BUNDLE,
+        )
+    
     def generate_sample_vendors(self, count: int = 8) -> List[VendorProfile]:
         """Generate sample vendors with different configurations"""
         vendors = []
@@ -462,7 +514,7 @@ class TestDataGenerator:
         # Generate mix of consolidated and standalone vendors
         for i in range(count):
             vendor_id = f"VND-TEST-{str(uuid.uuid4())[:8].upper()}"
-            name = self.vendor_names[i % len(self.vendor_names)]
+            name = self.VENDOR_NAMES[i % len(self.VENDOR_NAMES)]
             
             # First 3 vendors are consolidated, rest are standalone
             if i < 3:
@@ -477,14 +529,11 @@ class TestDataGenerator:
             vendor = VendorProfile(vendor_id, name, model)
             for service in services:
                 vendor.add_service(service)
+            vendor.certifications = random.sample(CERTIFICATIONS, random.randint(1, 4))
+            vendor.pricing = self._generate_pricing(services, model)
             
             # Add sample documents
-            vendor.documents = {
-                "technical": f"{name}_Technical_Proposal.pdf",
-                "pricing": f"{name}_Pricing_Proposal.xlsx",
-                "compliance": f"{name}_Certifications.pdf",
-                "references": f"{name}_References.pdf"
-            }
+            vendor.documents = {key: f"{name}_{suffix}" for key, suffix in PROPOSAL_BUNDLE.items()}
             
             # Set vendor at different stages for testing
             if i < 2:  # First 2 vendors are fully evaluated
@@ -499,6 +548,20 @@ class TestDataGenerator:
         
         return vendors
     
+    # Annual price ranges (USD) per service
+    PRICE_RANGES = {
+        ServiceType.WAREHOUSE: (4_000_000, 10_000_000),
+        ServiceType.CSO: (3_000_000, 8_000_000),
+        ServiceType.CSG: (2_000_000, 6_000_000),
+    }
+    
+    def _generate_pricing(self, services: List[str], model: str) -> Dict[str, float]:
+        """Annual price per offered service, plus a discounted bundle for consolidated bids"""
+        pricing = {service: round(random.uniform(*self.PRICE_RANGES[service]), -3) for service in services}
+        if model == ServiceModel.CONSOLIDATED:
+            pricing[BUNDLE] = round(sum(pricing.values()) * random.uniform(0.85, 0.95), -3)
+        return pricing
+    
     def _generate_evaluation_scores(self, quality_tier: int) -> Dict:
         """Generate evaluation scores based on tier"""
         base_scores = {
@@ -537,170 +600,205 @@ class TestDataGenerator:
                 stage.progress = random.randint(30, 70)
                 stage.start_date = datetime.now()
 
+# ========================================
+# PERSISTENCE
+# ========================================
+
+# Workspace of the RFP a new session opens; each RFP in the portfolio is one workspace
+STATE_WORKSPACE = os.environ.get("RFP_WORKSPACE", "default")
+# Lots in the procurement; each runs its own evaluation-to-implementation chain
+WORKFLOW_LOTS = int(os.environ.get("RFP_LOTS", "1"))
+
+@st.cache_resource
+def get_state_backend() -> StateBackend:
+    """Process-wide state backend shared by all sessions (RFP_STATE_URL)"""
+    return open_backend()
+
+def active_workspace() -> str:
+    """Workspace of the RFP this session has open"""
+    return st.session_state.get('active_rfp', STATE_WORKSPACE)
+
+def load_vendor_profile(workspace: str, vendor_id: str) -> VendorProfile:
+    """Lazily load one vendor's details from the backend"""
+    details = get_state_backend().load_vendor_details(workspace, vendor_id)
+    return VendorProfile.from_details(vendor_id, details)
+
+def new_vendor_store() -> VendorStore:
+    """Create an empty columnar vendor store for the active RFP"""
+    store = VendorStore(list(EVALUATION_CRITERIA.keys()), ServiceType.get_all())
+    store.materialize = partial(load_vendor_profile, active_workspace())
+    return store
+
+def sync_persisted_state():
+    """Load persisted state on session start, then pull only changed vendor rows"""
+    backend = get_state_backend()
+    if st.session_state.vendors is None:
+        st.session_state.vendors = new_vendor_store()
+        st.session_state.vendor_seq = 0
+        documents = backend.load_documents(active_workspace())
+        if documents:
+            st.session_state.rfp_documents = documents
+        st.session_state.documents_fingerprint = _documents_fingerprint(st.session_state.rfp_documents)
+    
+    records, seq = backend.load_vendor_summaries(active_workspace(), st.session_state.vendor_seq)
+    if records:
+        st.session_state.vendors.load_records(records)
+    st.session_state.vendor_seq = seq
+
+def restore_workflow_state(stages: Dict[str, 'WorkflowStage']):
+    """Apply persisted status/progress onto freshly built workflow stages"""
+    saved = get_state_backend().load_stages(active_workspace())
+    for stage_id, state in saved.items():
+        if stage_id in stages:
+            stages[stage_id].apply_state(state)
+
+def _documents_fingerprint(documents: Dict) -> Tuple:
+    return tuple(sorted((key, doc.get("name"), doc.get("size")) for key, doc in documents.items()))
+
+def persist_session_state():
+    """Flush changed vendors, stages and documents in batched writes"""
+    backend = get_state_backend()
+    workspace = active_workspace()
+    
+    store = st.session_state.get('vendors')
+    if store is not None:
+        changed, deleted = store.pop_changes()
+        if changed:
+            backend.save_vendors(workspace, [v.to_record() for v in changed])
+        if deleted:
+            backend.delete_vendors(workspace, deleted)
+    
+    stages = st.session_state.get('workflow_stages')
+    if stages:
+        dirty = [stage for stage in stages.values() if stage.dirty]
+        if dirty:
+            backend.save_stages(workspace, [stage.to_state() for stage in dirty])
+            for stage in dirty:
+                stage.dirty = False
+    
+    fingerprint = _documents_fingerprint(st.session_state.rfp_documents)
+    if fingerprint != st.session_state.get('documents_fingerprint'):
+        backend.save_documents(workspace, st.session_state.rfp_documents)
+        st.session_state.documents_fingerprint = fingerprint
+
+def clear_persisted_state():
+    get_state_backend().clear_workspace(active_workspace())
+
+# ========================================
+# PORTFOLIO
+# ========================================
+
+# Session keys that survive switching RFPs; everything else belongs to the RFP
+PORTFOLIO_SESSION_KEYS = ('session_key', 'main_tab', 'test_mode', 'aggregate_check', 'scoring_mode', 'full_run')
+
+def portfolio_rfps() -> Dict[str, Dict]:
+    """RFPs in the portfolio by workspace; the active one is registered on first sight"""
+    backend = get_state_backend()
+    rfps = {rfp['workspace']: rfp for rfp in backend.list_rfps()}
+    workspace = active_workspace()
+    if backend.persistent and workspace not in rfps:
+        created = datetime.now()
+        backend.save_rfp(workspace, DEFAULT_RFP_TITLE, created)
+        rfps[workspace] = {"workspace": workspace, "title": DEFAULT_RFP_TITLE, "created": created}
+    return rfps
+
+def switch_rfp(workspace: str):
+    """Open another RFP: flush this one, then drop its session state so the next run loads the new one"""
+    persist_session_state()
+    kept = {key: st.session_state[key] for key in PORTFOLIO_SESSION_KEYS if key in st.session_state}
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+    st.session_state.update(kept)
+    st.session_state.active_rfp = workspace
+    init_session_state()
+
+def create_rfp(title: str):
+    """Register a new RFP and open it"""
+    workspace = new_workspace(title)
+    get_state_backend().save_rfp(workspace, title, datetime.now())
+    switch_rfp(workspace)
+
+# ========================================
+# BACKGROUND JOBS
+# ========================================
+
+# Seconds between job status refreshes while this session has jobs running
+JOB_POLL_SECONDS = 1.0
+
+@st.cache_resource
+def get_job_manager() -> JobManager:
+    """Process-wide worker pool shared by all sessions (RFP_JOB_WORKERS)"""
+    return JobManager()
+
+def session_owner() -> str:
+    """Key identifying this browser session's jobs across reruns"""
+    if 'session_key' not in st.session_state:
+        st.session_state.session_key = uuid.uuid4().hex
+    return st.session_state.session_key
+
+def submit_job(name: str, fn, *args, apply=None, **kwargs) -> Job:
+    return get_job_manager().submit(session_owner(), name, fn, *args, apply=apply, **kwargs)
+
+def apply_finished_jobs():
+    """Apply results of this session's finished jobs on the script thread"""
+    for job in get_job_manager().apply_finished(session_owner()):
+        if job.status == DONE:
+            st.toast(f"✅ {job.name} complete")
+        elif job.status == CANCELLED:
+            st.toast(f"⏹️ {job.name} cancelled")
+        else:
+            st.toast(f"❌ {job.name} failed: {job.error}")
+
 class RFPManager:
     """Main RFP management system"""
     def __init__(self):
-        self.rfp_details = self._initialize_rfp()
+        # Shared, read-only header: the same mapping on every rerun and in every session
+        self.rfp_details = rfp_details(active_workspace(), st.session_state.rfp_created.date(),
+                                       st.session_state.get('rfp_title', DEFAULT_RFP_TITLE))
         
         # Initialize workflow stages in session state
         if st.session_state.workflow_stages is None:
-            st.session_state.workflow_stages = self._initialize_workflow()
+            stages = self._initialize_workflow()
+            restore_workflow_state(stages)
+            st.session_state.workflow_stages = stages
         
         self.evaluation_criteria = self._get_evaluation_criteria()
+        self.scoring_engine = SCORING_ENGINE
         self.test_generator = TestDataGenerator()
         
-    def _initialize_rfp(self):
-        """Initialize RFP details"""
-        return {
-            "rfp_id": f"RFP-{datetime.now().year}-{str(uuid.uuid4())[:8].upper()}",
-            "title": "Request for Proposal - Logistics & Warehouse Services",
-            "issue_date": datetime.now(),
-            "due_date": datetime.now() + timedelta(days=30),
-            "services_required": ServiceType.get_all(),
-            "service_models": [ServiceModel.STANDALONE, ServiceModel.CONSOLIDATED],
-            "budget_range": "$5M - $25M annually",
-            "contract_duration": "3 years with 2 optional 1-year extensions"
-        }
-    
     def _initialize_workflow(self) -> Dict[str, WorkflowStage]:
-        """Initialize RFP workflow stages"""
-        stages = {}
-        
-        workflow_definition = [
-            {
-                "id": "requirements",
-                "name": "Requirements Definition",
-                "desc": "Define service requirements and prepare RFP documentation",
-                "docs": ["Service Requirements", "Budget Approval", "Stakeholder Input"],
-                "deliverables": ["RFP Package", "Evaluation Criteria", "SOWs"],
-                "duration": "5 days"
-            },
-            {
-                "id": "rfp_publication",
-                "name": "RFP Publication",
-                "desc": "Publish RFP and invite vendors to participate",
-                "docs": ["RFP Package", "Vendor List", "Legal Terms"],
-                "deliverables": ["Published RFP", "Vendor Invitations"],
-                "duration": "2 days"
-            },
-            {
-                "id": "vendor_registration",
-                "name": "Vendor Registration",
-                "desc": "Vendors register and indicate service model preference",
-                "docs": ["Registration Forms", "NDA Agreements"],
-                "deliverables": ["Vendor List", "Service Model Selections"],
-                "duration": "7 days"
-            },
-            {
-                "id": "qa_clarifications",
-                "name": "Q&A and Clarifications",
-                "desc": "Address vendor questions and provide clarifications",
-                "docs": ["Vendor Questions", "Technical Specs"],
-                "deliverables": ["Q&A Responses", "RFP Addendums"],
-                "duration": "5 days"
-            },
-            {
-                "id": "proposal_submission",
-                "name": "Proposal Submission",
-                "desc": "Receive and validate vendor proposals",
-                "docs": ["Technical Proposals", "Pricing", "Compliance"],
-                "deliverables": ["Submission Log", "Completeness Check"],
-                "duration": "1 day"
-            },
-            {
-                "id": "initial_evaluation",
-                "name": "Initial Evaluation",
-                "desc": "Evaluate proposals against requirements",
-                "docs": ["Evaluation Matrix", "Scoring Sheets"],
-                "deliverables": ["Initial Scores", "Compliance Status"],
-                "duration": "7 days"
-            },
-            {
-                "id": "detailed_assessment",
-                "name": "Detailed Assessment",
-                "desc": "Deep dive into shortlisted vendors",
-                "docs": ["Technical Reviews", "Reference Checks"],
-                "deliverables": ["Evaluation Report", "Risk Assessment"],
-                "duration": "10 days"
-            },
-            {
-                "id": "vendor_selection",
-                "name": "Vendor Selection",
-                "desc": "Select vendors for each service model",
-                "docs": ["Final Evaluation", "Selection Criteria"],
-                "deliverables": ["Selected Vendors", "Service Assignments"],
-                "duration": "3 days"
-            },
-            {
-                "id": "negotiation",
-                "name": "Contract Negotiation",
-                "desc": "Negotiate terms with selected vendors",
-                "docs": ["Draft Contracts", "SLAs", "Pricing"],
-                "deliverables": ["Negotiated Terms", "Final Pricing"],
-                "duration": "7 days"
-            },
-            {
-                "id": "award",
-                "name": "Contract Award",
-                "desc": "Award contracts to selected vendors",
-                "docs": ["Final Contracts", "Legal Approval"],
-                "deliverables": ["Executed Contracts", "Implementation Schedule"],
-                "duration": "2 days"
-            },
-            {
-                "id": "implementation",
-                "name": "Implementation Planning",
-                "desc": "Plan service transition and implementation",
-                "docs": ["Transition Plan", "Resource Allocation"],
-                "deliverables": ["Kickoff Meeting", "Go-Live Schedule"],
-                "duration": "5 days"
-            }
-        ]
-        
-        for idx, stage_def in enumerate(workflow_definition, 1):
-            stages[stage_def["id"]] = WorkflowStage(
-                stage_def["id"],
-                idx,
-                stage_def["name"],
-                stage_def["desc"],
-                stage_def["docs"],
-                stage_def["deliverables"],
-                stage_def["duration"]
-            )
-        
-        return stages
+        """Per-session workflow stages over the shared stage templates"""
+        return new_workflow(workflow_template(WORKFLOW_LOTS))
     
     def _get_evaluation_criteria(self) -> Dict:
         """Define evaluation criteria"""
-        return {
-            "technical_capability": {"weight": 0.25, "description": "Technology and infrastructure"},
-            "operational_excellence": {"weight": 0.20, "description": "Service quality and reliability"},
-            "pricing_competitiveness": {"weight": 0.20, "description": "Cost structure and value"},
-            "compliance_security": {"weight": 0.15, "description": "Certifications and security"},
-            "experience_references": {"weight": 0.10, "description": "Past performance"},
-            "innovation_flexibility": {"weight": 0.10, "description": "Innovation capabilities"}
-        }
+        return EVALUATION_CRITERIA
     
     def get_workflow_progress(self) -> int:
-        """Calculate overall workflow progress"""
+        """Overall workflow progress from the incrementally maintained tracker"""
         stages = st.session_state.workflow_stages
         if not stages:
             return 0
         
-        total_stages = len(stages)
-        completed = sum(1 for s in stages.values() if s.status == "complete")
-        active_progress = sum(s.progress/100 for s in stages.values() if s.status == "active")
-        
-        return int(((completed + active_progress) / total_stages) * 100)
-    
-    def evaluate_vendor(self, vendor_id: str) -> Dict:
-        """Evaluate a vendor"""
-        if vendor_id not in st.session_state.vendors:
-            return {}
-        
-        vendor = st.session_state.vendors[vendor_id]
-        
-        # Generate scores
+        tracker = st.session_state.get('workflow_progress')
+        if tracker is None or tracker.stages is not stages:
+            tracker = WorkflowProgress(stages)
+            st.session_state.workflow_progress = tracker
+        tracker.check = st.session_state.get('aggregate_check', tracker.check)
+        return tracker.percent()
+    
+    def get_workflow_schedule(self) -> Schedule:
+        """Critical-path schedule of the workflow, updated incrementally as stages change"""
+        stages = st.session_state.workflow_stages
+        schedule = st.session_state.get('workflow_schedule')
+        if schedule is None or schedule.stages is not stages:
+            schedule = Schedule(stages)
+            st.session_state.workflow_schedule = schedule
+        return schedule
+    
+    def _generate_vendor_scores(self, vendor: VendorSnapshot, coverage: Optional[Any] = None,
+                                matcher: Optional[RequirementMatcher] = None) -> Dict:
+        """Generate criterion scores for a vendor, using requirement coverage when indexed"""
         base_score = 70
         if vendor.service_model == ServiceModel.CONSOLIDATED:
             base_score += 5
@@ -709,13 +807,255 @@ class RFPManager:
         for criterion in self.evaluation_criteria.keys():
             scores[criterion] = min(100, max(50, base_score + random.uniform(-10, 15)))
         
-        vendor.evaluate(scores)
+        if coverage is not None and matcher is not None:
+            services = vendor.services_offered
+            technical = matcher.vendor_coverage(
+                coverage, vendor.vendor_id, matcher.requirement_columns(services))
+            compliance = matcher.vendor_coverage(
+                coverage, vendor.vendor_id, matcher.requirement_columns(services, COMPLIANCE_KEYWORDS))
+            if technical is not None:
+                scores["technical_capability"] = 50 + 50 * technical
+            if compliance is not None:
+                scores["compliance_security"] = 50 + 50 * compliance
         return scores
+    
+    def _proposal_chunks(self, vendor_ids: List[str]) -> Dict[str, List[str]]:
+        """Ingested proposal text per vendor, for vendors that have any"""
+        vendor_chunks = {}
+        for vendor_id in vendor_ids:
+            documents = st.session_state.vendor_documents.get(vendor_id, {})
+            texts = [chunk["text"] for record in documents.values() for chunk in record.get("chunks", [])]
+            if texts:
+                vendor_chunks[vendor_id] = texts
+        return vendor_chunks
+    
+    def prepare_evaluation(self, vendor_ids: List[str]) -> Dict:
+        """Snapshot everything scoring reads so it can run off the script thread"""
+        store = st.session_state.vendors
+        matcher = get_requirement_matcher()
+        request = {
+            "vendors": [VendorSnapshot.of(store[vid]) for vid in vendor_ids if vid in store],
+            "matcher": matcher,
+            "coverage": matcher.coverage() if len(matcher) else None,
+            "ai_scorer": None,
+            "ai_chunks": {},
+        }
+        if st.session_state.get('scoring_mode') == SCORING_MODE_AI:
+            request["ai_scorer"] = get_ai_scorer()
+            request["ai_chunks"] = self._proposal_chunks(vendor_ids)
+        return request
+    
+    def run_evaluation(self, request: Dict, job: Optional[Job] = None) -> Dict:
+        """Score prepared vendors in one engine pass; does not touch session state"""
+        vendors = request["vendors"]
+        score_dicts = [self._generate_vendor_scores(v, request["coverage"], request["matcher"])
+                       for v in vendors]
+        
+        ai_stats = None
+        if request["ai_scorer"] is not None and request["ai_chunks"]:
+            scorer = request["ai_scorer"]
+            on_progress = None
+            if job is not None:
+                on_progress = lambda done, total: job.report(0.9 * done / total, f"AI scoring {done}/{total}")
+            ai_scores, stats = scorer.score_vendors(request["ai_chunks"], on_progress=on_progress)
+            ai_stats = stats.as_dict()
+            for vendor, scores in zip(vendors, score_dicts):
+                scores.update(ai_scores.get(vendor.vendor_id, {}))
+        
+        results = []
+        if score_dicts:
+            batch = self.scoring_engine.score_dicts(score_dicts)
+            for row, (vendor, scores) in enumerate(zip(vendors, score_dicts)):
+                results.append((vendor.vendor_id, scores, float(batch.overall[row]),
+                                batch.strengths_for(row), batch.weaknesses_for(row)))
+        return {"results": results, "ai_stats": ai_stats}
+    
+    def apply_evaluation_results(self, outcome: Dict) -> Dict[str, Dict]:
+        """Record scored results on vendors that are still registered"""
+        store = st.session_state.vendors
+        applied = {}
+        for vendor_id, scores, overall, strengths, weaknesses in outcome["results"]:
+            if vendor_id in store:
+                store[vendor_id].apply_evaluation(scores, overall, strengths, weaknesses)
+                applied[vendor_id] = scores
+        if outcome["ai_stats"]:
+            st.session_state.ai_scoring_stats = outcome["ai_stats"]
+        return applied
+    
+    def evaluate_vendor(self, vendor_id: str) -> Dict:
+        """Evaluate a vendor"""
+        results = self.evaluate_vendors([vendor_id])
+        return results.get(vendor_id, {})
+    
+    def evaluate_vendors(self, vendor_ids: List[str]) -> Dict[str, Dict]:
+        """Evaluate many vendors with a single scoring engine pass"""
+        request = self.prepare_evaluation(vendor_ids)
+        return self.apply_evaluation_results(self.run_evaluation(request))
+    
+    def submit_evaluation(self, vendor_ids: List[str], name: str) -> Job:
+        """Evaluate vendors as a background job"""
+        request = self.prepare_evaluation(vendor_ids)
+        return submit_job(name, lambda job: self.run_evaluation(request, job),
+                          apply=self.apply_evaluation_results)
+    
+    def optimize_award(self) -> AwardResult:
+        """Best-value award across all services for evaluated vendors within the RFP budget"""
+        store = st.session_state.vendors
+        _, budget = parse_budget_range(self.rfp_details['budget_range'])
+        bids = [Bid(v.vendor_id, v.name, v.service_model, v.overall_score, v.pricing or {})
+                for v in store.profiles(store.rows(status="Evaluated"))]
+        return optimize_award(bids, ServiceType.get_all(), budget)
+
+# ========================================
+# PARTIAL RERUNS
+# ========================================
+
+def finish_fragment_run():
+    """Fragment reruns skip main(): flush state and hand new jobs to the sidebar poller"""
+    persist_session_state()
+    if st.session_state.get('polling_jobs'):
+        return
+    if any(not job.applied for job in get_job_manager().jobs_for(session_owner())):
+        st.rerun()
+
+def keyed_fragment(key: str):
+    """st.fragment that widget callbacks can rerun on its own with st.rerun(key)"""
+    def decorate(fn):
+        @wraps(fn)
+        def run(*args, **kwargs):
+            fn(*args, **kwargs)
+            if not st.session_state.get('full_run', True):
+                finish_fragment_run()
+        return st.fragment(run, key=key)
+    return decorate
 
 # ========================================
 # UI COMPONENTS
 # ========================================
 
+def render_award_recommendation(manager: RFPManager):
+    """Optimized award (consolidated vs split) computed on demand"""
+    import pandas as pd
+    
+    st.subheader("⚖️ Award Recommendation")
+    store = st.session_state.vendors
+    stamp = store.status_version("Evaluated")
+    if st.button("Optimize Award", key="optimize_award"):
+        st.session_state.award_result = (stamp, manager.optimize_award())
+    cached = st.session_state.get('award_result')
+    if cached is None:
+        st.caption(f"Finds the highest-scoring way to cover every service within "
+                   f"{manager.rfp_details['budget_range']}.")
+        return
+    computed_at, result = cached
+    if computed_at != stamp:
+        st.caption("Evaluations changed since this award was computed.")
+    
+    award = result.award
+    if award is None:
+        st.warning("No combination of priced bids covers every service within the budget.")
+    else:
+        kind = "Consolidated award" if award.consolidated else "Split award"
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Recommendation", kind)
+        col2.metric("Annual Cost", f"${award.cost / 1e6:,.2f}M")
+        col3.metric("Avg Score", f"{award.score:.1f}")
+        st.dataframe(pd.DataFrame([
+            {"Service": service, "Vendor": store[vendor_id].name, "Vendor ID": vendor_id}
+            for service, vendor_id in award.assignments.items()
+        ]), hide_index=True, width="stretch")
+        backend = get_state_backend()
+        if backend.persistent and st.button("Record Award", key="record_award", disabled=computed_at != stamp,
+                                            help="Counts toward vendor win rates in the portfolio"):
+            backend.save_award(active_workspace(), {service: (vendor_id, store[vendor_id].name)
+                                                    for service, vendor_id in award.assignments.items()})
+            st.toast("🏆 Award recorded")
+        other = result.best_split if award.consolidated else result.best_consolidated
+        if other is not None:
+            st.caption(f"Best {'split' if award.consolidated else 'consolidated'} alternative: "
+                       f"${other.cost / 1e6:,.2f}M at avg score {other.score:.1f}")
+    st.caption(f"{result.bids} bids · frontier {result.frontier} · "
+               f"solved in {result.solve_seconds * 1000:.1f} ms")
+
+def shortlist(store: VendorStore, top_k: int, tie_break: str = "evaluated_first",
+              required_certifications: List[str] = ()) -> Tuple[List[VendorProfile], Dict[str, List[VendorProfile]]]:
+    """Selection tab rankings: top consolidated vendors and top standalone vendors per service"""
+    select = partial(store.select_top, tie_break=tie_break, required_certifications=required_certifications)
+    consolidated = select(top_k, service_model=ServiceModel.CONSOLIDATED)
+    by_service = {service: select(top_k, service_model=ServiceModel.STANDALONE, service=service)
+                  for service in ServiceType.get_all()}
+    return consolidated, by_service
+
+@keyed_fragment("selection_tab")
+def render_vendor_selection(manager: RFPManager):
+    """Selection tab: shortlists by service model plus the award recommendation"""
+    st.header("🎯 Vendor Selection")
+    store = st.session_state.vendors
+    if not store.count(status="Evaluated"):
+        st.info("No vendors evaluated yet. Complete evaluation before selection.")
+        return
+    st.info("Select vendors for each service based on evaluation scores")
+    
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        top_k = st.number_input("Vendors per list", min_value=1, max_value=25, value=3,
+                                key="selection_top_k")
+    with col2:
+        tie_break = st.selectbox("Break ties by", list(SELECTION_TIE_BREAKS),
+                                 key="selection_tie_break")
+    with col3:
+        required = st.multiselect("Required certifications", CERTIFICATIONS,
+                                  key="selection_certifications")
+    top_consolidated, top_by_service = shortlist(store, top_k, SELECTION_TIE_BREAKS[tie_break], required)
+    
+    # Show top vendors by service model
+    if top_consolidated:
+        st.subheader("Top Consolidated Vendors")
+        for vendor in top_consolidated:
+            st.write(f"• **{vendor.name}**: Score {vendor.overall_score:.1f}/100")
+    
+    st.subheader("Top Standalone Vendors by Service")
+    for service, service_top in top_by_service.items():
+        if service_top:
+            st.write(f"**{service}:**")
+            for vendor in service_top:
+                st.write(f"• {vendor.name}: Score {vendor.overall_score:.1f}/100")
+    
+    render_award_recommendation(manager)
+
+def _render_job_list(jobs: List[Job]):
+    manager = get_job_manager()
+    for job in reversed(jobs[-5:]):
+        if job.active:
+            st.progress(job.progress, text=f"{job.name} · {job.message or job.status}")
+            st.button("Cancel", key=f"cancel_{job.job_id}", on_click=manager.cancel, args=(job.job_id,))
+        elif job.status == DONE:
+            st.caption(f"✅ {job.name} ({job.elapsed:.1f}s)")
+        elif job.status == CANCELLED:
+            st.caption(f"⏹️ {job.name} cancelled")
+        else:
+            st.caption(f"❌ {job.name}: {job.error}")
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def _render_running_jobs():
+    """Polls job status without rerunning the whole app until a job finishes"""
+    jobs = get_job_manager().jobs_for(session_owner())
+    if any(job.status in FINISHED and not job.applied for job in jobs):
+        st.rerun()
+    _render_job_list(jobs)
+
+def render_job_status():
+    """Sidebar panel for this session's background jobs"""
+    jobs = get_job_manager().jobs_for(session_owner())
+    st.session_state.polling_jobs = any(job.active for job in jobs)
+    if not jobs:
+        return
+    st.markdown("### ⏳ Background Jobs")
+    if st.session_state.polling_jobs:
+        _render_running_jobs()
+    else:
+        _render_job_list(jobs)
+
 def render_header():
     """Render application header"""
     st.markdown("""
@@ -726,6 +1066,7 @@ def render_header():
     </div>
     """, unsafe_allow_html=True)
 
+@keyed_fragment("test_controls")
 def render_test_controls(manager: RFPManager):
     """Render test data generation controls"""
     st.header("🧪 Test Data Generator")
@@ -741,7 +1082,7 @@ def render_test_controls(manager: RFPManager):
     
     with col1:
         st.subheader("📄 RFP Documents")
-        if st.button("Generate RFP Documents", type="primary", use_container_width=True):
+        if st.button("Generate RFP Documents", type="primary", width="stretch"):
             docs = manager.test_generator.generate_sample_rfp_documents()
             st.session_state.rfp_documents.update(docs)
             st.success(f"✅ Generated {len(docs)} RFP documents")
@@ -755,29 +1096,32 @@ def render_test_controls(manager: RFPManager):
     with col2:
         st.subheader("👥 Vendors")
         vendor_count = st.number_input("Number of vendors", min_value=3, max_value=10, value=8)
-        if st.button("Generate Vendors", type="primary", use_container_width=True):
+        if st.button("Generate Vendors", type="primary", width="stretch"):
             vendors = manager.test_generator.generate_sample_vendors(vendor_count)
             for vendor in vendors:
                 st.session_state.vendors[vendor.vendor_id] = vendor
             st.success(f"✅ Generated {len(vendors)} vendors")
             st.rerun()
         
+        render_scale_generator(manager)
+        
         if st.session_state.vendors:
-            st.success(f"✓ {len(st.session_state.vendors)} vendors registered")
-            consolidated = sum(1 for v in st.session_state.vendors.values() 
-                             if v.service_model == ServiceModel.CONSOLIDATED)
+            st.success(f"✓ {len(st.session_state.vendors):,} vendors registered")
+            consolidated = st.session_state.vendors.count(service_model=ServiceModel.CONSOLIDATED)
             st.caption(f"• {consolidated} Consolidated")
             st.caption(f"• {len(st.session_state.vendors) - consolidated} Standalone")
     
     with col3:
         st.subheader("⚙️ Workflow Progress")
+        stage_names = [stage.name for stage in st.session_state.workflow_stages.values()]
         target_stage = st.selectbox(
             "Progress to stage",
-            options=range(1, 12),
-            format_func=lambda x: f"Stage {x}: {list(st.session_state.workflow_stages.values())[x-1].name}"
+            options=range(1, len(stage_names) + 1),
+            format_func=lambda x: f"Stage {x}: {stage_names[x-1]}",
+            key="test_target_stage"
         )
         
-        if st.button("Set Workflow Progress", type="primary", use_container_width=True):
+        if st.button("Set Workflow Progress", type="primary", width="stretch"):
             manager.test_generator.progress_workflow_to_stage(
                 st.session_state.workflow_stages, 
                 target_stage
@@ -795,78 +1139,620 @@ def render_test_controls(manager: RFPManager):
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        if st.button("📝 Initial Setup", use_container_width=True):
+        if st.button("📝 Initial Setup", width="stretch"):
             # Generate everything at stage 1
-            docs = manager.test_generator.generate_sample_rfp_documents()
-            st.session_state.rfp_documents.update(docs)
-            vendors = manager.test_generator.generate_sample_vendors(8)
-            for vendor in vendors:
-                st.session_state.vendors[vendor.vendor_id] = vendor
-            manager.test_generator.progress_workflow_to_stage(st.session_state.workflow_stages, 1)
-            st.success("✅ Initial setup complete")
-            st.rerun()
+            submit_scenario(manager, "Initial setup", 1, fresh=True)
     
     with col2:
-        if st.button("📊 Mid-Evaluation", use_container_width=True):
+        if st.button("📊 Mid-Evaluation", width="stretch"):
             # Setup at evaluation stage
-            if not st.session_state.rfp_documents:
-                docs = manager.test_generator.generate_sample_rfp_documents()
-                st.session_state.rfp_documents.update(docs)
-            if not st.session_state.vendors:
-                vendors = manager.test_generator.generate_sample_vendors(8)
-                for vendor in vendors:
-                    st.session_state.vendors[vendor.vendor_id] = vendor
-            manager.test_generator.progress_workflow_to_stage(st.session_state.workflow_stages, 6)
-            st.success("✅ Setup at evaluation stage")
-            st.rerun()
+            submit_scenario(manager, "Mid-evaluation setup", 6)
     
     with col3:
-        if st.button("🎯 Selection Ready", use_container_width=True):
-            # Setup ready for selection
-            if not st.session_state.rfp_documents:
-                docs = manager.test_generator.generate_sample_rfp_documents()
-                st.session_state.rfp_documents.update(docs)
-            if not st.session_state.vendors:
-                vendors = manager.test_generator.generate_sample_vendors(8)
-                for vendor in vendors:
-                    st.session_state.vendors[vendor.vendor_id] = vendor
-            # Evaluate all vendors
-            for vendor in st.session_state.vendors.values():
-                if vendor.status == "Submitted":
-                    manager.evaluate_vendor(vendor.vendor_id)
-            manager.test_generator.progress_workflow_to_stage(st.session_state.workflow_stages, 8)
-            st.success("✅ Ready for vendor selection")
-            st.rerun()
+        if st.button("🎯 Selection Ready", width="stretch"):
+            # Setup ready for selection, evaluating all submitted vendors
+            submit_scenario(manager, "Selection-ready setup", 8, evaluate=True)
     
     with col4:
-        if st.button("🏁 Near Complete", use_container_width=True):
+        if st.button("🏁 Near Complete", width="stretch"):
             # Setup near completion
-            if not st.session_state.rfp_documents:
-                docs = manager.test_generator.generate_sample_rfp_documents()
-                st.session_state.rfp_documents.update(docs)
-            if not st.session_state.vendors:
-                vendors = manager.test_generator.generate_sample_vendors(8)
-                for vendor in vendors:
-                    st.session_state.vendors[vendor.vendor_id] = vendor
-            manager.test_generator.progress_workflow_to_stage(st.session_state.workflow_stages, 10)
-            st.success("✅ Near completion setup")
-            st.rerun()
+            submit_scenario(manager, "Near-complete setup", 10)
     
     # Clear data option
     st.markdown("---")
-    if st.button("🗑️ Clear All Test Data", use_container_width=True):
-        st.session_state.vendors = {}
+    if st.button("🗑️ Clear All Test Data", width="stretch"):
+        get_job_manager().forget(session_owner())
+        clear_persisted_state()
+        st.session_state.vendors = new_vendor_store()
         st.session_state.rfp_documents = {}
+        st.session_state.vendor_documents = {}
+        st.session_state.pop('requirement_matcher', None)
+        st.session_state.pop('figure_cache', None)
+        st.session_state.pop('award_result', None)
+        st.session_state.pop('sensitivity_result', None)
+        st.session_state.pop('vendor_import_report', None)
+        _discard_export()
         st.session_state.workflow_stages = manager._initialize_workflow()
         st.session_state.test_data_generated = False
         st.success("✅ All test data cleared")
         st.rerun()
 
-def render_workflow_management(manager: RFPManager):
-    """Render workflow management"""
-    st.header("⚙️ Workflow Management")
+def _scenario_job(job: Job, manager: RFPManager, need_docs: bool, need_vendors: bool,
+                  evaluation: Optional[Dict]) -> Dict:
+    """Generate scenario data off the script thread"""
+    generator = manager.test_generator
+    result = {"documents": {}, "vendors": [], "evaluation": None}
+    if need_docs:
+        job.report(0.1, "Generating RFP documents")
+        result["documents"] = generator.generate_sample_rfp_documents()
+    if need_vendors:
+        job.report(0.3, "Generating vendors")
+        result["vendors"] = generator.generate_sample_vendors(8)
+    if evaluation is not None:
+        job.report(0.5, "Evaluating submitted vendors")
+        if need_vendors:
+            evaluation["vendors"] = [VendorSnapshot.of(v) for v in result["vendors"]
+                                     if v.status == "Submitted"]
+        result["evaluation"] = manager.run_evaluation(evaluation, job)
+    return result
+
+def _apply_scenario(manager: RFPManager, target_stage: int, result: Dict):
+    st.session_state.rfp_documents.update(result["documents"])
+    for vendor in result["vendors"]:
+        st.session_state.vendors[vendor.vendor_id] = vendor
+    if result["evaluation"] is not None:
+        manager.apply_evaluation_results(result["evaluation"])
+    manager.test_generator.progress_workflow_to_stage(st.session_state.workflow_stages, target_stage)
+
+def submit_scenario(manager: RFPManager, name: str, target_stage: int,
+                    fresh: bool = False, evaluate: bool = False) -> Job:
+    """Queue a quick-setup scenario; missing documents and vendors are generated"""
+    store = st.session_state.vendors
+    need_docs = fresh or not st.session_state.rfp_documents
+    need_vendors = fresh or not store
+    evaluation = None
+    if evaluate:
+        submitted = [] if need_vendors else store.ids(store.rows(status="Submitted"))
+        evaluation = manager.prepare_evaluation(submitted)
+    return submit_job(name, _scenario_job, manager, need_docs, need_vendors, evaluation,
+                      apply=partial(_apply_scenario, manager, target_stage))
+
+def scale_vendors_job(job: Job, population: SyntheticVendors, backend: StateBackend, workspace: str,
+                      proposals: int, cache: ExtractionCache) -> Dict:
+    """Generate a synthetic population; persistent backends receive it block by block"""
+    blocks: List[VendorBlock] = []
+    share = 0.8 if proposals else 1.0
+    
+    def on_progress(fraction):
+        job.report(fraction * share, f"{int(fraction * len(population)):,} vendors")
+    
+    if backend.persistent:
+        population.save_to(partial(backend.save_vendors, workspace), on_progress)
+    else:
+        for block in population.iter_blocks():
+            blocks.append(block)
+            on_progress((block.start + len(block)) / len(population))
+    
+    documents: Dict[str, Dict] = {}
+    if proposals:
+        directory = os.path.join(SPOOL_DIR, f"synthetic_{population.seed}")
+        written = population.write_proposals(directory, proposals)
+        for done, (vendor_id, path, filename) in enumerate(written):
+            job.report(share + (1 - share) * done / len(written), f"Extracting {filename}")
+            documents[vendor_id] = ingest_file(path, filename, cache=cache)
+    return {"blocks": blocks, "documents": documents}
+
+def _synthetic_materializer(population: SyntheticVendors, fallback):
+    """Profiles for session-only synthetic vendors are rebuilt from the seed on demand"""
+    def materialize(vendor_id: str) -> VendorProfile:
+        details = population.details(vendor_id)
+        if details is None:
+            return fallback(vendor_id)
+        return VendorProfile.from_details(vendor_id, details)
+    return materialize
+
+def _apply_scale_vendors(population: SyntheticVendors, outcome: Dict):
+    store = st.session_state.vendors
+    if outcome["blocks"]:
+        for block in outcome["blocks"]:
+            population.extend_store(store, block)
+        store.materialize = _synthetic_materializer(population, store.materialize)
+    else:
+        sync_persisted_state()
+    for vendor_id, record in outcome["documents"].items():
+        if vendor_id in store:
+            st.session_state.vendor_documents.setdefault(vendor_id, {})["technical"] = record
+            store[vendor_id].documents["technical"] = record["name"]
+            store.mark_dirty(vendor_id)
+
+def render_scale_generator(manager: RFPManager):
+    """Scale mode: 10k-1M seeded synthetic vendors generated as a background job"""
+    st.write("**Scale mode**")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        count = st.select_slider("Vendors", TestDataGenerator.SCALE_SIZES, value=10_000,
+                                 format_func=lambda n: f"{n:,}", key="scale_vendor_count")
+    with col2:
+        seed = st.number_input("Seed", min_value=0, value=0, step=1, key="scale_seed")
+    with col3:
+        proposals = st.number_input("Proposal PDFs", min_value=0, max_value=500, value=0, step=10,
+                                    key="scale_proposals")
+    if not st.button("Generate at Scale", width="stretch", key="generate_scale"):
+        return
+    population = manager.test_generator.synthetic_population(count, int(seed))
+    backend = get_state_backend()
+    if not backend.persistent and population.vendor_id(0) in st.session_state.vendors:
+        st.warning(f"Seed {seed} is already loaded; pick another seed to add more vendors.")
+        return
+    submit_job(f"Generate {count:,} vendors (seed {seed})", scale_vendors_job, population, backend,
+               active_workspace(), int(proposals), get_extraction_cache(),
+               apply=partial(_apply_scale_vendors, population))
+    st.toast(f"Generating {count:,} vendors")
+
+@st.cache_resource
+def get_extraction_cache() -> ExtractionCache:
+    """Process-wide extraction cache (RFP_CACHE_DIR, RFP_CACHE_MAX_MB)"""
+    return ExtractionCache()
+
+def render_cache_stats():
+    stats = get_extraction_cache().stats()
+    st.caption(
+        f"Extraction cache: {stats['hits']} hits / {stats['misses']} misses "
+        f"({stats['hit_rate']:.0%}) · {stats['entries']} entries · "
+        f"{stats['bytes'] / 1e6:.1f} of {stats['max_bytes'] / 1e6:.0f} MB"
+    )
+
+SCORING_MODE_SIMULATED = "Simulated"
+SCORING_MODE_AI = "AI-assisted"
+
+@st.cache_resource
+def get_ai_scorer() -> AIScorer:
+    """Process-wide scorer so rate limits and the response cache are shared"""
+    return AIScorer(EVALUATION_CRITERIA)
+
+def render_ai_scoring_stats():
+    stats = st.session_state.get('ai_scoring_stats')
+    if stats:
+        st.caption(
+            f"Last AI scoring run: {stats['vendors']} vendors in {stats['seconds']:.1f}s "
+            f"({stats['vendors_per_min'] or 0:.0f} vendors/min) · {stats['requests']} requests, "
+            f"{stats['retries']} retries, {stats['failures']} failed · "
+            f"cache hit rate {stats['hit_rate']:.0%}"
+        )
+
+def get_requirement_matcher() -> RequirementMatcher:
+    """Session requirement index, brought up to date with ingested proposals"""
+    matcher = st.session_state.get('requirement_matcher')
+    if matcher is None:
+        matcher = RequirementMatcher(SOW_REQUIREMENTS)
+        st.session_state.requirement_matcher = matcher
+    matcher.sync(st.session_state.vendor_documents)
+    return matcher
+
+def get_figure_cache() -> FigureCache:
+    """Session cache of Evaluation tab figures, keyed on the evaluated-vendor version"""
+    cache = st.session_state.get('figure_cache')
+    if cache is None:
+        cache = FigureCache()
+        st.session_state.figure_cache = cache
+    return cache
+
+@st.fragment
+def render_evaluation_charts():
+    """Evaluation chart views; switching views reruns only this fragment"""
+    view = st.radio("Chart", CHART_VIEWS, horizontal=True, key="evaluation_chart_view")
+    fig = get_figure_cache().evaluation_figure(st.session_state.vendors, view, CRITERIA_WEIGHTS)
+    st.plotly_chart(fig, width="stretch")
+
+# Top evaluated vendors included in sensitivity analysis
+SENSITIVITY_VENDORS = 50
+SENSITIVITY_DRAWS = [10_000, 100_000, 1_000_000, 5_000_000]
+
+def _sensitivity_job(job: Job, ids: List[str], names: List[str], scores, weights: Dict[str, float],
+                     draws: int, noise: float, workers: int):
+    label = f"{draws:,} draws"
+    return analyze_sensitivity(ids, names, scores, weights, list(weights), draws=draws,
+                               noise=noise, workers=workers,
+                               progress=lambda done: job.report(done, label))
+
+def _apply_sensitivity(result):
+    st.session_state.sensitivity_result = result
+
+def render_sensitivity_analysis():
+    """What-if weights with an instant re-rank, plus Monte Carlo rank stability as a job"""
+    st.subheader("🎲 Score Sensitivity")
+    store = st.session_state.vendors
+    rows, _ = store.page(0, SENSITIVITY_VENDORS, status="Evaluated")
+    if len(rows) < 2:
+        st.caption("Evaluate at least two vendors to analyze ranking sensitivity.")
+        return
+    criteria = store.criteria
     
-    # Overall progress
+    col1, col2 = st.columns(2)
+    with col1:
+        criterion = st.selectbox("What if this criterion's weight were…", criteria,
+                                 format_func=criterion_label, key="sensitivity_criterion")
+    with col2:
+        weight = st.slider("Weight (%)", 0, 100, int(round(CRITERIA_WEIGHTS[criterion] * 100)),
+                           key=f"sensitivity_weight_{criterion}")
+    weights = reweight(CRITERIA_WEIGHTS, criterion, weight / 100)
+    
+    names = [store.get_field(row, "name") for row in rows]
+    scores = store.score_matrix(rows)
+    filled = np.where(np.isnan(scores), 0.0, scores)
+    base = ranks_of(filled @ np.array([CRITERIA_WEIGHTS[c] for c in criteria])) + 1
+    scenario = ranks_of(filled @ np.array([weights[c] for c in criteria])) + 1
+    moved = int((base != scenario).sum())
+    order = np.argsort(scenario)[:5]
+    st.caption(f"At {weight}% {criterion_label(criterion).lower()}, {moved} of {len(rows)} "
+               f"top vendors change rank. New top {len(order)}: " +
+               ", ".join(f"{names[i]} (#{base[i]}→#{scenario[i]})" for i in order))
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        draws = st.select_slider("Simulations", SENSITIVITY_DRAWS, value=100_000,
+                                 format_func=lambda d: f"{d:,}", key="sensitivity_draws")
+    with col2:
+        noise = st.slider("Score noise (± points)", 0.0, 10.0, DEFAULT_NOISE, 0.5,
+                          key="sensitivity_noise")
+    with col3:
+        parallel = st.checkbox(f"Use {SENSITIVITY_WORKERS} processes", value=draws >= 1_000_000,
+                               disabled=SENSITIVITY_WORKERS < 2, key="sensitivity_parallel")
+    if st.button("Run Sensitivity Analysis", key="run_sensitivity"):
+        submit_job(f"Sensitivity ({draws:,} draws)", _sensitivity_job, store.ids(rows), names,
+                   scores, weights, draws, noise, SENSITIVITY_WORKERS if parallel else 1,
+                   apply=_apply_sensitivity)
+        st.toast("Sensitivity analysis queued")
+    
+    result = st.session_state.get('sensitivity_result')
+    if result is not None:
+        st.dataframe(result.summary(), hide_index=True, width="stretch", column_config={
+            "p_first": st.column_config.ProgressColumn("P(#1)", min_value=0, max_value=1, format="%.2f"),
+            f"p_top_{result.top_k}": st.column_config.ProgressColumn(
+                f"P(top {result.top_k})", min_value=0, max_value=1, format="%.2f"),
+            "p_keeps_rank": st.column_config.NumberColumn("P(keeps rank)", format="%.2f"),
+            "mean_rank": st.column_config.NumberColumn("Mean rank", format="%.1f"),
+            "rank_90": "90% rank range",
+        })
+        weights_text = ", ".join(f"{criterion_label(c)} {w:.0%}" for c, w in result.weights.items())
+        st.caption(f"{result.draws:,} simulations in {result.seconds:.1f}s around {weights_text}")
+
+# Larger packages are left on the server: the download button buffers the whole file
+EXPORT_DOWNLOAD_LIMIT_MB = int(os.environ.get("RFP_EXPORT_DOWNLOAD_LIMIT_MB", "512"))
+
+def export_package_job(job: Job, snapshot: EvaluationSnapshot, rfp_documents: Dict,
+                       vendor_documents: Dict, title: str) -> ExportResult:
+    return export_package(export_path(), snapshot, rfp_documents, vendor_documents, title,
+                          progress=job.report)
+
+def _discard_export():
+    previous: Optional[ExportResult] = st.session_state.pop('export_result', None)
+    if previous is not None and os.path.exists(previous.path):
+        os.remove(previous.path)
+
+def _apply_export(result: ExportResult):
+    _discard_export()
+    st.session_state.export_result = result
+
+def _read_export(path: str) -> bytes:
+    with open(path, "rb") as handle:
+        return handle.read()
+
+def render_evaluation_export(manager: RFPManager):
+    """Evaluation workbook plus RFP and proposal documents as one ZIP, built as a job"""
+    st.subheader("📦 Evaluation Package")
+    store = st.session_state.vendors
+    if st.button("Build Evaluation Package", key="export_package"):
+        snapshot = EvaluationSnapshot.from_store(store, CRITERIA_WEIGHTS)
+        # Copy the document maps so uploads during the export don't race the job
+        vendor_documents = {vid: dict(docs) for vid, docs in st.session_state.vendor_documents.items()}
+        submit_job(f"Export package ({len(snapshot):,} vendors)", export_package_job, snapshot,
+                   dict(st.session_state.rfp_documents), vendor_documents,
+                   manager.rfp_details['title'], apply=_apply_export)
+        st.toast("Building evaluation package")
+    
+    result: Optional[ExportResult] = st.session_state.get('export_result')
+    if result is None or not os.path.exists(result.path):
+        st.caption("Workbook with rankings, weights and per-service scores, bundled with the "
+                   "RFP documents and vendor proposals.")
+        return
+    size_mb = result.size / 1e6
+    st.caption(f"Built {result.created:%Y-%m-%d %H:%M} · {result.vendors:,} vendors · "
+               f"{result.files:,} files · {size_mb:,.1f} MB in {result.seconds:.1f}s")
+    if result.missing:
+        st.warning(f"{len(result.missing)} attachments were no longer on disk and are listed "
+                   f"as missing in manifest.json")
+    if size_mb > EXPORT_DOWNLOAD_LIMIT_MB:
+        st.info(f"Package is larger than {EXPORT_DOWNLOAD_LIMIT_MB} MB; collect it from the server "
+                f"at `{result.path}`")
+        return
+    # Deferred: the archive is only read from disk when the button is clicked
+    st.download_button("⬇️ Download Package", partial(_read_export, result.path),
+                       file_name=os.path.basename(result.path), mime="application/zip",
+                       key="download_package")
+
+def render_requirement_coverage():
+    """Per-requirement coverage of every vendor with indexed proposal text"""
+    matcher = get_requirement_matcher()
+    if not len(matcher):
+        return
+    st.subheader("📋 Requirement Coverage")
+    store = st.session_state.vendors
+    coverage = matcher.coverage()
+    rows, vendor_ids = [], []
+    for row, vendor_id in enumerate(matcher.vendor_ids):
+        if vendor_id in store:
+            rows.append(row)
+            vendor_ids.append(vendor_id)
+    import pandas as pd
+    
+    frame = pd.DataFrame(
+        coverage[rows] * 100,
+        index=[store[vid].name for vid in vendor_ids],
+        columns=pd.MultiIndex.from_tuples([(r.service, r.text) for r in matcher.requirements]),
+    )
+    service = st.selectbox("Service", ServiceType.get_all(), key="coverage_service")
+    st.dataframe(frame[service].style.format("{:.0f}%").background_gradient(cmap="RdYlGn", vmin=0, vmax=100),
+                 width="stretch")
+
+# Vendors offered in the proposal upload picker per search
+VENDOR_SEARCH_LIMIT = 50
+
+def _document_key(filename: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", filename.lower()).strip("_")
+
+def ingest_files_job(job: Job, files: List[Tuple[str, str]], cache: ExtractionCache) -> Dict[str, Dict]:
+    """Extract spooled (path, name) files one after another"""
+    records = {}
+    for done, (path, name) in enumerate(files):
+        job.report(done / len(files), f"Extracting {name}")
+        records[name] = ingest_file(path, name, cache=cache)
+    return records
+
+def _apply_rfp_documents(records: Dict[str, Dict]):
+    for name, record in records.items():
+        st.session_state.rfp_documents[_document_key(name)] = record
+
+def _apply_proposal_documents(vendor_id: str, records: Dict[str, Dict]):
+    store = st.session_state.vendors
+    if vendor_id not in store:
+        return
+    vendor = store[vendor_id]
+    vendor_docs = st.session_state.vendor_documents.setdefault(vendor_id, {})
+    for name, record in records.items():
+        doc_key = _document_key(name)
+        vendor_docs[doc_key] = record
+        vendor.documents[doc_key] = name
+    store.mark_dirty(vendor_id)
+
+def render_document_upload(manager: RFPManager):
+    """Render RFP and vendor proposal upload"""
+    with st.expander("📁 Document Upload"):
+        render_cache_stats()
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.write("**RFP Package / SOWs**")
+            rfp_files = st.file_uploader(
+                "Upload RFP documents", type=["pdf", "docx", "xlsx", "txt"],
+                accept_multiple_files=True, key="rfp_upload"
+            )
+            if rfp_files and st.button("Ingest RFP Documents", key="ingest_rfp"):
+                files = [(spool_upload(uploaded, uploaded.name), uploaded.name) for uploaded in rfp_files]
+                submit_job(f"Ingest {len(files)} RFP documents", ingest_files_job, files,
+                           get_extraction_cache(), apply=_apply_rfp_documents)
+        
+        with col2:
+            st.write("**Vendor Proposals**")
+            store = st.session_state.vendors
+            if not store:
+                st.caption("Register vendors before uploading proposals")
+                return
+            # Search first so the selectbox only carries a handful of options
+            query = st.text_input("Find vendor", key="proposal_vendor_search",
+                                  placeholder="Name or vendor ID")
+            candidates = store.ids(store.search(query, limit=VENDOR_SEARCH_LIMIT))
+            if not candidates:
+                st.caption("No vendor matches that search")
+                return
+            vendor_id = st.selectbox(
+                "Vendor", options=candidates,
+                format_func=lambda vid: f"{store[vid].name} ({vid})", key="proposal_vendor"
+            )
+            proposal_files = st.file_uploader(
+                "Upload proposal files", type=["pdf", "docx", "xlsx", "txt"],
+                accept_multiple_files=True, key="proposal_upload"
+            )
+            if proposal_files and st.button("Ingest Proposal", key="ingest_proposal"):
+                files = [(spool_upload(uploaded, uploaded.name), uploaded.name) for uploaded in proposal_files]
+                submit_job(f"Ingest {len(files)} files for {store[vendor_id].name}", ingest_files_job,
+                           files, get_extraction_cache(), apply=partial(_apply_proposal_documents, vendor_id))
+
+def match_proposal_file(filename: str, vendor_ids_by_name: Dict[str, str]) -> Optional[Tuple[str, str]]:
+    """Map '<Vendor Name>_<Bundle Suffix>' to (vendor_id, doc_key)"""
+    stem = os.path.splitext(filename)[0]
+    parts = stem.split("_")
+    for cut in range(len(parts) - 1, 0, -1):
+        vendor_id = vendor_ids_by_name.get("_".join(parts[:cut]))
+        if vendor_id:
+            suffix = "_".join(parts[cut:])
+            for doc_key, bundle_name in PROPOSAL_BUNDLE.items():
+                if os.path.splitext(bundle_name)[0] == suffix:
+                    return vendor_id, doc_key
+            return vendor_id, _document_key(suffix)
+    return None
+
+def import_vendors_job(job: Job, path: str, filename: str, backend: StateBackend, workspace: str,
+                       registered: frozenset = frozenset()) -> Dict:
+    """Validate a registration sheet; persistent backends receive each batch as it is validated
+
+    Rows reusing the id of a vendor already in the workspace (or, for
+    session-only state, in registered) are rejected instead of replacing it.
+    """
+    # pydantic models are only needed once someone imports a sheet
+    from rfp_import import import_vendors
+    
+    kept: List[Dict] = []
+    if backend.persistent:
+        sink = partial(backend.save_vendors, workspace)
+        existing = partial(backend.existing_vendor_ids, workspace)
+    else:
+        sink, existing = kept.extend, registered.intersection
+    
+    def on_progress(fraction, rows):
+        job.report(fraction, f"{rows:,} rows")
+    
+    try:
+        report = import_vendors(path, sink, ServiceType.get_all(), CERTIFICATIONS,
+                                filename=filename, on_progress=on_progress, existing=existing)
+    finally:
+        os.remove(path)
+    return {"report": report, "records": kept}
+
+def _apply_vendor_import(outcome: Dict):
+    """Register imported vendors (session-only state) and keep the report for display"""
+    store = st.session_state.vendors
+    for record in outcome["records"]:
+        vendor = VendorProfile.from_details(record["vendor_id"], record["details"])
+        vendor.name = record["name"]
+        vendor.service_model = record["service_model"]
+        vendor.services_offered = record["services_offered"]
+        vendor.certifications = record["certifications"]
+        vendor.status = record["status"]
+        store.add(vendor)
+    if outcome["records"] or get_state_backend().persistent:
+        sync_persisted_state()
+    st.session_state.vendor_import_report = outcome["report"]
+
+def render_vendor_import():
+    """Bulk vendor registration from a CSV/XLSX sheet, run as a background job"""
+    st.write("**📥 Bulk Vendor Import**")
+    report = st.session_state.get('vendor_import_report')
+    if report is not None:
+        st.success(f"✅ {report.filename}: imported {report.imported:,} of {report.rows:,} rows "
+                   f"in {report.seconds:.1f}s")
+        if report.failed:
+            st.warning(f"{report.failed:,} rows rejected" +
+                       (f" (first {len(report.errors)} shown)" if report.failed > len(report.errors) else ""))
+            st.dataframe([e.as_dict() for e in report.errors], hide_index=True,
+                         width="stretch", height=200)
+    
+    uploaded = st.file_uploader(
+        "Registration sheet (columns: Vendor Name, Service Model, Services, Certifications, optional Vendor ID)",
+        type=["csv", "xlsx"], key="vendor_import_file"
+    )
+    if uploaded is None or not st.button("Import Vendors", key="vendor_import"):
+        return
+    path = spool_upload(uploaded, uploaded.name)
+    backend = get_state_backend()
+    # Jobs cannot read the session's store, so session-only state hands over its ids
+    registered = frozenset() if backend.persistent else frozenset(st.session_state.vendors.keys())
+    submit_job(f"Import {uploaded.name}", import_vendors_job, path, uploaded.name, backend,
+               active_workspace(), registered, apply=_apply_vendor_import)
+    st.toast(f"Importing {uploaded.name}")
+
+def render_bulk_submission(stage: WorkflowStage):
+    """Bulk proposal ingestion fanned out to worker processes"""
+    st.write("**📦 Bulk Proposal Intake**")
+    report = st.session_state.pop('bulk_ingest_report', None)
+    if report:
+        st.success(f"✅ Ingested {report['files']} files for {report['vendors']} vendors")
+        for message in report["failed"]:
+            st.error(message)
+    
+    files = st.file_uploader(
+        "Upload vendor proposal bundles (<Vendor Name>_Technical_Proposal.pdf, ...)",
+        type=["pdf", "docx", "xlsx", "txt"], accept_multiple_files=True, key="bulk_proposals"
+    )
+    if not files or not st.button("Ingest All Proposals", key="bulk_ingest"):
+        return
+    
+    store = st.session_state.vendors
+    vendor_ids_by_name = store.id_by_name()
+    matched, unmatched = {}, []
+    for uploaded in files:
+        match = match_proposal_file(uploaded.name, vendor_ids_by_name)
+        if match is None:
+            unmatched.append(uploaded.name)
+        else:
+            matched[uploaded.name] = (match, spool_upload(uploaded, uploaded.name))
+    
+    if unmatched:
+        st.warning("No registered vendor for: " + ", ".join(unmatched))
+    if not matched:
+        return
+    
+    cache = get_extraction_cache()
+    
+    def on_progress(job, done, total, name, result):
+        job.report(done / total, f"{done}/{total} · {name}")
+    
+    def ingest(job):
+        return bulk_ingest([(path, name) for name, (_, path) in matched.items()],
+                           on_progress=partial(on_progress, job), cache=cache)
+    
+    submit_job(f"Bulk intake of {len(matched)} proposal files", ingest,
+               apply=partial(_apply_bulk_submission, stage.stage_id,
+                             {name: match for name, (match, _) in matched.items()}))
+
+def _apply_bulk_submission(stage_id: str, matched: Dict[str, Tuple[str, str]], results: Dict[str, Dict]):
+    """Attach extracted proposals and submit vendors still in Registered state"""
+    store = st.session_state.vendors
+    submitted = set()
+    failed = []
+    for name, result in results.items():
+        vendor_id, doc_key = matched[name]
+        if not result["ok"]:
+            failed.append(f"{name}: {result['error']}")
+            continue
+        if vendor_id not in store:
+            continue
+        st.session_state.vendor_documents.setdefault(vendor_id, {})[doc_key] = result["record"]
+        store[vendor_id].documents[doc_key] = name
+        submitted.add(vendor_id)
+    
+    for vendor_id in submitted:
+        vendor = store[vendor_id]
+        if vendor.status == "Registered":
+            vendor.submit_proposal()
+        store.mark_dirty(vendor_id)
+    
+    stage = (st.session_state.workflow_stages or {}).get(stage_id)
+    if stage is not None and stage.progress < 90:
+        stage.update_progress(90)
+    st.session_state.bulk_ingest_report = {
+        "files": len(results) - len(failed),
+        "vendors": len(submitted),
+        "failed": failed,
+    }
+
+def _stage_fragments(stage: WorkflowStage) -> List[str]:
+    """Fragments that show a stage's status, the overall progress or the schedule"""
+    keys = [f"stage_{stage.stage_id}", "workflow_overview", "workflow_schedule", "sidebar_summary"]
+    if st.session_state.get('test_mode'):
+        keys.append("test_controls")
+    return keys
+
+def _on_progress_change(stage: WorkflowStage, key: str):
+    stage.update_progress(st.session_state[key])
+    st.rerun(_stage_fragments(stage))
+
+def _start_stage(stage: WorkflowStage):
+    stages = st.session_state.workflow_stages
+    if stage.can_start(stages):
+        stage.start()
+    else:
+        blocking = [stages[d].name for d in stage.depends_on if stages[d].status != "complete"]
+        st.session_state[f"stage_error_{stage.stage_id}"] = f"Complete {', '.join(repr(n) for n in blocking)} first"
+    st.rerun(_stage_fragments(stage))
+
+def _complete_stage(stage: WorkflowStage):
+    stage.complete()
+    st.rerun(_stage_fragments(stage))
+
+@keyed_fragment("workflow_overview")
+def render_workflow_overview(manager: RFPManager):
+    """Overall progress bar, rerun whenever a stage changes"""
     progress = manager.get_workflow_progress()
     st.markdown(f"""
     <div class="progress-bar">
@@ -875,136 +1761,412 @@ def render_workflow_management(manager: RFPManager):
         </div>
     </div>
     """, unsafe_allow_html=True)
-    
-    # Workflow stages
-    stages = st.session_state.workflow_stages
-    stage_list = list(stages.values())
-    
-    for idx, stage in enumerate(stage_list):
-        prev_stage = stage_list[idx - 1] if idx > 0 else None
+
+@keyed_fragment("workflow_schedule")
+def render_workflow_schedule(manager: RFPManager):
+    """Gantt timeline and critical path of the remaining work, rerun whenever a stage changes"""
+    schedule = manager.get_workflow_schedule()
+    today = date.today()
+    panel = st.expander(f"📅 Schedule: {schedule.finish} days of work left",
+                        key="schedule_panel", on_change="rerun")
+    # The timeline is only built and sent while the panel is open
+    if not panel.open:
+        return
+    with panel:
+        path = schedule.critical_path()
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Remaining", f"{schedule.finish} days")
+        col2.metric("Forecast Completion", (today + timedelta(days=schedule.finish)).strftime("%b %d, %Y"))
+        col3.metric("Critical Stages", len(path))
         
-        # Determine styling
-        if stage.status == "complete":
-            icon = "✅"
-            stage_color = "#10b981"
-        elif stage.status == "active":
-            icon = "🔄"
-            stage_color = "#f59e0b"
-        else:
-            icon = "⏳"
-            stage_color = "#94a3b8"
+        # Rebuilt only when a timing or the date changes
+        cached = st.session_state.get('schedule_figure')
+        if cached is None or cached[:3] != (schedule, schedule.version, today):
+            cached = (schedule, schedule.version, today, gantt_figure(schedule, today))
+            st.session_state.schedule_figure = cached
+        st.plotly_chart(cached[3], width="stretch")
+        if path:
+            stages = st.session_state.workflow_stages
+            st.caption("**Critical path:** " + " → ".join(stages[stage_id].name for stage_id in path))
+
+def render_workflow_stage(stage: WorkflowStage, idx: int):
+    """One workflow stage; its slider and buttons rerun only this stage and the progress views"""
+    # Determine styling
+    if stage.status == "complete":
+        icon = "✅"
+    elif stage.status == "active":
+        icon = "🔄"
+    else:
+        icon = "⏳"
+    
+    with st.expander(f"{icon} **Stage {stage.stage_num}: {stage.name}**", expanded=(stage.status == "active")):
+        col1, col2, col3 = st.columns([4, 3, 3])
         
-        with st.expander(f"{icon} **Stage {stage.stage_num}: {stage.name}**", expanded=(stage.status == "active")):
-            col1, col2, col3 = st.columns([4, 3, 3])
-            
-            with col1:
-                st.write(f"**Status:** {stage.status.upper()}")
-                st.write(f"**Description:** {stage.description}")
-                st.write(f"**Duration:** {stage.duration}")
-                
-                if stage.status == "active":
-                    new_progress = st.slider(
-                        "Progress", 0, 100, stage.progress,
-                        key=f"progress_{stage.stage_id}_{idx}"
-                    )
-                    if new_progress != stage.progress:
-                        stage.update_progress(new_progress)
-                        st.rerun()
-                elif stage.status == "complete":
-                    st.progress(1.0)
+        with col1:
+            st.write(f"**Status:** {stage.status.upper()}")
+            st.write(f"**Description:** {stage.description}")
+            st.write(f"**Duration:** {stage.duration}")
+            if stage.depends_on:
+                stages = st.session_state.workflow_stages
+                st.write(f"**Depends on:** {', '.join(stages[d].name for d in stage.depends_on)}")
             
-            with col2:
-                st.write("**Required Documents:**")
-                for doc in stage.required_docs:
-                    st.caption(f"• {doc}")
+            if stage.status == "active":
+                # Seed the widget from the stage so programmatic updates show up
+                slider_key = f"progress_{stage.stage_id}_{idx}"
+                st.session_state[slider_key] = stage.progress
+                st.slider(
+                    "Progress", 0, 100, key=slider_key,
+                    on_change=_on_progress_change, args=(stage, slider_key)
+                )
+            elif stage.status == "complete":
+                st.progress(1.0)
+        
+        with col2:
+            st.write("**Required Documents:**")
+            for doc in stage.required_docs:
+                st.caption(f"• {doc}")
+        
+        with col3:
+            if stage.status == "pending":
+                st.button(f"▶️ Start", key=f"start_{stage.stage_id}_{idx}",
+                          on_click=_start_stage, args=(stage,))
+                error = st.session_state.pop(f"stage_error_{stage.stage_id}", None)
+                if error:
+                    st.error(error)
             
-            with col3:
-                if stage.status == "pending":
-                    if st.button(f"▶️ Start", key=f"start_{stage.stage_id}_{idx}"):
-                        if stage.can_start(prev_stage):
-                            stage.start()
-                            st.rerun()
-                        else:
-                            st.error(f"Complete '{prev_stage.name}' first")
-                
-                elif stage.status == "active" and stage.progress >= 100:
-                    if st.button(f"✔️ Complete", key=f"complete_{stage.stage_id}_{idx}"):
-                        stage.complete()
-                        st.rerun()
+            elif stage.status == "active" and stage.progress >= 100:
+                st.button(f"✔️ Complete", key=f"complete_{stage.stage_id}_{idx}",
+                          on_click=_complete_stage, args=(stage,))
+        
+        if stage.stage_id == "vendor_registration" and stage.status == "active":
+            render_vendor_import()
+        if stage.stage_id == "proposal_submission" and stage.status == "active":
+            render_bulk_submission(stage)
+
+def render_workflow_management(manager: RFPManager):
+    """Render workflow management"""
+    st.header("⚙️ Workflow Management")
+    
+    # Overall progress
+    render_workflow_overview(manager)
+    render_workflow_schedule(manager)
+    
+    # Workflow stages, each its own fragment
+    stage_list = list(st.session_state.workflow_stages.values())
+    for idx, stage in enumerate(stage_list):
+        keyed_fragment(f"stage_{stage.stage_id}")(render_workflow_stage)(stage, idx)
+
+@keyed_fragment("workflow_tab")
+def render_workflow_tab(manager: RFPManager):
+    """Workflow tab: document upload and the workflow stages"""
+    render_document_upload(manager)
+    render_workflow_management(manager)
+
+@keyed_fragment("vendor_stats")
+def render_vendor_stats():
+    """Dashboard metrics, rerun alongside any vendor row that changes them"""
+    store = st.session_state.vendors
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Vendors", len(store))
+    with col2:
+        evaluated = store.count(status="Evaluated")
+        st.metric("Evaluated", evaluated)
+    with col3:
+        consolidated = store.count(service_model=ServiceModel.CONSOLIDATED)
+        st.metric("Consolidated", consolidated)
+    with col4:
+        if evaluated > 0:
+            avg_score = store.mean_score(status="Evaluated")
+            st.metric("Avg Score", f"{avg_score:.1f}")
 
+@keyed_fragment("vendors_tab")
 def render_vendor_dashboard(manager: RFPManager):
     """Render vendor dashboard"""
     st.header("👥 Vendor Management")
     
     if not st.session_state.vendors:
-        st.info("No vendors registered. Use Test Data Generator to create sample vendors.")
+        st.info("No vendors registered. Use Test Data Generator to create sample vendors, "
+                "or import a registration sheet in the Vendor Registration stage.")
         return
     
-    # Statistics
+    render_vendor_stats()
+    render_vendor_table(manager, st.session_state.vendors)
+
+VENDOR_PAGE_SIZES = [10, 25, 50, 100]
+VENDOR_SORTS = {
+    "Score": "overall_score",
+    "Name": "name",
+    "Status": "status",
+    "Service model": "service_model",
+}
+VENDOR_STATUSES = ["Registered", "Submitted", "Evaluated"]
+SERVICE_TAGS = {
+    ServiceType.WAREHOUSE: '<span class="service-tag service-warehouse">Warehouse</span>',
+    ServiceType.CSO: '<span class="service-tag service-cso">CSO</span>',
+    ServiceType.CSG: '<span class="service-tag service-csg">CSG</span>',
+}
+
+def _reset_vendor_page():
+    st.session_state.vendor_page = 1
+
+def _step_vendor_page(step: int, pages: int):
+    st.session_state.vendor_page = min(pages, max(1, st.session_state.vendor_page + step))
+
+def _evaluate_row(manager: RFPManager, vendor_id: str, name: str):
+    if st.session_state.get('scoring_mode') == SCORING_MODE_AI:
+        # AI scoring waits on the API, so it runs as a job the sidebar polls
+        manager.submit_evaluation([vendor_id], f"Evaluate {name}")
+        st.rerun()
+    else:
+        manager.evaluate_vendor(vendor_id)
+        st.rerun([f"vendor_row_{vendor_id}", "vendor_stats"])
+
+def render_vendor_row(manager: RFPManager, vendor_id: str):
+    """One vendor in the list; Evaluate reruns only this row and the dashboard metrics"""
+    vendor = st.session_state.vendors.get(vendor_id)
+    if vendor is None:
+        return
+    col1, col2, col3, col4 = st.columns([3, 2, 2, 2])
+    
+    with col1:
+        st.write(f"**{vendor.name}**")
+        st.caption(f"ID: {vendor.vendor_id}")
+        st.markdown(" ".join(SERVICE_TAGS.get(s, SERVICE_TAGS[ServiceType.CSG])
+                             for s in vendor.services_offered), unsafe_allow_html=True)
+    
+    with col2:
+        st.write(f"Model: {vendor.service_model}")
+        st.write(f"Status: {vendor.status}")
+    
+    with col3:
+        if vendor.overall_score > 0:
+            badge = ScoringEngine.tier_badge(vendor.overall_score)
+            st.markdown(f'<div class="score-badge {badge}">Score: {vendor.overall_score:.1f}</div>',
+                      unsafe_allow_html=True)
+    
+    with col4:
+        if vendor.status == "Submitted":
+            st.button("Evaluate", key=f"eval_{vendor.vendor_id}",
+                      on_click=_evaluate_row, args=(manager, vendor.vendor_id, vendor.name))
+    
+    st.markdown("---")
+
+def render_vendor_table(manager: RFPManager, store: VendorStore):
+    """Filtered, sorted vendor list that renders only the current page"""
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Vendors", len(st.session_state.vendors))
+        status = st.selectbox("Status", ["All"] + VENDOR_STATUSES,
+                              key="vendor_filter_status", on_change=_reset_vendor_page)
     with col2:
-        evaluated = sum(1 for v in st.session_state.vendors.values() if v.status == "Evaluated")
-        st.metric("Evaluated", evaluated)
+        model = st.selectbox("Service model", ["All", ServiceModel.STANDALONE, ServiceModel.CONSOLIDATED],
+                             key="vendor_filter_model", on_change=_reset_vendor_page)
     with col3:
-        consolidated = sum(1 for v in st.session_state.vendors.values() 
-                         if v.service_model == ServiceModel.CONSOLIDATED)
-        st.metric("Consolidated", consolidated)
+        service = st.selectbox("Service", ["All"] + ServiceType.get_all(),
+                               key="vendor_filter_service", on_change=_reset_vendor_page)
     with col4:
-        if evaluated > 0:
-            avg_score = sum(v.overall_score for v in st.session_state.vendors.values() 
-                          if v.status == "Evaluated") / evaluated
-            st.metric("Avg Score", f"{avg_score:.1f}")
+        band = st.slider("Score band", 0, 100, (0, 100),
+                         key="vendor_filter_band", on_change=_reset_vendor_page)
     
-    # Vendor list
-    for vendor in st.session_state.vendors.values():
-        col1, col2, col3, col4 = st.columns([3, 2, 2, 2])
-        
-        with col1:
-            st.write(f"**{vendor.name}**")
-            st.caption(f"ID: {vendor.vendor_id}")
-            
-            for service in vendor.services_offered:
-                if service == ServiceType.WAREHOUSE:
-                    st.markdown('<span class="service-tag service-warehouse">Warehouse</span>', unsafe_allow_html=True)
-                elif service == ServiceType.CSO:
-                    st.markdown('<span class="service-tag service-cso">CSO</span>', unsafe_allow_html=True)
-                else:
-                    st.markdown('<span class="service-tag service-csg">CSG</span>', unsafe_allow_html=True)
-        
-        with col2:
-            st.write(f"Model: {vendor.service_model}")
-            st.write(f"Status: {vendor.status}")
-        
-        with col3:
-            if vendor.overall_score > 0:
-                if vendor.overall_score >= 85:
-                    badge = "score-excellent"
-                elif vendor.overall_score >= 75:
-                    badge = "score-good"
-                elif vendor.overall_score >= 65:
-                    badge = "score-fair"
-                else:
-                    badge = "score-poor"
-                
-                st.markdown(f'<div class="score-badge {badge}">Score: {vendor.overall_score:.1f}</div>',
-                          unsafe_allow_html=True)
-        
-        with col4:
-            if vendor.status == "Submitted":
-                if st.button("Evaluate", key=f"eval_{vendor.vendor_id}"):
-                    manager.evaluate_vendor(vendor.vendor_id)
-                    st.rerun()
-        
-        st.markdown("---")
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        sort_label = st.selectbox("Sort by", list(VENDOR_SORTS), key="vendor_sort",
+                                  on_change=_reset_vendor_page)
+    with col2:
+        descending = st.toggle("Descending", value=True, key="vendor_sort_desc",
+                               on_change=_reset_vendor_page)
+    with col3:
+        page_size = st.selectbox("Per page", VENDOR_PAGE_SIZES, index=1,
+                                 key="vendor_page_size", on_change=_reset_vendor_page)
+    
+    filters = {
+        "status": None if status == "All" else status,
+        "service_model": None if model == "All" else model,
+        "service": None if service == "All" else service,
+        "min_score": band[0] if band[0] > 0 else None,
+        "max_score": band[1] if band[1] < 100 else None,
+    }
+    page = st.session_state.setdefault('vendor_page', 1)
+    rows, total = store.page((page - 1) * page_size, page_size,
+                             VENDOR_SORTS[sort_label], descending, **filters)
+    pages = max(1, -(-total // page_size))
+    if page > pages:
+        st.session_state.vendor_page = page = pages
+        rows, total = store.page((page - 1) * page_size, page_size,
+                                 VENDOR_SORTS[sort_label], descending, **filters)
+    
+    if not total:
+        st.info("No vendors match the current filters.")
+        return
+    
+    for vendor_id in store.ids(rows):
+        keyed_fragment(f"vendor_row_{vendor_id}")(render_vendor_row)(manager, vendor_id)
+    
+    first = (page - 1) * page_size + 1
+    col1, col2, col3 = st.columns([1, 3, 1])
+    with col1:
+        st.button("◀ Previous", key="vendor_prev", disabled=page <= 1,
+                  on_click=_step_vendor_page, args=(-1, pages), width="stretch")
+    with col2:
+        st.caption(f"Showing {first:,}–{first + len(rows) - 1:,} of {total:,} vendors · page {page} of {pages:,}")
+    with col3:
+        st.button("Next ▶", key="vendor_next", disabled=page >= pages,
+                  on_click=_step_vendor_page, args=(1, pages), width="stretch")
 
 # ========================================
 # MAIN APPLICATION
 # ========================================
 
+MAIN_TABS = ["⚙️ Workflow", "👥 Vendors", "📊 Evaluation", "🎯 Selection", "📁 Portfolio"]
+
+def _create_rfp_from_form():
+    title = st.session_state.new_rfp_title.strip()
+    if title:
+        create_rfp(title)
+    else:
+        st.toast("Give the new RFP a title")
+
+def render_rfp_switcher():
+    """Sidebar RFP picker; only the open RFP's workflow, vendors and documents are loaded"""
+    if not get_state_backend().persistent:
+        return
+    rfps = portfolio_rfps()
+    st.session_state.rfp_title = rfps[active_workspace()]['title']
+    st.session_state.rfp_created = rfps[active_workspace()]['created']
+    # Job results are applied to whichever RFP is open when they finish
+    busy = any(not job.applied for job in get_job_manager().jobs_for(session_owner()))
+    workspaces = list(rfps)
+    st.selectbox(
+        "Active RFP", workspaces, index=workspaces.index(active_workspace()), key="rfp_picker",
+        format_func=lambda w: f"{rfps[w]['title']} · {rfps[w]['created']:%Y-%m-%d}",
+        on_change=lambda: switch_rfp(st.session_state.rfp_picker), disabled=busy,
+        help="Wait for this session's background jobs to finish before switching" if busy else None
+    )
+    with st.expander("➕ New RFP"):
+        with st.form("new_rfp", clear_on_submit=True, border=False):
+            st.text_input("Title", key="new_rfp_title")
+            st.form_submit_button("Create and Open", on_click=_create_rfp_from_form, disabled=busy)
+
+@keyed_fragment("sidebar_summary")
+def render_sidebar_summary(manager: RFPManager):
+    """Sidebar progress and statistics"""
+    # Progress
+    st.markdown("### 📊 Progress")
+    progress = manager.get_workflow_progress()
+    st.progress(progress / 100)
+    st.caption(f"{progress}% Complete")
+    
+    # Stats
+    st.markdown("### 📈 Statistics")
+    st.metric("Vendors", len(st.session_state.vendors))
+    st.metric("Documents", len(st.session_state.rfp_documents))
+
+    if st.session_state.get('aggregate_check'):
+        mismatches = st.session_state.vendors.verify_aggregates()
+        mismatches += st.session_state.workflow_progress.verify()
+        mismatches += manager.get_workflow_schedule().verify()
+        mismatches += verify_rollups(get_state_backend(), active_workspace())
+        if mismatches:
+            st.error("Aggregate mismatch: " + "; ".join(mismatches))
+        else:
+            st.caption("✓ Aggregates consistent")
+
+@keyed_fragment("evaluation_tab")
+def render_evaluation_tab(manager: RFPManager):
+    """Evaluation tab: charts, sensitivity, export and scoring diagnostics"""
+    st.header("📊 Vendor Evaluation")
+    
+    if st.session_state.vendors.count(status="Evaluated"):
+        render_evaluation_charts()
+        render_sensitivity_analysis()
+        render_evaluation_export(manager)
+    else:
+        st.info("No vendors evaluated yet. Generate test data and evaluate vendors.")
+    
+    render_ai_scoring_stats()
+    render_requirement_coverage()
+
+@keyed_fragment("portfolio_tab")
+def render_portfolio_tab(manager: RFPManager):
+    """Portfolio tab: cross-RFP analytics read from rollups, never from other RFPs' vendors"""
+    import pandas as pd
+    import plotly.express as px
+    
+    st.header("📁 RFP Portfolio")
+    backend = get_state_backend()
+    if not backend.persistent:
+        st.info("The portfolio needs a persistent state backend (RFP_STATE_URL=sqlite:///...).")
+        return
+    
+    view = load_portfolio(backend)
+    vendors = view.vendors()
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("RFPs", len(view.rfps))
+    col2.metric("Proposals", f"{sum(r.proposals for r in view.rfps):,}")
+    col3.metric("Vendors", f"{len(vendors):,}")
+    col4.metric("Awarded", sum(1 for r in view.rfps if r.winners))
+    
+    st.dataframe(pd.DataFrame([{
+        "RFP": ("▶ " if r.workspace == active_workspace() else "") + r.title,
+        "Created": r.created,
+        "Proposals": r.proposals,
+        "Evaluated": r.evaluated,
+        "Avg Score": r.mean_score,
+        "Awarded To": ", ".join(r.winners),
+    } for r in view.rfps]), hide_index=True, width="stretch",
+        column_config={"Avg Score": st.column_config.NumberColumn(format="%.1f")})
+    
+    trend = view.score_trend()
+    if len(trend) > 1:
+        st.subheader("📈 Score Trend")
+        fig = px.line(pd.DataFrame({"Created": [r.created for r in trend],
+                                    "Avg Score": [r.mean_score for r in trend],
+                                    "RFP": [r.title for r in trend]}),
+                      x="Created", y="Avg Score", hover_name="RFP", markers=True)
+        fig.update_layout(height=300, margin=dict(t=10, b=10))
+        st.plotly_chart(fig, width="stretch")
+    
+    st.subheader("🤝 Vendor Participation")
+    min_rfps = st.number_input("Minimum RFPs", min_value=1, max_value=max(1, len(view.rfps)), value=1,
+                               key="portfolio_min_rfps")
+    shown = [v for v in vendors if v.rfps >= min_rfps]
+    st.dataframe(pd.DataFrame([{
+        "Vendor": v.name,
+        "RFPs": v.rfps,
+        "Evaluated In": v.evaluated_rfps,
+        "Wins": v.wins,
+        "Win Rate": v.win_rate * 100,
+        "Avg Score": v.mean_score,
+    } for v in shown], columns=["Vendor", "RFPs", "Evaluated In", "Wins", "Win Rate", "Avg Score"]),
+        hide_index=True, width="stretch", height=300,
+        column_config={"Win Rate": st.column_config.NumberColumn(format="%.0f%%"),
+                       "Avg Score": st.column_config.NumberColumn(format="%.1f")})
+    
+    evaluated = [v.name for v in shown if v.evaluated_rfps]
+    name = st.selectbox("Vendor history", evaluated, index=None, key="portfolio_vendor",
+                        placeholder="Choose a vendor")
+    if name:
+        history = view.vendor_history(name)
+        st.dataframe(pd.DataFrame([{"RFP": title, "Created": created, "Avg Score": score, "Won": won}
+                                   for title, created, score, won in history]),
+                     hide_index=True, width="stretch",
+                     column_config={"Avg Score": st.column_config.NumberColumn(format="%.1f")})
+
 def main():
     """Main application"""
+    # Fragment reruns skip this function; see keyed_fragment
+    st.session_state.full_run = True
+    
+    # Load persisted state and pick up changes from other sessions
+    sync_persisted_state()
+    
+    # Results of background jobs that finished since the last run
+    apply_finished_jobs()
+    
+    # The RFP is picked first: the manager and everything below belong to the open one
+    with st.sidebar:
+        st.markdown("### 🎯 RFP Platform")
+        render_rfp_switcher()
     
     # Initialize manager
     manager = RFPManager()
@@ -1022,8 +2184,6 @@ def main():
     
     # Sidebar
     with st.sidebar:
-        st.markdown("### 🎯 RFP Platform")
-        
         # Enable test mode
         test_mode = st.checkbox(
             "Enable Test Mode",
@@ -1031,6 +2191,23 @@ def main():
         )
         st.session_state.test_mode = test_mode
         
+        if test_mode:
+            aggregate_check = st.checkbox(
+                "Verify aggregates",
+                value=st.session_state.get('aggregate_check', False),
+                help="Check incremental metrics against a full recompute on every read"
+            )
+            st.session_state.aggregate_check = aggregate_check
+            st.session_state.vendors.aggregates.check = aggregate_check
+        
+        ai_ready = ai_scoring_available()
+        st.radio(
+            "Scoring mode", [SCORING_MODE_SIMULATED, SCORING_MODE_AI],
+            key="scoring_mode", disabled=not ai_ready,
+            help="AI-assisted scoring reads ingested proposal text"
+                 if ai_ready else "Set ANTHROPIC_API_KEY (or RFP_AI_BASE_URL) to enable AI-assisted scoring"
+        )
+        
         st.markdown("---")
         
         # RFP Info
@@ -1038,16 +2215,7 @@ def main():
         st.caption(f"**ID:** {manager.rfp_details['rfp_id']}")
         st.caption(f"**Budget:** {manager.rfp_details['budget_range']}")
         
-        # Progress
-        st.markdown("### 📊 Progress")
-        progress = manager.get_workflow_progress()
-        st.progress(progress / 100)
-        st.caption(f"{progress}% Complete")
-        
-        # Stats
-        st.markdown("### 📈 Statistics")
-        st.metric("Vendors", len(st.session_state.vendors))
-        st.metric("Documents", len(st.session_state.rfp_documents))
+        render_sidebar_summary(manager)
     
     # Main content
     if st.session_state.test_mode:
@@ -1055,73 +2223,22 @@ def main():
         render_test_controls(manager)
         st.markdown("---")
     
-    # Main tabs
-    tabs = st.tabs(["⚙️ Workflow", "👥 Vendors", "📊 Evaluation", "🎯 Selection"])
-    
-    with tabs[0]:
-        render_workflow_management(manager)
+    # Main tabs; only the selected one runs, and switching tabs reruns the app
+    tabs = st.tabs(MAIN_TABS, key="main_tab", on_change="rerun")
+    tab_renders = [render_workflow_tab, render_vendor_dashboard, render_evaluation_tab, render_vendor_selection,
+                   render_portfolio_tab]
+    for tab, render in zip(tabs, tab_renders):
+        with tab:
+            if tab.open:
+                render(manager)
     
-    with tabs[1]:
-        render_vendor_dashboard(manager)
-    
-    with tabs[2]:
-        st.header("📊 Vendor Evaluation")
-        evaluated = [v for v in st.session_state.vendors.values() if v.status == "Evaluated"]
-        
-        if evaluated:
-            # Create comparison chart
-            vendor_names = [v.name[:20] for v in evaluated]
-            scores = [v.overall_score for v in evaluated]
-            models = [v.service_model for v in evaluated]
-            
-            fig = go.Figure()
-            colors = ['#3b82f6' if m == ServiceModel.CONSOLIDATED else '#10b981' for m in models]
-            
-            fig.add_trace(go.Bar(
-                x=vendor_names,
-                y=scores,
-                marker_color=colors,
-                text=[f'{s:.1f}' for s in scores],
-                textposition='auto'
-            ))
-            
-            fig.update_layout(
-                title="Vendor Score Comparison",
-                xaxis_title="Vendors",
-                yaxis_title="Overall Score",
-                yaxis_range=[0, 100]
-            )
-            
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info("No vendors evaluated yet. Generate test data and evaluate vendors.")
-    
-    with tabs[3]:
-        st.header("🎯 Vendor Selection")
-        evaluated = [v for v in st.session_state.vendors.values() if v.status == "Evaluated"]
-        
-        if evaluated:
-            st.info("Select vendors for each service based on evaluation scores")
-            
-            # Show top vendors by service model
-            consolidated = [v for v in evaluated if v.service_model == ServiceModel.CONSOLIDATED]
-            if consolidated:
-                st.subheader("Top Consolidated Vendors")
-                top_consolidated = sorted(consolidated, key=lambda x: x.overall_score, reverse=True)[:3]
-                for vendor in top_consolidated:
-                    st.write(f"• **{vendor.name}**: Score {vendor.overall_score:.1f}/100")
-            
-            st.subheader("Top Standalone Vendors by Service")
-            for service in ServiceType.get_all():
-                service_vendors = [v for v in evaluated 
-                                 if v.service_model == ServiceModel.STANDALONE 
-                                 and service in v.services_offered]
-                if service_vendors:
-                    st.write(f"**{service}:**")
-                    top = sorted(service_vendors, key=lambda x: x.overall_score, reverse=True)[0]
-                    st.write(f"• {top.name}: Score {top.overall_score:.1f}/100")
-        else:
-            st.info("No vendors evaluated yet. Complete evaluation before selection.")
+    # Rendered last so jobs submitted during this run are listed
+    with st.sidebar:
+        render_job_status()
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        st.session_state.full_run = False
+        persist_session_state()
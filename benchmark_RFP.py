@@ -0,0 +1,752 @@
+"""
+Rendering benchmarks for the RFP platform
+Runs app_RFP.py headlessly through Streamlit's AppTest against generated
+state and reports per-rerun latency as the data grows. The interaction mode
+times single widget interactions that rerun only their fragments. The suite
+mode times workflow, scoring, selection and every render function, writes a
+JSON report and exits non-zero on regressions against the stored baseline
+or if one session's workflow changes leak into another's. Baseline timings
+are absolute, so the baseline is per machine and not checked in: record one
+with --update-baseline on the host that runs the comparisons.
+
+    python benchmark_RFP.py --sizes 100 1000 10000 50000
+    python benchmark_RFP.py --interactions --sizes 1000 100000 --stages 11 110
+    python benchmark_RFP.py --startup [--sizes 1000]
+    python benchmark_RFP.py --isolation
+    python benchmark_RFP.py --suite [--update-baseline]
+"""
+
+import argparse
+import inspect
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional, Sequence
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app_RFP.py")
+CRITERIA = ["technical_capability", "operational_excellence", "pricing_competitiveness",
+            "compliance_security", "experience_references", "innovation_flexibility"]
+SERVICES = ["Warehouse Services", "Customer Service Operations", "Consumer Solutions Group"]
+WORKFLOW_TAB, VENDORS_TAB, EVALUATION_TAB = "⚙️ Workflow", "👥 Vendors", "📊 Evaluation"
+MAIN_TABS = [WORKFLOW_TAB, VENDORS_TAB, EVALUATION_TAB, "🎯 Selection", "📁 Portfolio"]
+
+
+def seed_vendor_state(path: str, count: int, seed: int = 0, workspace: str = "default",
+                      evaluated: bool = False, mix: Optional[Dict[str, float]] = None):
+    """Write count registered/submitted (or scored, evaluated) synthetic vendors into a SQLite state file"""
+    from rfp_persistence import SQLiteBackend
+    from rfp_synthetic import SyntheticVendors
+
+    if mix is None:
+        mix = {"Evaluated": 1.0} if evaluated else {"Registered": 0.5, "Submitted": 0.5}
+    population = SyntheticVendors(count, seed, status_mix=mix, id_prefix="VND-BENCH")
+    backend = SQLiteBackend(path)
+    population.save_to(lambda records: backend.save_vendors(workspace, records))
+
+
+def _share_script_cache():
+    """Compile the app once per process, as a Streamlit server does
+
+    AppTest builds a fresh ScriptCache for every run, so each rerun would
+    otherwise re-parse and compile app_RFP.py and swamp the timings.
+    """
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import app_test, local_script_runner
+
+    shared = ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: shared
+
+
+def _app_test(timeout: int = 300):
+    """Fresh app with process-wide resources (state backend, caches) dropped"""
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    st.cache_resource.clear()
+    _share_script_cache()
+    return AppTest.from_file(APP_PATH, default_timeout=timeout)
+
+
+def _run_in_tab(at, tab: str, **widgets):
+    """Full run with the given main tab (and widget values) selected
+
+    AppTest does not report the selected tab back like a browser does, so it
+    is pinned through session state before every full run.
+    """
+    at.session_state["main_tab"] = tab
+    for key, value in widgets.items():
+        at.session_state[key] = value
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception)
+    return at
+
+
+def bench_vendor_dashboard(sizes: Sequence[int] = (100, 1000, 10000, 50000),
+                           reruns: int = 5) -> List[Dict]:
+    """Full-app rerun latency with N vendors; the vendor list renders one page"""
+    results = []
+    for size in sizes:
+        workdir = tempfile.mkdtemp(prefix="rfp_bench_render_")
+        state_path = os.path.join(workdir, "state.db")
+        seed_vendor_state(state_path, size)
+        os.environ["RFP_STATE_URL"] = f"sqlite:///{state_path}"
+
+        at = _app_test()
+        start = time.perf_counter()
+        _run_in_tab(at, VENDORS_TAB)
+        first = time.perf_counter() - start
+
+        timings = []
+        for _ in range(reruns):
+            start = time.perf_counter()
+            _run_in_tab(at, VENDORS_TAB)
+            timings.append(time.perf_counter() - start)
+        results.append({
+            "vendors": size,
+            "first_run_ms": round(first * 1000, 1),
+            "rerun_median_ms": round(statistics.median(timings) * 1000, 1),
+            "rerun_max_ms": round(max(timings) * 1000, 1),
+        })
+    return results
+
+
+def bench_evaluation_charts(sizes: Sequence[int] = (100, 1000, 10000),
+                            reruns: int = 5) -> List[Dict]:
+    """Rerun latency with N evaluated vendors while switching Evaluation chart views"""
+    results = []
+    for size in sizes:
+        workdir = tempfile.mkdtemp(prefix="rfp_bench_charts_")
+        state_path = os.path.join(workdir, "state.db")
+        seed_vendor_state(state_path, size, evaluated=True)
+        os.environ["RFP_STATE_URL"] = f"sqlite:///{state_path}"
+
+        at = _app_test()
+        start = time.perf_counter()
+        _run_in_tab(at, EVALUATION_TAB)
+        first = time.perf_counter() - start
+
+        from rfp_charts import VIEWS
+        timings = []
+        for i in range(reruns * len(VIEWS)):
+            view = [r for r in at.radio if r.key == "evaluation_chart_view"][0]
+            view.set_value(VIEWS[i % len(VIEWS)])
+            start = time.perf_counter()
+            _run_in_tab(at, EVALUATION_TAB)
+            timings.append(time.perf_counter() - start)
+        cache = at.session_state.figure_cache
+        results.append({
+            "evaluated_vendors": size,
+            "first_run_ms": round(first * 1000, 1),
+            "switch_median_ms": round(statistics.median(timings) * 1000, 1),
+            "switch_max_ms": round(max(timings) * 1000, 1),
+            "figure_cache_hits": cache.hits,
+            "figure_cache_misses": cache.misses,
+        })
+    return results
+
+
+def _activate_stages(at, count: int):
+    """Replace the workflow with count active stages cloned from the standard ones"""
+    template = list(at.session_state["workflow_stages"].values())
+    stages = {}
+    previous = ()
+    for i in range(count):
+        base = template[i % len(template)]
+        stage = type(base)(base.template._replace(stage_id=f"{base.stage_id}_{i}", stage_num=i + 1,
+                                                  depends_on=previous))
+        previous = (stage.stage_id,)
+        stage.start()
+        stage.progress = 50
+        stages[stage.stage_id] = stage
+    at.session_state["workflow_stages"] = stages
+    return [f"progress_{stage_id}_{i}" for i, stage_id in enumerate(stages)]
+
+
+def _timed(at, element) -> float:
+    start = time.perf_counter()
+    element.run()
+    elapsed = (time.perf_counter() - start) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception)
+    return elapsed
+
+
+def interaction_timings(stage_count: int, reruns: int) -> Dict[str, List[float]]:
+    """Milliseconds per interaction against the state at RFP_STATE_URL
+
+    Each Evaluate click uses up a Submitted vendor; once none are left on
+    the page the remaining rounds skip that interaction.
+    """
+    at = _run_in_tab(_app_test(), WORKFLOW_TAB)
+    sliders = _activate_stages(at, stage_count)
+    timings = {"full_rerun_workflow": [], "stage_slider": [],
+               "full_rerun_vendors": [], "vendor_evaluate": []}
+    for i in range(reruns):
+        start = time.perf_counter()
+        _run_in_tab(at, WORKFLOW_TAB)
+        timings["full_rerun_workflow"].append((time.perf_counter() - start) * 1000)
+        slider = at.slider(key=sliders[i % len(sliders)]).set_value(20 + i)
+        timings["stage_slider"].append(_timed(at, slider))
+
+        start = time.perf_counter()
+        _run_in_tab(at, VENDORS_TAB, vendor_filter_status="Submitted")
+        timings["full_rerun_vendors"].append((time.perf_counter() - start) * 1000)
+        button = next((b for b in at.button if b.key and b.key.startswith("eval_")), None)
+        if button is not None:
+            timings["vendor_evaluate"].append(_timed(at, button.click()))
+    return {interaction: values for interaction, values in timings.items() if values}
+
+
+def bench_interactions(sizes: Sequence[int] = (1000, 100000), stage_counts: Sequence[int] = (11, 110),
+                       reruns: int = 5, seed: int = 0) -> List[Dict]:
+    """Per-interaction latency against total vendor and stage counts
+
+    A stage slider reruns that stage plus the progress views and an Evaluate
+    click reruns that row plus the dashboard metrics, so neither should grow
+    with the vendor or stage count. Full reruns of the same tab are timed
+    alongside for comparison.
+    """
+    results = []
+    for size in sizes:
+        workdir = tempfile.mkdtemp(prefix="rfp_bench_interactions_")
+        state_path = os.path.join(workdir, "state.db")
+        seed_vendor_state(state_path, size, seed, mix={"Registered": 0.2, "Submitted": 0.3, "Evaluated": 0.5})
+        os.environ["RFP_STATE_URL"] = f"sqlite:///{state_path}"
+        for stage_count in stage_counts:
+            for interaction, values in interaction_timings(stage_count, reruns).items():
+                results.append({
+                    "interaction": interaction,
+                    "vendors": size,
+                    "stages": stage_count,
+                    "median_ms": round(statistics.median(values), 1),
+                    "max_ms": round(max(values), 1),
+                })
+    return results
+
+
+def _phase(name: str):
+    """Marks the -X importtime stream so imports can be attributed to a phase"""
+    print(f"# phase {name}", file=sys.stderr, flush=True)
+
+
+def startup_probe(reruns: int = 5):
+    """Runs in a fresh interpreter: one session from server start through each tab's first use"""
+    timings = {}
+    _phase("streamlit")
+    start = time.perf_counter()
+    import streamlit  # noqa: F401 - a server has this loaded before the first session
+    from streamlit.testing.v1 import AppTest
+    timings["streamlit"] = [(time.perf_counter() - start) * 1000]
+
+    _phase("first_run")
+    at = AppTest.from_file(APP_PATH, default_timeout=300)
+    start = time.perf_counter()
+    _run_in_tab(at, WORKFLOW_TAB)
+    timings["first_run"] = [(time.perf_counter() - start) * 1000]
+
+    _share_script_cache()
+    _run_in_tab(at, WORKFLOW_TAB)
+    _phase("rerun")
+    timings["rerun"] = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        _run_in_tab(at, WORKFLOW_TAB)
+        timings["rerun"].append((time.perf_counter() - start) * 1000)
+
+    for tab in MAIN_TABS[1:]:
+        _phase(f"open {tab}")
+        start = time.perf_counter()
+        _run_in_tab(at, tab)
+        timings[f"open {tab}"] = [(time.perf_counter() - start) * 1000]
+    print(json.dumps(timings))
+
+
+def _import_times(stderr: str) -> Dict[str, List]:
+    """Top-level imports per phase from -X importtime output, as (module, ms)"""
+    phases, current = {}, None
+    for line in stderr.splitlines():
+        if line.startswith("# phase "):
+            current = phases.setdefault(line[len("# phase "):], [])
+        elif line.startswith("import time:") and current is not None:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            # Nested imports are indented under the module that triggered them
+            if cumulative.strip().isdigit() and not name[1:].startswith(" "):
+                current.append((name.strip(), int(cumulative) / 1000))
+    return phases
+
+
+def bench_startup(size: int = 1000, runs: int = 3, reruns: int = 5, seed: int = 0) -> List[Dict]:
+    """Cold start: first session run and each tab's first use in a fresh interpreter
+
+    Reports wall time and the import time attributable to app code per
+    phase. Heavy libraries should only show up in the phase that uses them.
+    """
+    import subprocess
+
+    workdir = tempfile.mkdtemp(prefix="rfp_bench_startup_")
+    state_path = os.path.join(workdir, "state.db")
+    seed_vendor_state(state_path, size, seed, mix={"Registered": 0.2, "Submitted": 0.3, "Evaluated": 0.5})
+    env = dict(os.environ, RFP_STATE_URL=f"sqlite:///{state_path}")
+    code = (f"import sys\nsys.path.insert(0, {os.path.dirname(APP_PATH)!r})\n"
+            f"import benchmark_RFP\nbenchmark_RFP.startup_probe({reruns})\n")
+
+    samples: Dict[str, List[float]] = {}
+    imports: Dict[str, Dict[str, float]] = {}
+    for _ in range(runs):
+        proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code], env=env,
+                              capture_output=True, text=True, check=True)
+        for phase, values in json.loads(proc.stdout.strip().splitlines()[-1]).items():
+            samples.setdefault(phase, []).extend(values)
+        for phase, modules in _import_times(proc.stderr).items():
+            totals = imports.setdefault(phase, {})
+            for name, ms in modules:
+                totals[name] = totals.get(name, 0.0) + ms / runs
+
+    results = []
+    for phase, values in samples.items():
+        modules = imports.get(phase, {})
+        if phase == "rerun":
+            # Imports during reruns are counted across all of them
+            modules = {name: ms / reruns for name, ms in modules.items()}
+        heaviest = sorted(modules.items(), key=lambda item: -item[1])[:5]
+        results.append({
+            "phase": phase,
+            "vendors": size,
+            "median_ms": round(statistics.median(values), 1),
+            "import_ms": round(sum(modules.values()), 1),
+            "heaviest_imports": {name: round(ms, 1) for name, ms in heaviest},
+        })
+    return results
+
+
+def _unslotted(cls):
+    """Copy of a slotted class that keeps attributes in a per-instance __dict__"""
+    skip = set(cls.__slots__) | {"__slots__", "__dict__", "__weakref__", "__getstate__", "__setstate__"}
+    namespace = {k: v for k, v in vars(cls).items() if k not in skip}
+    namespace["__module__"] = __name__
+    unslotted = type(f"Unslotted{cls.__name__}", cls.__bases__, namespace)
+    # Importable by name so instances pickle like the original class
+    globals()[unslotted.__name__] = unslotted
+    return unslotted
+
+
+def bench_profile_memory(count: int = 100000, seed: int = 0) -> Dict:
+    """Bytes per vendor for store-attached profiles, slotted vs __dict__ based"""
+    import gc
+    import pickle
+    import tracemalloc
+
+    import app_RFP as app
+
+    rng = random.Random(seed)
+    services = app.ServiceType.get_all()
+    specs = []
+    for i in range(count):
+        consolidated = rng.random() < 0.3
+        specs.append((f"VND-MEM-{i:06d}", f"Bench Vendor {i % 500:03d}",
+                      app.ServiceModel.CONSOLIDATED if consolidated else app.ServiceModel.STANDALONE,
+                      services if consolidated else [rng.choice(services)],
+                      {c: rng.uniform(50, 100) for c in CRITERIA}))
+
+    def build(cls):
+        store = app.new_vendor_store()
+        for vendor_id, name, model, offered, scores in specs:
+            vendor = cls(vendor_id, name, model)
+            for service in offered:
+                vendor.add_service(service)
+            vendor.certifications = rng.sample(app.CERTIFICATIONS, 2)
+            vendor.submit_proposal()
+            vendor.apply_evaluation(scores, sum(scores.values()) / len(scores), ["Technical Capability"], [])
+            store.add(vendor)
+        return store
+
+    def detached(cls):
+        profiles = []
+        for vendor_id, name, model, offered, _ in specs[:10000]:
+            vendor = cls(vendor_id, name, model)
+            vendor.services_offered = offered
+            profiles.append(vendor)
+        return profiles
+
+    results = {"vendors": count}
+    for label, cls in (("dict", _unslotted(app.VendorProfile)), ("slots", app.VendorProfile)):
+        gc.collect()
+        tracemalloc.start()
+        store = build(cls)
+        results[f"{label}_bytes_per_vendor"] = round(tracemalloc.get_traced_memory()[0] / count)
+        tracemalloc.stop()
+        del store
+
+        profiles = detached(cls)
+        start = time.perf_counter()
+        payload = pickle.dumps(profiles, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.loads(payload)
+        results[f"{label}_pickle_roundtrip_us"] = round((time.perf_counter() - start) / len(profiles) * 1e6, 2)
+        results[f"{label}_pickle_bytes"] = round(len(payload) / len(profiles))
+    results["saved_pct"] = round(100 * (1 - results["slots_bytes_per_vendor"] /
+                                        results["dict_bytes_per_vendor"]), 1)
+    return results
+
+
+def check_session_isolation() -> List[str]:
+    """Two sessions in one process: shared templates, private stage state
+
+    Session A starts and advances a stage through its widgets and edits
+    another stage's documents; session B must still see pending stages over
+    the very same template objects, and the templates must be unchanged and
+    refuse writes. Returns the violations found (empty when isolated).
+    """
+    import rfp_templates as templates
+    from streamlit.testing.v1 import AppTest
+
+    os.environ["RFP_STATE_URL"] = "session://"
+    before = (templates.WORKFLOW_TEMPLATE, dict(templates.STAGE_DEFAULTS),
+              {c: dict(v) for c, v in templates.EVALUATION_CRITERIA.items()},
+              dict(templates.REQUIREMENT_CATALOG))
+    first = _run_in_tab(_app_test(), WORKFLOW_TAB)
+    second = _run_in_tab(AppTest.from_file(APP_PATH, default_timeout=300), WORKFLOW_TAB)
+
+    first.button(key="start_requirements_0").click().run()
+    first.slider(key="progress_requirements_0").set_value(60).run()
+    if first.exception:
+        raise RuntimeError(first.exception)
+    first.session_state["workflow_stages"]["rfp_publication"].documents = {"rfp": {"name": "a.pdf"}}
+    _run_in_tab(second, WORKFLOW_TAB)
+    mine, theirs = first.session_state["workflow_stages"], second.session_state["workflow_stages"]
+
+    violations = []
+    for template in templates.WORKFLOW_TEMPLATE:
+        a, b = mine[template.stage_id], theirs[template.stage_id]
+        if a is b:
+            violations.append(f"{template.stage_id}: both sessions hold the same stage object")
+        if a.template is not template or b.template is not template:
+            violations.append(f"{template.stage_id}: stage does not reference the shared template")
+        if b.overlaid or b.status != "pending" or b.progress or b.documents:
+            violations.append(f"{template.stage_id}: session B sees {b.to_state()}")
+
+    # Then B changes the same stage, and each session must keep its own value
+    second.button(key="start_requirements_0").click().run()
+    second.slider(key="progress_requirements_0").set_value(30).run()
+    if second.exception:
+        raise RuntimeError(second.exception)
+    for label, stages, progress in (("A", mine, 60), ("B", theirs, 30)):
+        if stages["requirements"].status != "active" or stages["requirements"].progress != progress:
+            violations.append(f"session {label} lost its own change: {stages['requirements'].to_state()}")
+    if theirs["rfp_publication"].documents:
+        violations.append("session B sees session A's stage documents")
+    if first.session_state["workflow_progress"] is second.session_state["workflow_progress"]:
+        violations.append("sessions share a workflow progress tracker")
+    after = (templates.WORKFLOW_TEMPLATE, dict(templates.STAGE_DEFAULTS),
+             {c: dict(v) for c, v in templates.EVALUATION_CRITERIA.items()},
+             dict(templates.REQUIREMENT_CATALOG))
+    if after != before:
+        violations.append("shared templates changed")
+    for label, write in (("criteria", lambda: templates.EVALUATION_CRITERIA.__setitem__("x", {})),
+                         ("weights", lambda: templates.CRITERIA_WEIGHTS.__setitem__("pricing_competitiveness", 1.0)),
+                         ("stage defaults", lambda: templates.STAGE_DEFAULTS["documents"].__setitem__("x", 1)),
+                         ("stage template", lambda: setattr(templates.WORKFLOW_TEMPLATE[0], "name", "x"))):
+        try:
+            write()
+            violations.append(f"{label} accepted a write")
+        except (TypeError, AttributeError):
+            pass
+    return violations
+
+
+# ========================================
+# END-TO-END SUITE
+# ========================================
+
+SUITE_SIZES = [10, 1000, 100000]
+# Machine-specific (absolute timings); created by --update-baseline, ignored by git
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+# Slowdowns and allocation growth under these absolute deltas are treated as noise
+MIN_DELTA_MS = 1.0
+MIN_DELTA_KB = 256.0
+MIN_DELTA_RSS_MB = 32.0
+# Render functions main() calls directly, in page order; the others run inside them
+RENDER_CASES = ["render_rfp_switcher", "render_header", "render_test_controls", "render_document_upload",
+                "render_workflow_management", "render_vendor_dashboard", "render_evaluation_charts",
+                "render_sensitivity_analysis", "render_evaluation_export", "render_ai_scoring_stats",
+                "render_requirement_coverage", "render_vendor_selection", "render_portfolio_tab",
+                "render_job_status", "render_sidebar_summary"]
+NESTED_RENDERS = {"render_scale_generator": "render_test_controls",
+                  "render_cache_stats": "render_document_upload",
+                  "render_vendor_import": "render_workflow_management",
+                  "render_bulk_submission": "render_workflow_management",
+                  "render_vendor_table": "render_vendor_dashboard",
+                  "render_vendor_stats": "render_vendor_dashboard",
+                  "render_vendor_row": "render_vendor_dashboard",
+                  "render_workflow_overview": "render_workflow_management",
+                  "render_workflow_schedule": "render_workflow_management",
+                  "render_workflow_stage": "render_workflow_management",
+                  "render_award_recommendation": "render_vendor_selection"}
+# Tab bodies made only of cases timed above
+COMPOSITE_RENDERS = {"render_workflow_tab": ["render_document_upload", "render_workflow_management"],
+                     "render_evaluation_tab": ["render_evaluation_charts", "render_sensitivity_analysis",
+                                               "render_evaluation_export", "render_ai_scoring_stats",
+                                               "render_requirement_coverage"]}
+
+
+def suite_page():
+    """Runs inside AppTest: times each app entry point once per script run
+
+    Results accumulate in session state across reruns; the state load is
+    only timed on the first. With bench_trace set, tracemalloc records peak
+    and net allocations instead of wall time.
+    """
+    import tracemalloc
+
+    import streamlit as st
+
+    import app_RFP as app
+
+    app.init_session_state()
+    trace = st.session_state.get("bench_trace", False)
+    results = st.session_state.setdefault("bench_results", {})
+
+    def measure(case, fn, *args):
+        entry = results.setdefault(case, {"ms": []})
+        if trace:
+            tracemalloc.start()
+            value = fn(*args)
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            entry["alloc_peak_kb"], entry["alloc_net_kb"] = peak / 1e3, current / 1e3
+        else:
+            start = time.perf_counter()
+            value = fn(*args)
+            entry["ms"].append((time.perf_counter() - start) * 1000)
+        return value
+
+    cold = "load_state" not in results
+    if cold or trace:
+        measure("load_state", app.sync_persisted_state)
+    else:
+        app.sync_persisted_state()
+    manager = measure("manager_init", app.RFPManager)
+    measure("initialize_workflow", manager._initialize_workflow)
+    measure("workflow_progress", manager.get_workflow_progress)
+
+    store = st.session_state.vendors
+    submitted = store.rows(status="Submitted")
+    if len(submitted):
+        measure("evaluate_vendor", manager.evaluate_vendor, store.ids(submitted[:1])[0])
+    measure("selection_ranking", app.shortlist, store, 3)
+    measure("selection_ranking_certified", app.shortlist, store, 3, "name", ["TAPA", "ISO 9001"])
+
+    for name in RENDER_CASES:
+        fn = getattr(app, name)
+        params = inspect.signature(fn).parameters
+        measure(name, fn, *([manager] if "manager" in params else []))
+
+
+def _suite_app(timeout: int = 600):
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    st.cache_resource.clear()
+    _share_script_cache()
+    script = (f"import sys\nsys.path.insert(0, {os.path.dirname(APP_PATH)!r})\n"
+              f"import benchmark_RFP\nbenchmark_RFP.suite_page()\n")
+    return AppTest.from_string(script, default_timeout=timeout)
+
+
+def _peak_rss_mb() -> float:
+    import resource
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def uncovered_renders() -> List[str]:
+    """render_* functions in the app that the suite neither calls nor reaches through a parent"""
+    import app_RFP as app
+
+    defined = {name for name, fn in vars(app).items()
+               if name.startswith("render_") and inspect.isfunction(fn)}
+    return sorted(defined - set(RENDER_CASES) - set(NESTED_RENDERS) - set(COMPOSITE_RENDERS))
+
+
+def run_suite(sizes: Sequence[int] = SUITE_SIZES, repeats: int = 5, seed: int = 0) -> Dict:
+    """Wall time, allocations and peak RSS per case and vendor count"""
+    import platform
+
+    results = []
+    rss = {}
+    for size in sizes:
+        workdir = tempfile.mkdtemp(prefix="rfp_bench_suite_")
+        state_path = os.path.join(workdir, "state.db")
+        seed_vendor_state(state_path, size, seed, mix={"Registered": 0.2, "Submitted": 0.3, "Evaluated": 0.5})
+        os.environ["RFP_STATE_URL"] = f"sqlite:///{state_path}"
+
+        at = _suite_app()
+        for _ in range(repeats):
+            at.run()
+            if at.exception:
+                raise RuntimeError(at.exception)
+        # Allocations come from a fresh session so the cold state load is traced too
+        traced = _suite_app()
+        traced.session_state["bench_trace"] = True
+        traced.run()
+        if traced.exception:
+            raise RuntimeError(traced.exception)
+        allocations = traced.session_state["bench_results"]
+        for case, entry in at.session_state["bench_results"].items():
+            timings = entry["ms"]
+            entry = allocations.get(case, {})
+            results.append({
+                "case": case,
+                "vendors": size,
+                "median_ms": round(statistics.median(timings), 3),
+                "min_ms": round(min(timings), 3),
+                "runs": len(timings),
+                "alloc_peak_kb": round(entry.get("alloc_peak_kb", 0.0), 1),
+                "alloc_net_kb": round(entry.get("alloc_net_kb", 0.0), 1),
+            })
+
+        app = _app_test()
+        start = time.perf_counter()
+        app.run()
+        first = time.perf_counter() - start
+        reruns = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            app.run()
+            reruns.append((time.perf_counter() - start) * 1000)
+        if app.exception:
+            raise RuntimeError(app.exception)
+        results.append({"case": "full_app_first_run", "vendors": size, "median_ms": round(first * 1000, 3),
+                        "min_ms": round(first * 1000, 3), "runs": 1})
+        results.append({"case": "full_app_rerun", "vendors": size,
+                        "median_ms": round(statistics.median(reruns), 3),
+                        "min_ms": round(min(reruns), 3), "runs": len(reruns)})
+        for interaction, timings in interaction_timings(11, repeats).items():
+            results.append({"case": f"interaction_{interaction}", "vendors": size,
+                            "median_ms": round(statistics.median(timings), 3),
+                            "min_ms": round(min(timings), 3), "runs": len(timings)})
+        # Process-wide high-water mark, so sizes run in ascending order
+        rss[str(size)] = round(_peak_rss_mb(), 1)
+    isolation = check_session_isolation()
+
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "sizes": list(sizes),
+            "repeats": repeats,
+            "uncovered_renders": uncovered_renders(),
+            "isolation_violations": isolation,
+        },
+        "results": results,
+        "peak_rss_mb": rss,
+    }
+
+
+def compare_to_baseline(report: Dict, baseline: Dict, time_tolerance: float = 0.25,
+                        alloc_tolerance: float = 0.10, rss_tolerance: float = 0.20) -> List[str]:
+    """Regressions of report against baseline; cases missing from either side are skipped"""
+    regressions = []
+    previous = {(r["case"], r["vendors"]): r for r in baseline.get("results", [])}
+    for row in report["results"]:
+        base = previous.get((row["case"], row["vendors"]))
+        if base is None:
+            continue
+        label = f"{row['case']} @ {row['vendors']:,}"
+        if (row["median_ms"] > base["median_ms"] * (1 + time_tolerance)
+                and row["median_ms"] - base["median_ms"] > MIN_DELTA_MS):
+            regressions.append(f"{label}: {base['median_ms']:.1f} -> {row['median_ms']:.1f} ms")
+        if "alloc_peak_kb" in row and "alloc_peak_kb" in base:
+            if (row["alloc_peak_kb"] > base["alloc_peak_kb"] * (1 + alloc_tolerance)
+                    and row["alloc_peak_kb"] - base["alloc_peak_kb"] > MIN_DELTA_KB):
+                regressions.append(f"{label}: peak allocations {base['alloc_peak_kb']:.0f} -> "
+                                   f"{row['alloc_peak_kb']:.0f} KB")
+    for size, mb in report.get("peak_rss_mb", {}).items():
+        base_mb = baseline.get("peak_rss_mb", {}).get(size)
+        if base_mb is not None and mb > base_mb * (1 + rss_tolerance) and mb - base_mb > MIN_DELTA_RSS_MB:
+            regressions.append(f"peak RSS @ {int(size):,}: {base_mb:.0f} -> {mb:.0f} MB")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000])
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--charts", action="store_true", help="benchmark Evaluation chart views instead")
+    parser.add_argument("--memory", action="store_true", help="bytes per vendor profile at the largest size")
+    parser.add_argument("--startup", action="store_true",
+                        help="cold start and per-rerun import time in fresh interpreters instead")
+    parser.add_argument("--interactions", action="store_true",
+                        help="latency of single interactions (stage slider, Evaluate) instead")
+    parser.add_argument("--stages", type=int, nargs="+", default=[11, 110],
+                        help="workflow stage counts for --interactions")
+    parser.add_argument("--isolation", action="store_true",
+                        help="check that sessions share templates but never each other's stage changes")
+    parser.add_argument("--suite", action="store_true",
+                        help="end-to-end suite: workflow, scoring, selection and every render function")
+    parser.add_argument("--output", default="benchmark_results.json", help="suite report path")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="suite baseline to compare against")
+    parser.add_argument("--update-baseline", action="store_true", help="store this suite run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed suite slowdown (fraction)")
+    args = parser.parse_args()
+    if args.suite:
+        sizes = args.sizes if "--sizes" in sys.argv else SUITE_SIZES
+        report = run_suite(sizes, args.reruns)
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"Wrote {len(report['results'])} results to {args.output}")
+        if report["meta"]["uncovered_renders"]:
+            print("Not covered by the suite:", ", ".join(report["meta"]["uncovered_renders"]))
+        for line in report["meta"]["isolation_violations"]:
+            print("ISOLATION", line)
+        if report["meta"]["isolation_violations"]:
+            sys.exit(1)
+        if args.update_baseline:
+            with open(args.baseline, "w") as handle:
+                json.dump(report, handle, indent=2)
+            print(f"Baseline updated: {args.baseline}")
+            return
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}; run with --update-baseline to create one")
+            return
+        with open(args.baseline) as handle:
+            regressions = compare_to_baseline(report, json.load(handle), args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line)
+        if regressions:
+            sys.exit(1)
+        print("No regressions against", args.baseline)
+        return
+    if args.isolation:
+        violations = check_session_isolation()
+        for line in violations:
+            print("ISOLATION", line)
+        if violations:
+            sys.exit(1)
+        print("Sessions are isolated")
+        return
+    if args.memory:
+        print(json.dumps(bench_profile_memory(max(args.sizes))))
+        return
+    if args.startup:
+        size = args.sizes[0] if "--sizes" in sys.argv else 1000
+        for row in bench_startup(size, reruns=args.reruns):
+            print(json.dumps(row, ensure_ascii=False))
+        return
+    if args.interactions:
+        for row in bench_interactions(args.sizes, args.stages, args.reruns):
+            print(json.dumps(row))
+        return
+    bench = bench_evaluation_charts if args.charts else bench_vendor_dashboard
+    for row in bench(args.sizes, args.reruns):
+        print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Incrementally maintained aggregates for dashboard metrics and workflow progress
+Counts, score sums and progress totals are updated as vendors and workflow
+stages change, so rendering reads precomputed values. Consistency-check mode
+verifies every read against a full recompute.
+"""
+
+import os
+from typing import Dict, Iterable, List
+
+# Enable with RFP_AGGREGATE_CHECK=1 or by setting the `check` flag on an instance
+CONSISTENCY_CHECK = os.environ.get("RFP_AGGREGATE_CHECK", "") == "1"
+
+_TOLERANCE = 1e-6
+
+
+class AggregateMismatchError(RuntimeError):
+    """Incremental aggregate disagrees with a full recompute"""
+
+
+class VendorAggregates:
+    """Running vendor counts and overall-score sums per status"""
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+        self.score_sums: Dict[str, float] = {}
+        self.check = CONSISTENCY_CHECK
+
+    def add(self, status: str, overall_score: float):
+        self.counts[status] = self.counts.get(status, 0) + 1
+        self.score_sums[status] = self.score_sums.get(status, 0.0) + overall_score
+
+    def add_many(self, status: str, count: int, score_sum: float):
+        self.counts[status] = self.counts.get(status, 0) + count
+        self.score_sums[status] = self.score_sums.get(status, 0.0) + score_sum
+
+    def remove(self, status: str, overall_score: float):
+        self.counts[status] -= 1
+        self.score_sums[status] -= overall_score
+        if self.counts[status] == 0:
+            # Reset to shed accumulated floating point error
+            self.score_sums[status] = 0.0
+
+    def move(self, old_status: str, new_status: str, overall_score: float):
+        self.remove(old_status, overall_score)
+        self.add(new_status, overall_score)
+
+    def rescore(self, status: str, old_score: float, new_score: float):
+        self.score_sums[status] = self.score_sums.get(status, 0.0) + (new_score - old_score)
+
+    def count(self, status: str) -> int:
+        return self.counts.get(status, 0)
+
+    def mean_score(self, status: str) -> float:
+        count = self.counts.get(status, 0)
+        return self.score_sums[status] / count if count else 0.0
+
+    def verify(self, statuses: Iterable[str], scores: Iterable[float]) -> List[str]:
+        """Compare against a full recompute, returns a list of mismatches"""
+        counts: Dict[str, int] = {}
+        sums: Dict[str, float] = {}
+        for status, score in zip(statuses, scores):
+            counts[status] = counts.get(status, 0) + 1
+            sums[status] = sums.get(status, 0.0) + score
+
+        mismatches = []
+        for status in set(counts) | set(self.counts):
+            expected_count = counts.get(status, 0)
+            if self.counts.get(status, 0) != expected_count:
+                mismatches.append(f"count[{status}]: {self.counts.get(status, 0)} != {expected_count}")
+            expected_sum = sums.get(status, 0.0)
+            actual_sum = self.score_sums.get(status, 0.0)
+            if abs(actual_sum - expected_sum) > _TOLERANCE * max(1.0, abs(expected_sum)):
+                mismatches.append(f"score_sum[{status}]: {actual_sum} != {expected_sum}")
+        return mismatches
+
+
+class WorkflowProgress:
+    """Running completed-stage count and active progress for a workflow"""
+    def __init__(self, stages: Dict):
+        self.stages = stages
+        self.total = 0
+        self.completed = 0
+        self.active_progress = 0
+        self.check = CONSISTENCY_CHECK
+        for stage in stages.values():
+            self.total += 1
+            self._apply(stage.status, stage.progress, 1)
+            stage._tracker = self
+
+    def _apply(self, status: str, progress: int, sign: int):
+        if status == "complete":
+            self.completed += sign
+        elif status == "active":
+            self.active_progress += sign * progress
+
+    def stage_changed(self, old_status: str, old_progress: int,
+                      new_status: str, new_progress: int):
+        """Called by a stage before its status or progress changes"""
+        self._apply(old_status, old_progress, -1)
+        self._apply(new_status, new_progress, 1)
+
+    def percent(self) -> int:
+        if self.check:
+            mismatches = self.verify()
+            if mismatches:
+                raise AggregateMismatchError("; ".join(mismatches))
+        if not self.total:
+            return 0
+        return int(((self.completed + self.active_progress / 100) / self.total) * 100)
+
+    def verify(self) -> List[str]:
+        """Compare against a full recompute, returns a list of mismatches"""
+        stages = list(self.stages.values())
+        completed = sum(1 for s in stages if s.status == "complete")
+        active_progress = sum(s.progress for s in stages if s.status == "active")
+
+        mismatches = []
+        if len(stages) != self.total:
+            mismatches.append(f"total: {self.total} != {len(stages)}")
+        if completed != self.completed:
+            mismatches.append(f"completed: {self.completed} != {completed}")
+        if active_progress != self.active_progress:
+            mismatches.append(f"active_progress: {self.active_progress} != {active_progress}")
+        return mismatches
@@ -0,0 +1,410 @@
+"""
+LLM-assisted proposal scoring
+Proposal chunks are scored per evaluation criterion through an asyncio
+Anthropic client: requests run with bounded concurrency behind request and
+token rate buckets, retry with exponential backoff, and every (criterion,
+chunk) result is kept in a persistent cache so identical text is never
+scored twice. A local stub server stands in for the API offline.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from rfp_cache import DiskCache, user_cache_dir
+
+AI_MODEL = os.environ.get("RFP_AI_MODEL", "claude-haiku-4-5")
+AI_BASE_URL = os.environ.get("RFP_AI_BASE_URL") or None
+AI_CONCURRENCY = int(os.environ.get("RFP_AI_CONCURRENCY", "8"))
+AI_REQUESTS_PER_MIN = float(os.environ.get("RFP_AI_RPM", "50"))
+AI_TOKENS_PER_MIN = float(os.environ.get("RFP_AI_TPM", "40000"))
+AI_CACHE_DIR = os.environ.get("RFP_AI_CACHE_DIR") or user_cache_dir("ai_scores")
+AI_CACHE_MAX_BYTES = int(os.environ.get("RFP_AI_CACHE_MAX_MB", "256")) * 1024 * 1024
+
+# Chunks are packed into one request per criterion up to this many characters
+BATCH_CHARS = 16000
+MAX_OUTPUT_TOKENS = 1024
+MAX_ATTEMPTS = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+# Bump when the prompt changes so cached answers from the old prompt are ignored
+PROMPT_VERSION = "1"
+
+SYSTEM_PROMPT = (
+    "You evaluate vendor proposals for a logistics services RFP. "
+    "Score each numbered proposal excerpt against one evaluation criterion. "
+    "Reply with JSON only: a list of objects "
+    '{"chunk": <number>, "relevant": <true|false>, "score": <0-100>}, one per excerpt. '
+    "Mark an excerpt not relevant when it says nothing about the criterion."
+)
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+def is_available() -> bool:
+    """AI scoring needs an API key or a stand-in server"""
+    return bool(AI_BASE_URL or os.environ.get("ANTHROPIC_API_KEY"))
+
+
+class TokenBucket:
+    """Token bucket shared across threads and event loops
+
+    Callers reserve tokens under a lock and then sleep outside it until their
+    reservation is covered, so waiters are served in arrival order.
+    """
+    def __init__(self, rate_per_sec: float, capacity: float):
+        self.rate = rate_per_sec
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1.0) -> float:
+        """Take tokens now, returns seconds to wait before using them"""
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self, amount: float = 1.0):
+        delay = self.reserve(amount)
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class ScoringStats:
+    """Counters for one scoring run"""
+    def __init__(self):
+        self.vendors = 0
+        self.chunks = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.requests = 0
+        self.retries = 0
+        self.failures = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.seconds = 0.0
+
+    def as_dict(self) -> Dict:
+        lookups = self.cache_hits + self.cache_misses
+        return {
+            "vendors": self.vendors,
+            "chunks": self.chunks,
+            "requests": self.requests,
+            "retries": self.retries,
+            "failures": self.failures,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "hit_rate": round(self.cache_hits / lookups, 3) if lookups else 0.0,
+            "seconds": round(self.seconds, 3),
+            "vendors_per_min": round(self.vendors * 60 / self.seconds, 1) if self.seconds else None,
+        }
+
+
+def _parse_scores(text: str, count: int) -> Dict[int, Optional[float]]:
+    """Chunk number -> score (None when not relevant) from a model reply"""
+    match = re.search(r"\[.*\]", text, re.DOTALL)
+    if not match:
+        raise ValueError("no JSON list in reply")
+    results = {}
+    for item in json.loads(match.group(0)):
+        chunk = int(item["chunk"])
+        if 1 <= chunk <= count:
+            relevant = item.get("relevant", True)
+            results[chunk - 1] = min(100.0, max(0.0, float(item["score"]))) if relevant else None
+    if len(results) != count:
+        raise ValueError(f"reply covers {len(results)} of {count} excerpts")
+    return results
+
+
+class AIScorer:
+    """Scores vendor proposal text per evaluation criterion with an LLM"""
+    def __init__(self, criteria: Dict[str, Dict], model: str = AI_MODEL,
+                 base_url: Optional[str] = None, api_key: Optional[str] = None,
+                 concurrency: int = AI_CONCURRENCY,
+                 requests_per_min: float = AI_REQUESTS_PER_MIN,
+                 tokens_per_min: float = AI_TOKENS_PER_MIN,
+                 cache: Optional[DiskCache] = None):
+        self.criteria = criteria
+        self.model = model
+        self.base_url = base_url or AI_BASE_URL
+        self.api_key = api_key
+        self.concurrency = concurrency
+        self.request_bucket = TokenBucket(requests_per_min / 60, max(1.0, concurrency))
+        self.token_bucket = TokenBucket(tokens_per_min / 60, tokens_per_min / 6)
+        self.cache = cache if cache is not None else DiskCache(AI_CACHE_DIR, AI_CACHE_MAX_BYTES)
+
+    def _cache_key(self, criterion: str, text: str) -> str:
+        description = self.criteria[criterion].get("description", "")
+        payload = f"{PROMPT_VERSION}\0{self.model}\0{criterion}\0{description}\0{text}"
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _prompt(self, criterion: str, texts: Sequence[str]) -> str:
+        description = self.criteria[criterion].get("description", "")
+        excerpts = "\n\n".join(f"<excerpt {i}>\n{text}\n</excerpt {i}>" for i, text in enumerate(texts, 1))
+        return (f"Criterion: {criterion.replace('_', ' ')} ({description})\n\n"
+                f"{excerpts}\n\nScore all {len(texts)} excerpts.")
+
+    @staticmethod
+    def _batches(items: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+        """Pack (cache_key, text) items into batches of at most BATCH_CHARS"""
+        batches, current, size = [], [], 0
+        for key, text in items:
+            if current and size + len(text) > BATCH_CHARS:
+                batches.append(current)
+                current, size = [], 0
+            current.append((key, text))
+            size += len(text)
+        if current:
+            batches.append(current)
+        return batches
+
+    async def _request(self, client, semaphore: asyncio.Semaphore, criterion: str,
+                       texts: Sequence[str], stats: ScoringStats) -> Dict[int, Optional[float]]:
+        import anthropic
+
+        prompt = self._prompt(criterion, texts)
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            await self.request_bucket.acquire()
+            await self.token_bucket.acquire(estimate_tokens(SYSTEM_PROMPT + prompt) + MAX_OUTPUT_TOKENS)
+            retry_after = None
+            try:
+                async with semaphore:
+                    stats.requests += 1
+                    message = await client.messages.create(
+                        model=self.model, max_tokens=MAX_OUTPUT_TOKENS, system=SYSTEM_PROMPT,
+                        messages=[{"role": "user", "content": prompt}],
+                    )
+                stats.input_tokens += message.usage.input_tokens
+                stats.output_tokens += message.usage.output_tokens
+                reply = "".join(block.text for block in message.content if block.type == "text")
+                return _parse_scores(reply, len(texts))
+            except (anthropic.RateLimitError, anthropic.InternalServerError) as exc:
+                retry_after = exc.response.headers.get("retry-after")
+            except anthropic.APIStatusError as exc:
+                if exc.status_code not in (408, 409, 529):
+                    raise
+            except (anthropic.APIConnectionError, ValueError):
+                pass
+            if attempt == MAX_ATTEMPTS:
+                break
+            stats.retries += 1
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempt - 1))
+            if retry_after:
+                try:
+                    delay = max(delay, float(retry_after))
+                except ValueError:
+                    pass
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+        stats.failures += 1
+        return {}
+
+    async def _score(self, vendor_chunks: Dict[str, Sequence[str]],
+                     on_progress: Optional[Callable[[int, int], None]]
+                     ) -> Tuple[Dict[str, Dict[str, float]], ScoringStats]:
+        from anthropic import AsyncAnthropic
+
+        stats = ScoringStats()
+        stats.vendors = len(vendor_chunks)
+        start = time.perf_counter()
+
+        # Resolve cached (criterion, chunk) scores first; only misses go to the API
+        chunk_scores: Dict[str, Optional[float]] = {}
+        pending: Dict[str, Dict[str, str]] = {criterion: {} for criterion in self.criteria}
+        for texts in vendor_chunks.values():
+            for text in texts:
+                stats.chunks += 1
+                for criterion in self.criteria:
+                    key = self._cache_key(criterion, text)
+                    if key in chunk_scores or key in pending[criterion]:
+                        stats.cache_hits += 1
+                        continue
+                    cached = self.cache.get(key)
+                    if cached is not None:
+                        stats.cache_hits += 1
+                        chunk_scores[key] = cached["score"]
+                    else:
+                        stats.cache_misses += 1
+                        pending[criterion][key] = text
+
+        jobs = [(criterion, batch) for criterion, items in pending.items()
+                for batch in self._batches(list(items.items()))]
+        if jobs:
+            semaphore = asyncio.Semaphore(self.concurrency)
+            client_kwargs = {"max_retries": 0, "base_url": self.base_url}
+            if self.api_key or self.base_url:
+                client_kwargs["api_key"] = self.api_key or "stub"
+            async with AsyncAnthropic(**client_kwargs) as client:
+                async def run(criterion, batch):
+                    results = await self._request(client, semaphore, criterion,
+                                                  [text for _, text in batch], stats)
+                    for i, (key, _) in enumerate(batch):
+                        if i in results:
+                            chunk_scores[key] = results[i]
+                            self.cache.put(key, {"score": results[i]})
+                    return len(batch)
+
+                done = 0
+                for finished in asyncio.as_completed([run(c, b) for c, b in jobs]):
+                    done += await finished
+                    if on_progress:
+                        on_progress(done, stats.cache_misses)
+
+        scores: Dict[str, Dict[str, float]] = {}
+        for vendor_id, texts in vendor_chunks.items():
+            vendor_scores = {}
+            for criterion in self.criteria:
+                relevant = [chunk_scores.get(self._cache_key(criterion, text)) for text in texts]
+                relevant = [s for s in relevant if s is not None]
+                if relevant:
+                    vendor_scores[criterion] = sum(relevant) / len(relevant)
+            scores[vendor_id] = vendor_scores
+        stats.seconds = time.perf_counter() - start
+        return scores, stats
+
+    def score_vendors(self, vendor_chunks: Dict[str, Sequence[str]],
+                      on_progress: Optional[Callable[[int, int], None]] = None
+                      ) -> Tuple[Dict[str, Dict[str, float]], ScoringStats]:
+        """vendor_id -> {criterion: mean score over relevant chunks}, plus this call's stats
+
+        Criteria no chunk speaks to are left out so callers keep their own score.
+        The scorer is shared across sessions, so stats are returned per call
+        rather than kept on the scorer.
+        """
+        return asyncio.run(self._score(vendor_chunks, on_progress))
+
+
+# ========================================
+# OFFLINE STUB SERVER
+# ========================================
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, body: Dict, headers: Optional[Dict] = None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        server: "StubAnthropicServer" = self.server.stub
+        request = json.loads(self.rfile.read(int(self.headers.get("content-length", 0))))
+        server.requests += 1
+        if server.latency:
+            time.sleep(server.latency)
+        if server.rng.random() < server.error_rate:
+            server.errors += 1
+            self._reply(429, {"type": "error", "error": {"type": "rate_limit_error", "message": "stub"}},
+                        {"retry-after": "0"})
+            return
+
+        prompt = request["messages"][0]["content"]
+        criterion = prompt.split("\n", 1)[0]
+        excerpts = re.findall(r"<excerpt (\d+)>\n(.*?)\n</excerpt \1>", prompt, re.DOTALL)
+        results = []
+        for number, text in excerpts:
+            # Deterministic pseudo-score from the excerpt and criterion
+            digest = hashlib.sha256(f"{criterion}\0{text}".encode()).digest()
+            results.append({"chunk": int(number), "relevant": digest[0] % 5 != 0,
+                            "score": 55 + digest[1] % 45})
+        text = json.dumps(results)
+        self._reply(200, {
+            "id": f"msg_stub_{server.requests}",
+            "type": "message",
+            "role": "assistant",
+            "model": request.get("model", "stub"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": estimate_tokens(prompt), "output_tokens": estimate_tokens(text)},
+        })
+
+
+class StubAnthropicServer:
+    """Local Messages API stand-in with configurable latency and 429 rate"""
+    def __init__(self, latency: float = 0.05, error_rate: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubAnthropicServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+# ========================================
+# BENCHMARK
+# ========================================
+
+def benchmark(criteria: Dict[str, Dict], vendors: int = 40, chunks_per_vendor: int = 12,
+              latency: float = 0.05, error_rate: float = 0.05,
+              requests_per_min: float = 6000, concurrency: int = 16) -> List[Dict]:
+    """Score synthetic proposals against the stub server, cold then warm cache"""
+    rng = random.Random(0)
+    words = "warehouse capacity uptime security certification pricing rate innovation references".split()
+    vendor_chunks = {
+        f"V{v}": [" ".join(rng.choice(words) for _ in range(600)) for _ in range(chunks_per_vendor)]
+        for v in range(vendors)
+    }
+    cache_dir = tempfile.mkdtemp(prefix="rfp_ai_bench_")
+    results = []
+    with StubAnthropicServer(latency=latency, error_rate=error_rate) as server:
+        scorer = AIScorer(criteria, base_url=server.url, concurrency=concurrency,
+                          requests_per_min=requests_per_min, tokens_per_min=requests_per_min * 5000,
+                          cache=DiskCache(cache_dir, AI_CACHE_MAX_BYTES))
+        for run in ("cold", "warm"):
+            _, stats = scorer.score_vendors(vendor_chunks)
+            results.append({"run": run, **stats.as_dict()})
+    return results
+
+
+if __name__ == "__main__":
+    sample_criteria = {
+        "technical_capability": {"weight": 0.25, "description": "Technology and infrastructure"},
+        "operational_excellence": {"weight": 0.20, "description": "Service quality and reliability"},
+        "pricing_competitiveness": {"weight": 0.20, "description": "Cost structure and value"},
+        "compliance_security": {"weight": 0.15, "description": "Certifications and security"},
+        "experience_references": {"weight": 0.10, "description": "Past performance"},
+        "innovation_flexibility": {"weight": 0.10, "description": "Innovation capabilities"},
+    }
+    for row in benchmark(sample_criteria):
+        print(row)
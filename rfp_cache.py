@@ -0,0 +1,166 @@
+"""
+Content-addressed on-disk caches
+DiskCache stores JSON values, compressed, under a hashed key with a
+cachetools LRU index bounded by total bytes; evicted entries are deleted
+from disk. Entries are data only and live in a directory private to the
+server's user, so a planted or corrupt file can at worst cost a miss.
+ExtractionCache keys document extraction results by the SHA-256 of the
+file bytes so re-uploading the same package skips parsing entirely.
+"""
+
+import hashlib
+import json
+import os
+import stat
+import threading
+import zlib
+from typing import Any, Dict, Optional
+
+from cachetools import LRUCache
+
+
+def user_cache_dir(name: str) -> str:
+    """Default location for a cache: under the user's cache directory, not a shared temp dir"""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "rfp", name)
+
+
+CACHE_DIR = os.environ.get("RFP_CACHE_DIR") or user_cache_dir("extraction")
+CACHE_MAX_BYTES = int(os.environ.get("RFP_CACHE_MAX_MB", "2048")) * 1024 * 1024
+HASH_BLOCK_SIZE = 1024 * 1024
+ENTRY_SUFFIX = ".json.z"
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file, read in fixed-size blocks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class _EvictingIndex(LRUCache):
+    """LRU index of key -> entry size that deletes entry files on eviction"""
+    def __init__(self, maxsize: int, on_evict):
+        super().__init__(maxsize, getsizeof=lambda size: size)
+        self._on_evict = on_evict
+
+    def popitem(self):
+        key, size = super().popitem()
+        self._on_evict(key, size)
+        return key, size
+
+
+def _private_dir(directory: str):
+    """Create directory as 0700, refusing one that other users could write to"""
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+    info = os.stat(directory)
+    if hasattr(os, "getuid") and (info.st_uid != os.getuid() or info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)):
+        raise PermissionError(f"Cache directory {directory} must be owned by this user and not "
+                              f"writable by group or others")
+
+
+class DiskCache:
+    """Size-bounded LRU cache of JSON values stored as files"""
+    def __init__(self, directory: str = CACHE_DIR, max_bytes: int = CACHE_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._index = _EvictingIndex(max_bytes, self._evict)
+        _private_dir(directory)
+        self._load_index()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], f"{key}{ENTRY_SUFFIX}")
+
+    def _load_index(self):
+        """Rebuild the LRU index from disk, oldest access first"""
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for filename in files:
+                if filename.endswith(ENTRY_SUFFIX):
+                    info = os.stat(os.path.join(root, filename))
+                    entries.append((info.st_atime, filename[:-len(ENTRY_SUFFIX)], info.st_size))
+        for _, key, size in sorted(entries):
+            self._store_index(key, size)
+
+    def _store_index(self, key: str, size: int) -> bool:
+        try:
+            self._index[key] = size
+            return True
+        except ValueError:
+            # Larger than the whole cache
+            return False
+
+    def _evict(self, key: str, size: int):
+        self.evictions += 1
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key not in self._index:
+                self.misses += 1
+                return None
+            self._index[key]  # mark as recently used
+        try:
+            with open(self._path(key), "rb") as handle:
+                value = json.loads(zlib.decompress(handle.read()))
+        except Exception:
+            # Unreadable, truncated or foreign entries are misses
+            with self._lock:
+                self._index.pop(key, None)
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return value
+
+    def put(self, key: str, value: Any):
+        data = zlib.compress(json.dumps(value, separators=(",", ":")).encode("utf-8"), 3)
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial entry
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._store_index(key, len(data))
+
+    def clear(self):
+        with self._lock:
+            while self._index:
+                self._index.popitem()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._index),
+                "bytes": self._index.currsize,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class ExtractionCache(DiskCache):
+    """Document extraction results keyed by file content hash"""
+
+    @staticmethod
+    def key_for(digest: str, variant: str = "") -> str:
+        """Combine the content hash with extraction settings that change output"""
+        if not variant:
+            return digest
+        return hashlib.sha256(f"{digest}:{variant}".encode()).hexdigest()
@@ -0,0 +1,268 @@
+"""
+Evaluation charts
+Plotly figures for the Evaluation tab, built once per version of the
+evaluated-vendor set and reused across reruns. Small sets render as named
+bars; larger ones switch to WebGL scatter by rank, and very large ones to
+stacked score histograms so the figure size stops growing with the data.
+"""
+
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import plotly.graph_objects as go
+from cachetools import LRUCache
+
+# Up to this many vendors get one labelled bar each
+BAR_LIMIT = 60
+# Up to this many vendors are drawn point by point with Scattergl
+WEBGL_LIMIT = 20000
+HISTOGRAM_BIN = 2.0
+# Vendors shown in the per-criterion breakdown and radar views
+BREAKDOWN_TOP = 20
+RADAR_TOP = 5
+FIGURE_CACHE_SIZE = 16
+
+MODEL_COLORS = {"Consolidated": "#3b82f6", "Standalone": "#10b981"}
+DEFAULT_COLOR = "#94a3b8"
+CRITERION_COLORS = ["#3b82f6", "#10b981", "#f59e0b", "#ef4444", "#8b5cf6", "#06b6d4",
+                    "#ec4899", "#84cc16"]
+
+VIEW_SCORES = "Score comparison"
+VIEW_BREAKDOWN = "Criteria breakdown"
+VIEW_RADAR = "Radar"
+VIEWS = (VIEW_SCORES, VIEW_BREAKDOWN, VIEW_RADAR)
+
+
+def criterion_label(criterion: str) -> str:
+    return criterion.replace("_", " ").title()
+
+
+class EvaluationChartData(NamedTuple):
+    """Evaluated vendors ordered by overall score (highest first)"""
+    names: np.ndarray
+    vendor_ids: List[str]
+    overall: np.ndarray
+    models: np.ndarray
+    scores: np.ndarray
+    criteria: List[str]
+
+    @classmethod
+    def from_store(cls, store, status: str = "Evaluated") -> "EvaluationChartData":
+        rows = store.rows(status=status)
+        frame = store.frame(rows)
+        order = np.argsort(-frame["overall_score"].to_numpy(), kind="stable")
+        rows = rows[order]
+        return cls(
+            names=frame["name"].to_numpy()[order],
+            vendor_ids=store.ids(rows),
+            overall=frame["overall_score"].to_numpy()[order],
+            models=frame["service_model"].to_numpy()[order],
+            scores=store.score_matrix(rows),
+            criteria=list(store.criteria),
+        )
+
+    def __len__(self) -> int:
+        return len(self.overall)
+
+    def model_groups(self) -> List[Tuple[str, np.ndarray]]:
+        return [(model, np.flatnonzero(self.models == model))
+                for model in sorted(set(self.models.tolist()))]
+
+
+# ========================================
+# FIGURE BUILDERS
+# ========================================
+
+def score_comparison_figure(data: EvaluationChartData) -> go.Figure:
+    """Overall scores; bars, WebGL points by rank or histograms depending on size"""
+    fig = go.Figure()
+    n = len(data)
+    if n <= BAR_LIMIT:
+        colors = [MODEL_COLORS.get(m, DEFAULT_COLOR) for m in data.models]
+        fig.add_trace(go.Bar(
+            x=[name[:20] for name in data.names],
+            y=data.overall,
+            marker_color=colors,
+            text=[f"{s:.1f}" for s in data.overall],
+            textposition="auto",
+        ))
+        fig.update_layout(xaxis_title="Vendors", yaxis_title="Overall Score", yaxis_range=[0, 100])
+    elif n <= WEBGL_LIMIT:
+        rank = np.arange(1, n + 1)
+        for model, idx in data.model_groups():
+            fig.add_trace(go.Scattergl(
+                x=rank[idx],
+                y=data.overall[idx],
+                mode="markers",
+                name=model,
+                marker=dict(color=MODEL_COLORS.get(model, DEFAULT_COLOR), size=4),
+                text=data.names[idx],
+                hovertemplate="%{text}<br>Rank %{x}<br>Score %{y:.1f}<extra></extra>",
+            ))
+        fig.update_layout(xaxis_title="Rank", yaxis_title="Overall Score", yaxis_range=[0, 100])
+    else:
+        edges = np.arange(0, 100 + HISTOGRAM_BIN, HISTOGRAM_BIN)
+        centers = (edges[:-1] + edges[1:]) / 2
+        for model, idx in data.model_groups():
+            counts, _ = np.histogram(data.overall[idx], bins=edges)
+            fig.add_trace(go.Bar(
+                x=centers,
+                y=counts,
+                width=HISTOGRAM_BIN,
+                name=model,
+                marker_color=MODEL_COLORS.get(model, DEFAULT_COLOR),
+            ))
+        fig.update_layout(barmode="stack", xaxis_title="Overall Score", yaxis_title="Vendors",
+                          xaxis_range=[0, 100])
+    fig.update_layout(title=f"Vendor Score Comparison ({n:,} evaluated)")
+    return fig
+
+
+def criteria_breakdown_figure(data: EvaluationChartData, weights: Dict[str, float],
+                              top: int = BREAKDOWN_TOP) -> go.Figure:
+    """Weighted criterion contributions stacked per vendor for the top vendors"""
+    shown = min(top, len(data))
+    labels = [name[:20] for name in data.names[:shown]]
+    scores = np.nan_to_num(data.scores[:shown])
+    means = np.nan_to_num(np.nanmean(data.scores, axis=0)) if len(data) else np.zeros(len(data.criteria))
+    if len(data) > shown:
+        labels.append("All evaluated (avg)")
+        scores = np.vstack([scores, means])
+
+    fig = go.Figure()
+    for j, criterion in enumerate(data.criteria):
+        weight = weights.get(criterion, 0.0)
+        fig.add_trace(go.Bar(
+            x=labels,
+            y=scores[:, j] * weight,
+            name=f"{criterion_label(criterion)} ({weight:.0%})",
+            marker_color=CRITERION_COLORS[j % len(CRITERION_COLORS)],
+            customdata=scores[:, j],
+            hovertemplate="%{x}<br>Score %{customdata:.1f}<br>Weighted %{y:.1f}<extra></extra>",
+        ))
+    fig.update_layout(
+        title=f"Weighted Criteria Breakdown (top {shown})",
+        barmode="stack",
+        xaxis_title="Vendors",
+        yaxis_title="Weighted Score",
+        yaxis_range=[0, 100],
+    )
+    return fig
+
+
+def radar_figure(data: EvaluationChartData, top: int = RADAR_TOP) -> go.Figure:
+    """Criterion profiles of the top vendors against the evaluated average"""
+    labels = [criterion_label(c) for c in data.criteria]
+    closed = labels + labels[:1]
+    fig = go.Figure()
+    if len(data):
+        means = np.nan_to_num(np.nanmean(data.scores, axis=0))
+        fig.add_trace(go.Scatterpolar(
+            r=np.append(means, means[:1]), theta=closed, name="All evaluated (avg)",
+            line=dict(color=DEFAULT_COLOR, dash="dash"),
+        ))
+    for i in range(min(top, len(data))):
+        values = np.nan_to_num(data.scores[i])
+        fig.add_trace(go.Scatterpolar(
+            r=np.append(values, values[:1]), theta=closed, name=data.names[i][:20],
+            fill="toself", opacity=0.6,
+        ))
+    fig.update_layout(
+        title=f"Criteria Profile (top {min(top, len(data))})",
+        polar=dict(radialaxis=dict(visible=True, range=[0, 100])),
+    )
+    return fig
+
+
+# ========================================
+# CACHE
+# ========================================
+
+class FigureCache:
+    """Chart data and figures keyed on a version stamp of the underlying vendors"""
+    def __init__(self, maxsize: int = FIGURE_CACHE_SIZE):
+        self._figures: LRUCache = LRUCache(maxsize)
+        self._data: Optional[Tuple[object, EvaluationChartData]] = None
+        self.hits = 0
+        self.misses = 0
+
+    def data(self, stamp, load: Callable[[], EvaluationChartData]) -> EvaluationChartData:
+        if self._data is None or self._data[0] != stamp:
+            self._data = (stamp, load())
+            self._figures.clear()
+        return self._data[1]
+
+    def figure(self, stamp, view: str, build: Callable[[], go.Figure]) -> go.Figure:
+        key = (stamp, view)
+        fig = self._figures.get(key)
+        if fig is None:
+            self.misses += 1
+            fig = build()
+            self._figures[key] = fig
+        else:
+            self.hits += 1
+        return fig
+
+    def evaluation_figure(self, store, view: str, weights: Dict[str, float]) -> go.Figure:
+        """Figure for one Evaluation tab view, rebuilt only when evaluated vendors change"""
+        stamp = store.status_version("Evaluated")
+        data = self.data(stamp, lambda: EvaluationChartData.from_store(store))
+        if view == VIEW_BREAKDOWN:
+            return self.figure(stamp, view, lambda: criteria_breakdown_figure(data, weights))
+        if view == VIEW_RADAR:
+            return self.figure(stamp, view, lambda: radar_figure(data))
+        return self.figure(stamp, view, lambda: score_comparison_figure(data))
+
+
+# ========================================
+# BENCHMARK
+# ========================================
+
+def _bench_store(count: int, criteria: Sequence[str], seed: int = 0):
+    from rfp_store import VendorStore
+
+    rng = np.random.default_rng(seed)
+    store = VendorStore(criteria, ["Warehouse Services"])
+    records = []
+    for i in range(count):
+        scores = {c: float(v) for c, v in zip(criteria, rng.uniform(50, 100, len(criteria)))}
+        records.append({
+            "vendor_id": f"VND-CHART-{i:06d}",
+            "name": f"Chart Vendor {i:06d}",
+            "status": "Evaluated",
+            "service_model": "Consolidated" if rng.random() < 0.3 else "Standalone",
+            "services_offered": ["Warehouse Services"],
+            "certifications": [],
+            "overall_score": float(np.mean(list(scores.values()))),
+            "scores": scores,
+            "details": {},
+        })
+    store.load_records(records)
+    return store
+
+
+def benchmark(count: int = 10000, repeats: int = 5) -> Dict:
+    """Cold build vs cached lookup per view, including Plotly JSON serialization"""
+    weights = {"technical_capability": 0.3, "operational_excellence": 0.25,
+               "pricing_competitiveness": 0.25, "compliance_security": 0.2}
+    store = _bench_store(count, list(weights))
+    cache = FigureCache()
+    results: Dict = {"vendors": count}
+    for view in VIEWS:
+        start = time.perf_counter()
+        cache.evaluation_figure(store, view, weights).to_json()
+        cold = time.perf_counter() - start
+        warm = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            cache.evaluation_figure(store, view, weights).to_json()
+            warm.append(time.perf_counter() - start)
+        results[view] = {"cold_ms": round(cold * 1000, 1),
+                         "cached_ms": round(sorted(warm)[len(warm) // 2] * 1000, 1)}
+    results["hits"], results["misses"] = cache.hits, cache.misses
+    return results
+
+
+if __name__ == "__main__":
+    print(benchmark())
@@ -0,0 +1,348 @@
+"""
+Evaluation package export
+Writes the evaluation workbook (rankings, weights and one sheet per service
+with per-criterion scores) with xlsxwriter in constant_memory mode, so rows
+are flushed to disk as they are written, then bundles it with the RFP
+documents and vendor proposal files into a ZIP archive on disk. Attachments
+are copied into the archive in fixed-size blocks straight from their spooled
+files, so memory stays flat however large the package gets.
+"""
+
+import json
+import os
+import re
+import time
+import uuid
+import zipfile
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from rfp_ingest import SPOOL_DIR
+
+EXPORT_DIR = os.path.join(SPOOL_DIR, "exports")
+WORKBOOK_NAME = "evaluation.xlsx"
+# Formats that are already compressed gain nothing from deflate
+STORED_EXTENSIONS = {".pdf", ".docx", ".docm", ".xlsx", ".xlsm", ".pptx", ".zip", ".png", ".jpg", ".jpeg"}
+COPY_BLOCK_SIZE = 1024 * 1024
+
+_SHEET_UNSAFE = re.compile(r"[\[\]:*?/\\]")
+_PATH_UNSAFE = re.compile(r"[^A-Za-z0-9._ ()-]+")
+
+
+def _sheet_name(name: str, used: set) -> str:
+    base = _SHEET_UNSAFE.sub("_", name)[:31] or "Sheet"
+    candidate, n = base, 2
+    while candidate.lower() in used:
+        suffix = f" ({n})"
+        candidate, n = base[:31 - len(suffix)] + suffix, n + 1
+    used.add(candidate.lower())
+    return candidate
+
+
+def _path_part(name: str) -> str:
+    return _PATH_UNSAFE.sub("_", name).strip(" .") or "file"
+
+
+class EvaluationSnapshot(NamedTuple):
+    """Evaluated vendors copied out of the store, ordered by overall score"""
+    vendor_ids: List[str]
+    names: List[str]
+    models: List[str]
+    services: List[List[str]]
+    overall: np.ndarray
+    scores: np.ndarray  # vendors x criteria
+    criteria: List[str]
+    weights: Dict[str, float]
+    service_names: List[str]
+
+    @classmethod
+    def from_store(cls, store, weights: Dict[str, float], status: str = "Evaluated") -> "EvaluationSnapshot":
+        """Copy the columns the export needs, so it can run off the script thread"""
+        rows = store.rows(status=status)
+        frame = store.frame(rows)
+        order = np.argsort(-frame["overall_score"].to_numpy(), kind="stable")
+        rows = rows[order]
+        return cls(
+            vendor_ids=store.ids(rows),
+            names=frame["name"].to_numpy()[order].tolist(),
+            models=frame["service_model"].to_numpy()[order].tolist(),
+            services=store.service_lists(rows),
+            overall=frame["overall_score"].to_numpy()[order].copy(),
+            scores=store.score_matrix(rows).copy(),
+            criteria=list(store.criteria),
+            weights=dict(weights),
+            service_names=list(store.services),
+        )
+
+    def __len__(self) -> int:
+        return len(self.vendor_ids)
+
+
+class ExportResult(NamedTuple):
+    path: str
+    size: int
+    vendors: int
+    files: int
+    missing: List[str]
+    seconds: float
+    created: datetime
+
+
+# ========================================
+# WORKBOOK
+# ========================================
+
+def write_evaluation_workbook(path: str, snapshot: EvaluationSnapshot, title: str = "RFP Evaluation",
+                              progress: Optional[Callable[[float], None]] = None):
+    """Rankings, weights and per-service score sheets, streamed row by row
+
+    constant_memory only keeps the current row in memory, so every sheet is
+    written strictly top to bottom.
+    """
+    import xlsxwriter
+
+    from rfp_charts import criterion_label
+
+    workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+    bold = workbook.add_format({"bold": True})
+    header = workbook.add_format({"bold": True, "bg_color": "#1e3a8a", "font_color": "#ffffff",
+                                  "text_wrap": True, "valign": "top"})
+    score = workbook.add_format({"num_format": "0.0"})
+    percent = workbook.add_format({"num_format": "0%"})
+    used: set = set()
+    criteria = snapshot.criteria
+    labels = [criterion_label(c) for c in criteria]
+    weights = np.array([snapshot.weights.get(c, 0.0) for c in criteria])
+    scores = snapshot.scores
+    n = len(snapshot)
+
+    def write_scores(sheet, row, values, first_col):
+        for j, value in enumerate(values):
+            if not np.isnan(value):
+                sheet.write_number(row, first_col + j, float(value), score)
+
+    sheet = workbook.add_worksheet(_sheet_name("Weights", used))
+    sheet.set_column(0, 0, 32)
+    sheet.set_column(1, 1, 10)
+    sheet.write(0, 0, title, bold)
+    sheet.write(1, 0, f"Generated {datetime.now():%Y-%m-%d %H:%M}")
+    sheet.write_row(3, 0, ["Criterion", "Weight"], header)
+    for j, label in enumerate(labels):
+        sheet.write(4 + j, 0, label)
+        sheet.write_number(4 + j, 1, float(weights[j]), percent)
+    sheet.write(5 + len(labels), 0, "Evaluated vendors", bold)
+    sheet.write_number(5 + len(labels), 1, n)
+
+    sheet = workbook.add_worksheet(_sheet_name("Overall Ranking", used))
+    columns = ["Rank", "Vendor ID", "Vendor", "Service Model", "Services", "Overall Score"] + labels
+    sheet.set_column(0, 0, 6)
+    sheet.set_column(1, 2, 26)
+    sheet.set_column(3, 3, 14)
+    sheet.set_column(4, 4, 40)
+    sheet.set_column(5, 5 + len(labels), 12)
+    sheet.write_row(0, 0, columns, header)
+    sheet.freeze_panes(1, 3)
+    sheet.autofilter(0, 0, max(n, 1), len(columns) - 1)
+    for i in range(n):
+        sheet.write_number(i + 1, 0, i + 1)
+        sheet.write_string(i + 1, 1, snapshot.vendor_ids[i])
+        sheet.write_string(i + 1, 2, snapshot.names[i])
+        sheet.write_string(i + 1, 3, snapshot.models[i])
+        sheet.write_string(i + 1, 4, ", ".join(snapshot.services[i]))
+        sheet.write_number(i + 1, 5, float(snapshot.overall[i]), score)
+        write_scores(sheet, i + 1, scores[i], 6)
+    if progress is not None:
+        progress(1 / (len(snapshot.service_names) + 1))
+
+    weighted_labels = [f"{label} (weighted)" for label in labels]
+    for s, service in enumerate(snapshot.service_names):
+        members = [i for i in range(n) if service in snapshot.services[i]]
+        sheet = workbook.add_worksheet(_sheet_name(service, used))
+        columns = ["Rank", "Vendor ID", "Vendor", "Service Model", "Overall Score"] + labels + weighted_labels
+        sheet.set_column(0, 0, 6)
+        sheet.set_column(1, 2, 26)
+        sheet.set_column(3, 3, 14)
+        sheet.set_column(4, 4 + 2 * len(labels), 12)
+        sheet.write_row(0, 0, columns, header)
+        sheet.freeze_panes(1, 3)
+        sheet.autofilter(0, 0, max(len(members), 1), len(columns) - 1)
+        for rank, i in enumerate(members, start=1):
+            sheet.write_number(rank, 0, rank)
+            sheet.write_string(rank, 1, snapshot.vendor_ids[i])
+            sheet.write_string(rank, 2, snapshot.names[i])
+            sheet.write_string(rank, 3, snapshot.models[i])
+            sheet.write_number(rank, 4, float(snapshot.overall[i]), score)
+            write_scores(sheet, rank, scores[i], 5)
+            write_scores(sheet, rank, scores[i] * weights, 5 + len(labels))
+        if progress is not None:
+            progress((s + 2) / (len(snapshot.service_names) + 1))
+    workbook.close()
+
+
+# ========================================
+# PACKAGE
+# ========================================
+
+def iter_package_documents(rfp_documents: Dict[str, Dict], vendor_documents: Dict[str, Dict[str, Dict]],
+                           vendor_names: Optional[Dict[str, str]] = None) -> Iterator[Tuple[str, Dict]]:
+    """(archive name, document record) for every RFP and vendor document"""
+    vendor_names = vendor_names or {}
+    for record in rfp_documents.values():
+        yield f"rfp_documents/{_path_part(record['name'])}", record
+    for vendor_id, documents in vendor_documents.items():
+        folder = _path_part(f"{vendor_names.get(vendor_id, vendor_id)} ({vendor_id})")
+        for record in documents.values():
+            yield f"vendor_documents/{folder}/{_path_part(record['name'])}", record
+
+
+def _unique(arcname: str, used: set) -> str:
+    stem, extension = os.path.splitext(arcname)
+    candidate, n = arcname, 2
+    while candidate in used:
+        candidate, n = f"{stem} ({n}){extension}", n + 1
+    used.add(candidate)
+    return candidate
+
+
+def _add_file(archive: zipfile.ZipFile, path: str, arcname: str):
+    extension = os.path.splitext(arcname)[1].lower()
+    compression = zipfile.ZIP_STORED if extension in STORED_EXTENSIONS else zipfile.ZIP_DEFLATED
+    info = zipfile.ZipInfo.from_file(path, arcname)
+    info.compress_type = compression
+    with open(path, "rb") as source, archive.open(info, "w", force_zip64=True) as target:
+        while True:
+            block = source.read(COPY_BLOCK_SIZE)
+            if not block:
+                break
+            target.write(block)
+
+
+def _add_text(archive: zipfile.ZipFile, record: Dict, arcname: str):
+    """Documents generated in memory only have their text, so they go in as .txt"""
+    with archive.open(os.path.splitext(arcname)[0] + ".txt", "w") as target:
+        for chunk in record.get("chunks", []):
+            target.write(chunk["text"].encode("utf-8"))
+            target.write(b"\n")
+
+
+def export_package(path: str, snapshot: EvaluationSnapshot, rfp_documents: Dict[str, Dict],
+                   vendor_documents: Dict[str, Dict[str, Dict]], title: str = "RFP Evaluation",
+                   progress: Optional[Callable[[float, str], None]] = None) -> ExportResult:
+    """Write the evaluation package ZIP to path
+
+    Attachments whose spooled file is gone are listed in the manifest as
+    missing instead of failing the export.
+    """
+    start = time.perf_counter()
+    documents = list(iter_package_documents(
+        rfp_documents, vendor_documents, dict(zip(snapshot.vendor_ids, snapshot.names))))
+    sizes = [os.path.getsize(r["path"]) if r.get("path") and os.path.exists(r["path"]) else 0
+             for _, r in documents]
+    total = max(sum(sizes), 1)
+    # Count each workbook row as ~2 KB of copying so progress moves evenly
+    workbook_share = len(snapshot) * 2048 / (len(snapshot) * 2048 + total)
+
+    def report(fraction, message):
+        if progress is not None:
+            progress(min(fraction, 1.0), message)
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    workbook_path = f"{path}.{uuid.uuid4().hex[:8]}.xlsx"
+    used: set = {WORKBOOK_NAME, "manifest.json"}
+    manifest = {"title": title, "created": datetime.now().isoformat(timespec="seconds"),
+                "vendors": len(snapshot), "weights": snapshot.weights, "files": [], "missing": []}
+    try:
+        write_evaluation_workbook(workbook_path, snapshot, title,
+                                  lambda f: report(f * workbook_share, "Writing evaluation workbook"))
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED, allowZip64=True) as archive:
+            _add_file(archive, workbook_path, WORKBOOK_NAME)
+            copied = 0
+            for (arcname, record), size in zip(documents, sizes):
+                arcname = _unique(arcname, used)
+                report(workbook_share + (1 - workbook_share) * copied / total, f"Adding {record['name']}")
+                source = record.get("path")
+                if source and os.path.exists(source):
+                    _add_file(archive, source, arcname)
+                    manifest["files"].append({"name": arcname, "size": size})
+                elif source:
+                    manifest["missing"].append(arcname)
+                else:
+                    _add_text(archive, record, arcname)
+                    manifest["files"].append({"name": os.path.splitext(arcname)[0] + ".txt",
+                                              "extracted_text": True})
+                copied += size
+            archive.writestr("manifest.json", json.dumps(manifest, indent=2, default=str))
+    except BaseException:
+        if os.path.exists(path):
+            os.remove(path)
+        raise
+    finally:
+        if os.path.exists(workbook_path):
+            os.remove(workbook_path)
+    report(1.0, "Done")
+    return ExportResult(path, os.path.getsize(path), len(snapshot), len(manifest["files"]) + 1,
+                        manifest["missing"], time.perf_counter() - start, datetime.now())
+
+
+def export_path(export_dir: str = EXPORT_DIR) -> str:
+    return os.path.join(export_dir, f"evaluation_package_{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:6]}.zip")
+
+
+# ========================================
+# BENCHMARK
+# ========================================
+
+def benchmark(vendors: int = 10_000, attachments: int = 20, attachment_mb: int = 25,
+              directory: Optional[str] = None) -> Dict:
+    """Export time, archive size and peak memory for a synthetic package
+
+    The defaults write 500 MB of attachments; pass attachments=80 for the
+    2 GB case. Growth of the process's peak RSS also covers the xlsxwriter
+    and zlib buffers that tracemalloc cannot see.
+    """
+    import resource
+    import shutil
+    import tempfile
+    import tracemalloc
+
+    from rfp_charts import _bench_store
+
+    criteria = ["technical_capability", "operational_excellence", "pricing_competitiveness",
+                "compliance_security"]
+    weights = dict(zip(criteria, [0.3, 0.25, 0.25, 0.2]))
+    store = _bench_store(vendors, criteria)
+    snapshot = EvaluationSnapshot.from_store(store, weights)
+
+    directory = directory or tempfile.mkdtemp(prefix="rfp_export_")
+    block = np.random.default_rng(0).integers(0, 256, COPY_BLOCK_SIZE, dtype=np.uint8).tobytes()
+    vendor_documents = {}
+    for i in range(attachments):
+        path = os.path.join(directory, f"proposal_{i:03d}.pdf")
+        with open(path, "wb") as handle:
+            for _ in range(attachment_mb):
+                handle.write(block)
+        vendor_documents.setdefault(snapshot.vendor_ids[i % len(snapshot)], {})[f"proposal_{i}"] = {
+            "name": f"proposal_{i:03d}.pdf", "path": path, "size": attachment_mb * COPY_BLOCK_SIZE}
+    del block
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    result = export_package(os.path.join(directory, "package.zip"), snapshot, {}, vendor_documents)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    shutil.rmtree(directory, ignore_errors=True)
+    return {
+        "vendors": vendors,
+        "attachments_mb": attachments * attachment_mb,
+        "archive_mb": round(result.size / 1e6, 1),
+        "seconds": round(result.seconds, 2),
+        "peak_traced_mb": round(peak / 1e6, 1),
+        "peak_rss_growth_mb": round((rss_after - rss_before) / 1e3, 1),
+    }
+
+
+if __name__ == "__main__":
+    print(benchmark())
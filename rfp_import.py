@@ -0,0 +1,394 @@
+"""
+Bulk vendor import
+Streams vendor registration rows from CSV or XLSX (openpyxl read-only) and
+validates them in batches with pydantic. Valid rows become vendor records
+handed to a sink one batch at a time; invalid rows are reported with their
+spreadsheet row number and field. Rows whose explicit Vendor ID is already
+registered are rejected rather than overwriting that vendor. Only one batch
+is held in memory, so import memory does not grow with the file.
+"""
+
+import csv
+import io
+import os
+import re
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Collection, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError, ValidationInfo
+from pydantic import field_validator, model_validator
+
+IMPORT_BATCH_SIZE = 2000
+# Row errors kept for the report; later errors are only counted
+MAX_REPORTED_ERRORS = 500
+
+STANDALONE = "Standalone"
+CONSOLIDATED = "Consolidated"
+
+# Normalized header -> field
+COLUMN_ALIASES = {
+    "vendor_id": "vendor_id", "id": "vendor_id",
+    "name": "name", "vendor": "name", "vendor_name": "name", "company": "name", "company_name": "name",
+    "service_model": "service_model", "model": "service_model",
+    "services": "services", "services_offered": "services", "service": "services",
+    "certifications": "certifications", "certification": "certifications",
+}
+_LIST_SPLIT = re.compile(r"\s*[;,|]\s*")
+
+
+def _normalize_header(value: Any) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", str(value or "").strip().lower()).strip("_")
+
+
+def _split(value: Any) -> List[str]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(v).strip() for v in value if str(v).strip()]
+    text = str(value).strip()
+    return [part for part in _LIST_SPLIT.split(text) if part] if text else []
+
+
+def validation_context(services: Sequence[str], certifications: Sequence[str] = ()) -> Dict:
+    """Lookup tables shared by every row of an import"""
+    return {
+        "services": list(services),
+        "service_names": {s.lower(): s for s in services},
+        "certification_names": {c.lower(): c for c in certifications},
+    }
+
+
+class VendorImportRow(BaseModel):
+    """One registration row; validation context supplies the known services and certifications"""
+    model_config = ConfigDict(str_strip_whitespace=True, extra="ignore")
+
+    vendor_id: Optional[str] = Field(default=None, max_length=64)
+    name: str = Field(min_length=1, max_length=200)
+    service_model: str
+    services: List[str] = []
+    certifications: List[str] = []
+
+    @field_validator("vendor_id", mode="before")
+    @classmethod
+    def _blank_id(cls, value):
+        return None if value is None or str(value).strip() == "" else str(value)
+
+    @field_validator("name", mode="before")
+    @classmethod
+    def _name_text(cls, value):
+        return "" if value is None else str(value)
+
+    @field_validator("service_model", mode="before")
+    @classmethod
+    def _model(cls, value):
+        text = str(value or "").strip().lower()
+        if text in ("standalone", "stand-alone", "stand alone"):
+            return STANDALONE
+        if text in ("consolidated", "integrated"):
+            return CONSOLIDATED
+        raise ValueError(f"must be {STANDALONE} or {CONSOLIDATED}")
+
+    @field_validator("services", mode="before")
+    @classmethod
+    def _services(cls, value, info: ValidationInfo):
+        known = (info.context or {}).get("service_names")
+        services = []
+        for item in _split(value):
+            service = known.get(item.lower()) if known else item
+            if service is None:
+                raise ValueError(f"unknown service '{item}'")
+            if service not in services:
+                services.append(service)
+        return services
+
+    @field_validator("certifications", mode="before")
+    @classmethod
+    def _certifications(cls, value, info: ValidationInfo):
+        known = (info.context or {}).get("certification_names")
+        certifications = []
+        for item in _split(value):
+            certification = known.get(item.lower()) if known else item
+            if certification is None:
+                raise ValueError(f"unknown certification '{item}'")
+            if certification not in certifications:
+                certifications.append(certification)
+        return certifications
+
+    @model_validator(mode="after")
+    def _coverage(self, info: ValidationInfo):
+        if self.service_model == CONSOLIDATED and not self.services:
+            self.services = list((info.context or {}).get("services", ()))
+        if not self.services:
+            raise ValueError("standalone vendors must list at least one service")
+        return self
+
+
+_ROWS = TypeAdapter(List[VendorImportRow])
+
+
+class RowError:
+    __slots__ = ("row", "field", "message")
+
+    def __init__(self, row: int, field: str, message: str):
+        self.row = row
+        self.field = field
+        self.message = message
+
+    def as_dict(self) -> Dict:
+        return {"row": self.row, "field": self.field, "message": self.message}
+
+
+class ImportReport:
+    """Counts and row-level errors for one import"""
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.rows = 0
+        self.imported = 0
+        self.failed = 0
+        self.errors: List[RowError] = []
+        self.seconds = 0.0
+
+    def add_error(self, row: int, field: str, message: str):
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(RowError(row, field, message))
+
+    def as_dict(self) -> Dict:
+        return {
+            "filename": self.filename,
+            "rows": self.rows,
+            "imported": self.imported,
+            "failed": self.failed,
+            "seconds": round(self.seconds, 3),
+            "rows_per_sec": round(self.rows / self.seconds) if self.seconds else None,
+            "errors": [e.as_dict() for e in self.errors],
+        }
+
+
+# ========================================
+# READERS
+# ========================================
+
+def _mapped(header: Sequence[Any]) -> List[Optional[str]]:
+    return [COLUMN_ALIASES.get(_normalize_header(h)) for h in header]
+
+
+def iter_csv_rows(path: str) -> Iterator[Tuple[int, Dict[str, Any], float]]:
+    """(row number, fields, fraction read) for each data row of a CSV file"""
+    size = os.path.getsize(path) or 1
+    with open(path, "rb") as raw:
+        text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+        reader = csv.reader(text)
+        header = _mapped(next(reader, []))
+        for number, values in enumerate(reader, start=2):
+            if not any(v.strip() for v in values):
+                continue
+            yield number, {f: v for f, v in zip(header, values) if f}, raw.tell() / size
+
+
+def iter_xlsx_rows(path: str) -> Iterator[Tuple[int, Dict[str, Any], float]]:
+    """(row number, fields, fraction read) for each data row of the first worksheet"""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.worksheets[0]
+        total = sheet.max_row or 0
+        rows = sheet.iter_rows(values_only=True)
+        header = _mapped(next(rows, ()))
+        for number, values in enumerate(rows, start=2):
+            if all(v is None or str(v).strip() == "" for v in values):
+                continue
+            yield number, {f: v for f, v in zip(header, values) if f}, (number / total if total else 0.0)
+    finally:
+        workbook.close()
+
+
+def iter_rows(path: str, filename: Optional[str] = None):
+    ext = os.path.splitext(filename or path)[1].lower()
+    if ext in (".xlsx", ".xlsm"):
+        return iter_xlsx_rows(path)
+    if ext in (".csv", ".txt"):
+        return iter_csv_rows(path)
+    raise ValueError(f"Unsupported import file type: {ext or filename}")
+
+
+# ========================================
+# IMPORT
+# ========================================
+
+def _record(row: VendorImportRow, vendor_id: str, registered: datetime) -> Dict:
+    """Vendor record in the persistence format (columns plus details)"""
+    return {
+        "vendor_id": vendor_id,
+        "name": row.name,
+        "status": "Registered",
+        "service_model": row.service_model,
+        "services_offered": row.services,
+        "certifications": row.certifications,
+        "overall_score": 0,
+        "scores": {},
+        "details": {"registration_date": registered},
+    }
+
+
+def _validate_batch(batch: List[Tuple[int, Dict]], context: Dict, report: ImportReport, seen_ids: set,
+                    existing: Optional[Callable[[List[str]], Collection[str]]] = None
+                    ) -> List[Tuple[int, VendorImportRow]]:
+    """Validate a batch in one pydantic call, then drop failing rows and re-validate the rest"""
+    rows = [fields for _, fields in batch]
+    try:
+        valid = _ROWS.validate_python(rows, context=context)
+        numbers = [number for number, _ in batch]
+    except ValidationError as exc:
+        bad = set()
+        for error in exc.errors(include_url=False):
+            index = error["loc"][0]
+            bad.add(index)
+            field = ".".join(str(part) for part in error["loc"][1:]) or "row"
+            report.add_error(batch[index][0], field, error["msg"])
+        keep = [i for i in range(len(batch)) if i not in bad]
+        report.failed += len(bad)
+        valid = _ROWS.validate_python([rows[i] for i in keep], context=context)
+        numbers = [batch[i][0] for i in keep]
+
+    accepted = []
+    for number, row in zip(numbers, valid):
+        if row.vendor_id is not None:
+            if row.vendor_id in seen_ids:
+                report.add_error(number, "vendor_id", f"duplicate vendor_id '{row.vendor_id}' in file")
+                report.failed += 1
+                continue
+            seen_ids.add(row.vendor_id)
+        accepted.append((number, row))
+
+    explicit = [row.vendor_id for _, row in accepted if row.vendor_id is not None]
+    registered = existing(explicit) if explicit and existing is not None else ()
+    if registered:
+        kept = []
+        for number, row in accepted:
+            if row.vendor_id in registered:
+                report.add_error(number, "vendor_id", f"vendor_id '{row.vendor_id}' is already registered")
+                report.failed += 1
+            else:
+                kept.append((number, row))
+        accepted = kept
+    return accepted
+
+
+def import_vendors(path: str, sink: Callable[[List[Dict]], None], services: Sequence[str],
+                   certifications: Sequence[str] = (), filename: Optional[str] = None,
+                   batch_size: int = IMPORT_BATCH_SIZE,
+                   on_progress: Optional[Callable[[float, int], None]] = None,
+                   existing: Optional[Callable[[List[str]], Collection[str]]] = None) -> ImportReport:
+    """Stream, validate and hand vendor records to sink in batches
+
+    sink receives lists of vendor records (the VendorProfile.to_record
+    format). on_progress(fraction, rows) is called after every batch.
+    existing(vendor_ids) returns which of a batch's explicit ids are
+    already registered; those rows are reported as errors, not saved.
+    """
+    start = time.perf_counter()
+    report = ImportReport(filename or os.path.basename(path))
+    context = validation_context(services, certifications)
+    registered = datetime.now()
+    # Generated ids share a per-import prefix plus the source row number
+    prefix = f"VND-IMP-{uuid.uuid4().hex[:6].upper()}"
+    seen_ids: set = set()
+    batch: List[Tuple[int, Dict]] = []
+    fraction = 0.0
+
+    def flush():
+        accepted = _validate_batch(batch, context, report, seen_ids, existing)
+        if accepted:
+            sink([_record(row, row.vendor_id or f"{prefix}-{number:07d}", registered)
+                  for number, row in accepted])
+            report.imported += len(accepted)
+        batch.clear()
+        if on_progress is not None:
+            on_progress(fraction, report.rows)
+
+    for number, fields, fraction in iter_rows(path, filename):
+        report.rows += 1
+        batch.append((number, fields))
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+    report.errors.sort(key=lambda e: e.row)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+# ========================================
+# BENCHMARK
+# ========================================
+
+def write_sample(path: str, rows: int, services: Sequence[str], error_rate: float = 0.01,
+                 seed: int = 0):
+    """Registration sheet (CSV or XLSX by extension) with a share of invalid rows"""
+    import random
+
+    rng = random.Random(seed)
+    header = ["Vendor Name", "Service Model", "Services", "Certifications"]
+
+    def row(i):
+        consolidated = rng.random() < 0.3
+        model = CONSOLIDATED if consolidated else STANDALONE
+        offered = "" if consolidated else rng.choice(services)
+        if rng.random() < error_rate:
+            model = rng.choice(["Hybrid", ""])
+        return [f"Import Vendor {i:06d}", model, offered, "; ".join(rng.sample(["TAPA", "C-TPAT", "ISO 9001"], 2))]
+
+    if path.endswith(".xlsx"):
+        import xlsxwriter
+
+        workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+        sheet = workbook.add_worksheet()
+        sheet.write_row(0, 0, header)
+        for i in range(rows):
+            sheet.write_row(i + 1, 0, row(i))
+        workbook.close()
+    else:
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(header)
+            for i in range(rows):
+                writer.writerow(row(i))
+
+
+def benchmark(rows: int = 100_000, formats: Sequence[str] = ("csv", "xlsx")) -> List[Dict]:
+    """Import throughput and peak traced memory per format"""
+    import tempfile
+    import tracemalloc
+
+    services = ["Warehouse Services", "Customer Service Operations", "Consumer Solutions Group"]
+    results = []
+    for fmt in formats:
+        path = os.path.join(tempfile.mkdtemp(prefix="rfp_import_"), f"vendors.{fmt}")
+        write_sample(path, rows, services)
+        imported = [0]
+
+        def sink(records):
+            imported[0] += len(records)
+
+        tracemalloc.start()
+        report = import_vendors(path, sink, services, ["TAPA", "C-TPAT", "ISO 9001"])
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results.append({
+            "format": fmt,
+            "rows": report.rows,
+            "imported": report.imported,
+            "failed": report.failed,
+            "seconds": round(report.seconds, 2),
+            "rows_per_sec": round(report.rows / report.seconds),
+            "peak_mb": round(peak / 1e6, 1),
+        })
+    return results
+
+
+if __name__ == "__main__":
+    for result in benchmark():
+        print(result)
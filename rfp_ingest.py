@@ -0,0 +1,499 @@
+"""
+Streaming document ingestion for RFP packages and vendor proposals
+Uploads are spooled to disk in fixed-size blocks, then text is extracted page
+by page through generators (pdfplumber/PyPDF2, DOCX XML, openpyxl read-only)
+and grouped into chunks. Only the chunks and metadata are kept in session
+state, so peak memory does not depend on the size of the proposal.
+"""
+
+import multiprocessing
+import os
+import re
+import resource
+import shutil
+import signal
+import tempfile
+import time
+import uuid
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from xml.etree import ElementTree
+
+from rfp_cache import ExtractionCache, file_digest
+
+SPOOL_DIR = os.environ.get("RFP_SPOOL_DIR", os.path.join(tempfile.gettempdir(), "rfp_spool"))
+COPY_BLOCK_SIZE = 1024 * 1024
+CHUNK_CHARS = 4000
+PDF_ENGINE = os.environ.get("RFP_PDF_ENGINE", "pypdf2")
+
+# DOCX/XLSX have no pages, so paragraphs and rows are grouped into pseudo-pages
+DOCX_PAGE_CHARS = 3000
+XLSX_PAGE_ROWS = 100
+
+CONTENT_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/docx",
+    "xlsx": "application/xlsx",
+    "text": "text/plain",
+}
+
+_WORD_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def detect_kind(filename: str) -> str:
+    extension = os.path.splitext(filename)[1].lower()
+    if extension == ".pdf":
+        return "pdf"
+    if extension in (".docx", ".docm"):
+        return "docx"
+    if extension in (".xlsx", ".xlsm"):
+        return "xlsx"
+    return "text"
+
+
+def spool_upload(fileobj, filename: str, spool_dir: str = SPOOL_DIR) -> str:
+    """Copy an uploaded file to disk block by block, returns the spooled path"""
+    os.makedirs(spool_dir, exist_ok=True)
+    safe_name = re.sub(r"[^A-Za-z0-9._-]", "_", os.path.basename(filename))
+    path = os.path.join(spool_dir, f"{uuid.uuid4().hex[:12]}_{safe_name}")
+    if hasattr(fileobj, "seek"):
+        fileobj.seek(0)
+    with open(path, "wb") as out:
+        shutil.copyfileobj(fileobj, out, COPY_BLOCK_SIZE)
+    return path
+
+
+# ========================================
+# PAGE GENERATORS
+# ========================================
+
+def iter_pdf_pages(path: str, engine: Optional[str] = None) -> Iterator[str]:
+    """Yield the text of each PDF page
+
+    PyPDF2 is the default as it extracts plain text far faster; pdfplumber
+    (RFP_PDF_ENGINE=pdfplumber) keeps layout and releases each page's cache
+    once it has been read.
+    """
+    engine = engine or PDF_ENGINE
+    if engine == "pdfplumber":
+        import pdfplumber
+
+        with pdfplumber.open(path) as pdf:
+            for page in pdf.pages:
+                try:
+                    yield page.extract_text() or ""
+                finally:
+                    page.close()
+        return
+
+    from PyPDF2 import PdfReader
+    with open(path, "rb") as handle:
+        reader = PdfReader(handle)
+        for page in reader.pages:
+            yield page.extract_text() or ""
+
+
+def iter_docx_pages(path: str, page_chars: int = DOCX_PAGE_CHARS) -> Iterator[str]:
+    """Stream paragraphs out of word/document.xml without loading the document
+
+    python-docx parses the whole XML tree up front, so the document part is
+    read incrementally with iterparse instead.
+    """
+    buffer: List[str] = []
+    size = 0
+    with zipfile.ZipFile(path) as archive, archive.open("word/document.xml") as xml:
+        for _, element in ElementTree.iterparse(xml, events=("end",)):
+            if element.tag != f"{_WORD_NS}p":
+                continue
+            text = "".join(node.text or "" for node in element.iter(f"{_WORD_NS}t"))
+            element.clear()
+            if not text:
+                continue
+            buffer.append(text)
+            size += len(text)
+            if size >= page_chars:
+                yield "\n".join(buffer)
+                buffer, size = [], 0
+    if buffer:
+        yield "\n".join(buffer)
+
+
+def iter_xlsx_pages(path: str, page_rows: int = XLSX_PAGE_ROWS) -> Iterator[str]:
+    """Stream worksheet rows in read-only mode, one pseudo-page per block of rows"""
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            lines = [f"[{sheet.title}]"]
+            for row in sheet.iter_rows(values_only=True):
+                cells = [str(value) for value in row if value is not None]
+                if cells:
+                    lines.append("\t".join(cells))
+                if len(lines) >= page_rows:
+                    yield "\n".join(lines)
+                    lines = [f"[{sheet.title}]"]
+            if len(lines) > 1:
+                yield "\n".join(lines)
+    finally:
+        workbook.close()
+
+
+def iter_text_pages(path: str, page_chars: int = DOCX_PAGE_CHARS) -> Iterator[str]:
+    with open(path, "r", encoding="utf-8", errors="replace") as handle:
+        while True:
+            block = handle.read(page_chars)
+            if not block:
+                break
+            yield block
+
+
+PAGE_READERS = {
+    "pdf": iter_pdf_pages,
+    "docx": iter_docx_pages,
+    "xlsx": iter_xlsx_pages,
+    "text": iter_text_pages,
+}
+
+
+def iter_pages(path: str, kind: Optional[str] = None) -> Iterator[str]:
+    return PAGE_READERS[kind or detect_kind(path)](path)
+
+
+def iter_chunks(pages: Iterator[str], chunk_chars: int = CHUNK_CHARS) -> Iterator[Dict]:
+    """Group page texts into chunks of roughly chunk_chars, tracking page spans"""
+    parts: List[str] = []
+    size = 0
+    first_page = 1
+    page_num = 0
+    for page_num, text in enumerate(pages, 1):
+        text = text.strip()
+        if not text:
+            continue
+        if not parts:
+            first_page = page_num
+        parts.append(text)
+        size += len(text)
+        if size >= chunk_chars:
+            yield {"page_start": first_page, "page_end": page_num, "text": "\n".join(parts)}
+            parts, size = [], 0
+    if parts:
+        yield {"page_start": first_page, "page_end": page_num, "text": "\n".join(parts)}
+
+
+# ========================================
+# DOCUMENT RECORDS
+# ========================================
+
+class _PageCounter:
+    """Wraps a page iterator and counts pages as they stream past"""
+    def __init__(self, pages: Iterator[str]):
+        self._pages = pages
+        self.count = 0
+
+    def __iter__(self):
+        for page in self._pages:
+            self.count += 1
+            yield page
+
+
+def _cache_key(cache: ExtractionCache, path: str, kind: str, chunk_chars: int) -> str:
+    return cache.key_for(file_digest(path), f"{kind}:{PDF_ENGINE}:{chunk_chars}")
+
+
+def _from_cache(cached: Dict, path: str, name: str) -> Dict:
+    return dict(cached, name=name, path=path, upload_date=datetime.now(), cached=True)
+
+
+def _to_cache(record: Dict) -> Dict:
+    return {key: record[key] for key in ("type", "size", "pages", "chunks")}
+
+
+def ingest_file(path: str, name: Optional[str] = None, kind: Optional[str] = None,
+                chunk_chars: int = CHUNK_CHARS, cache: Optional[ExtractionCache] = None) -> Dict:
+    """Extract a spooled file into a document record (metadata + text chunks)"""
+    name = name or os.path.basename(path)
+    kind = kind or detect_kind(name)
+
+    if cache is not None:
+        key = _cache_key(cache, path, kind, chunk_chars)
+        cached = cache.get(key)
+        if cached is not None:
+            return _from_cache(cached, path, name)
+
+    pages = _PageCounter(iter_pages(path, kind))
+    chunks = list(iter_chunks(iter(pages), chunk_chars))
+    record = {
+        "name": name,
+        "type": CONTENT_TYPES[kind],
+        "size": os.path.getsize(path),
+        "path": path,
+        "pages": pages.count,
+        "chunks": chunks,
+        "upload_date": datetime.now()
+    }
+    if cache is not None:
+        cache.put(key, _to_cache(record))
+    return record
+
+
+def ingest_upload(fileobj, filename: str, spool_dir: str = SPOOL_DIR,
+                  cache: Optional[ExtractionCache] = None) -> Dict:
+    """Spool an uploaded file to disk and extract it"""
+    path = spool_upload(fileobj, filename, spool_dir)
+    return ingest_file(path, filename, cache=cache)
+
+
+def text_document(name: str, content_type: str, text: str, size: Optional[int] = None) -> Dict:
+    """Document record for text generated in memory (e.g. sample documents)"""
+    return {
+        "name": name,
+        "type": content_type,
+        "size": size if size is not None else len(text.encode("utf-8")),
+        "path": None,
+        "pages": 1,
+        "chunks": list(iter_chunks(iter([text]))),
+        "upload_date": datetime.now()
+    }
+
+
+def document_text(record: Dict) -> str:
+    return "\n".join(chunk["text"] for chunk in record.get("chunks", []))
+
+
+# ========================================
+# BULK INGESTION (PROCESS POOL)
+# ========================================
+
+BULK_FILE_TIMEOUT = int(os.environ.get("RFP_BULK_FILE_TIMEOUT", "300"))
+
+# Extra time the parent waits past the per-file timeout before killing workers
+WATCHDOG_GRACE = 30
+
+
+class _FileTimeout(Exception):
+    pass
+
+
+def _raise_timeout(signum, frame):
+    raise _FileTimeout()
+
+
+def _extract_worker(path: str, name: str, timeout: int) -> Dict:
+    """Extract one file inside a worker process, enforcing its own timeout"""
+    use_alarm = hasattr(signal, "SIGALRM") and timeout > 0
+    if use_alarm:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.alarm(timeout)
+    try:
+        return {"ok": True, "record": ingest_file(path, name)}
+    except _FileTimeout:
+        return {"ok": False, "error": f"Timed out after {timeout}s"}
+    except Exception as exc:
+        return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+    finally:
+        if use_alarm:
+            signal.alarm(0)
+
+
+def _pool_context():
+    # Forking a multi-threaded Streamlit server is unsafe, so use forkserver/spawn
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _kill_workers(pool: ProcessPoolExecutor):
+    for process in list((getattr(pool, "_processes", None) or {}).values()):
+        process.kill()
+
+
+def _run_pool(files: Sequence[Tuple[str, str]], workers: int, timeout: int,
+              report: Callable[[str, Dict], None]) -> List[Tuple[str, str]]:
+    """Run one pool over files, returns files lost to a crashed or hung pool"""
+    unfinished = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+        futures = {pool.submit(_extract_worker, path, name, timeout): (path, name)
+                   for path, name in files}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=timeout + WATCHDOG_GRACE,
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                # A worker ignored its alarm; kill the pool and retry the rest
+                _kill_workers(pool)
+                unfinished.extend(futures[f] for f in pending)
+                break
+            for future in done:
+                try:
+                    report(futures[future][1], future.result())
+                except BrokenProcessPool:
+                    unfinished.append(futures[future])
+    return unfinished
+
+
+def bulk_ingest(files: Sequence[Tuple[str, str]], max_workers: Optional[int] = None,
+                timeout: int = BULK_FILE_TIMEOUT,
+                on_progress: Optional[Callable[[int, int, str, Dict], None]] = None,
+                cache: Optional[ExtractionCache] = None) -> Dict[str, Dict]:
+    """Extract many spooled files in parallel worker processes
+
+    files is a list of (path, name). Returns name -> {"ok", "record"|"error"}.
+    A malformed file that crashes its worker breaks the pool; unfinished files
+    are retried once in a fresh pool and then one at a time in isolated
+    single-worker pools, so only the offending file is reported as crashed.
+    on_progress(done, total, name, result) is called as each file finishes.
+    With a cache, files whose content was already extracted skip the pool.
+    """
+    workers = max_workers or os.cpu_count() or 1
+    total = len(files)
+    results: Dict[str, Dict] = {}
+    cache_keys: Dict[str, str] = {}
+
+    def report(name: str, result: Dict):
+        if cache is not None and result["ok"] and name in cache_keys:
+            cache.put(cache_keys[name], _to_cache(result["record"]))
+        results[name] = result
+        if on_progress:
+            on_progress(len(results), total, name, result)
+
+    to_extract = []
+    for path, name in files:
+        if cache is not None:
+            key = _cache_key(cache, path, detect_kind(name), CHUNK_CHARS)
+            cached = cache.get(key)
+            if cached is not None:
+                report(name, {"ok": True, "record": _from_cache(cached, path, name)})
+                continue
+            cache_keys[name] = key
+        to_extract.append((path, name))
+
+    remaining = _run_pool(to_extract, workers, timeout, report) if to_extract else []
+    if remaining:
+        remaining = _run_pool(remaining, workers, timeout, report)
+    for path, name in remaining:
+        if _run_pool([(path, name)], 1, timeout, report):
+            report(name, {"ok": False, "error": "Worker process crashed or hung"})
+    return results
+
+
+# ========================================
+# BENCHMARK
+# ========================================
+
+def write_synthetic_pdf(path: str, pages: int, lines_per_page: int = 40,
+                        lines: Optional[Sequence[str]] = None):
+    """Write a plain-text PDF with the given number of pages (no extra deps)
+
+    Page text cycles through lines when given, otherwise repeats a fixed
+    requirements-style sentence.
+    """
+    text_lines = list(lines or ())
+    offsets = []
+    with open(path, "wb") as out:
+        def write_object(num: int, body: bytes):
+            offsets.append((num, out.tell()))
+            out.write(b"%d 0 obj\n" % num + body + b"\nendobj\n")
+
+        out.write(b"%PDF-1.4\n")
+        page_ids = [4 + 2 * i for i in range(pages)]
+        write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        kids = b" ".join(b"%d 0 R" % pid for pid in page_ids)
+        write_object(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, pages))
+        write_object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+        for i, pid in enumerate(page_ids):
+            content = [b"BT /F1 10 Tf 50 780 Td 12 TL"]
+            for j in range(lines_per_page):
+                if text_lines:
+                    line = text_lines[(i * lines_per_page + j) % len(text_lines)]
+                    escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+                    content.append(b"(%s) '" % escaped.encode("latin-1", "replace"))
+                else:
+                    content.append(b"(Page %d line %d: warehouse capacity 500,000 sq ft, "
+                                   b"99.9%% uptime, response < 2 hours) '" % (i + 1, j + 1))
+            content.append(b"ET")
+            stream = b"\n".join(content)
+            write_object(pid, b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                              b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (pid + 1))
+            write_object(pid + 1, b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        xref = out.tell()
+        total = 2 + 2 * pages + 2
+        out.write(b"xref\n0 %d\n0000000000 65535 f \n" % total)
+        for _, offset in sorted(offsets):
+            out.write(b"%010d 00000 n \n" % offset)
+        out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (total, xref))
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process in MB"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1e3
+
+
+def benchmark(pages: int = 500, path: Optional[str] = None) -> Dict:
+    """Extract a synthetic (or given) PDF and report pages/sec and RSS"""
+    cleanup = path is None
+    if path is None:
+        path = os.path.join(tempfile.mkdtemp(prefix="rfp_bench_"), "synthetic.pdf")
+        write_synthetic_pdf(path, pages)
+
+    rss_before = current_rss_mb()
+    peak = rss_before
+    start = time.perf_counter()
+    pages_read = _PageCounter(iter_pages(path, "pdf"))
+    chars = 0
+    for chunk in iter_chunks(iter(pages_read)):
+        chars += len(chunk["text"])
+        peak = max(peak, current_rss_mb())
+    count = pages_read.count
+    elapsed = time.perf_counter() - start
+
+    if cleanup:
+        shutil.rmtree(os.path.dirname(path), ignore_errors=True)
+    return {
+        "pages": count,
+        "chars": chars,
+        "seconds": round(elapsed, 3),
+        "pages_per_sec": round(count / elapsed, 1) if elapsed else None,
+        "rss_before_mb": round(rss_before, 1),
+        "rss_peak_mb": round(peak, 1),
+    }
+
+
+def benchmark_bulk(files: int = 32, pages: int = 200, workers: Sequence[int] = (1, 2, 4, 8)) -> List[Dict]:
+    """Bulk-ingest synthetic PDFs with increasing worker counts"""
+    workdir = tempfile.mkdtemp(prefix="rfp_bulk_")
+    try:
+        paths = []
+        for i in range(files):
+            path = os.path.join(workdir, f"vendor_{i}.pdf")
+            write_synthetic_pdf(path, pages)
+            paths.append((path, os.path.basename(path)))
+
+        results = []
+        for count in workers:
+            start = time.perf_counter()
+            outcome = bulk_ingest(paths, max_workers=count)
+            elapsed = time.perf_counter() - start
+            results.append({
+                "workers": count,
+                "files": files,
+                "failed": sum(1 for r in outcome.values() if not r["ok"]),
+                "seconds": round(elapsed, 3),
+                "pages_per_sec": round(files * pages / elapsed, 1),
+            })
+        return results
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    for n in (100, 1000):
+        print(benchmark(pages=n))
+    for row in benchmark_bulk(workers=sorted({1, 2, 4, os.cpu_count() or 1})):
+        print(row)
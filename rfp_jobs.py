@@ -0,0 +1,326 @@
+"""
+Background job queue
+Long-running work (evaluation, ingestion, scenario setup) runs on a shared
+pool of worker threads instead of the Streamlit script thread. Each session
+owns its jobs by key; workers take jobs round-robin across owners so one
+session queueing a large batch does not hold up everyone else. Job
+functions must not touch st.session_state: they compute a result, and the
+owning session applies it on its own script thread once the job is done.
+Sessions that stop checking on their jobs (closed browser tabs) are
+forgotten after JOB_TTL_SECONDS, results not yet applied included.
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+JOB_WORKERS = int(os.environ.get("RFP_JOB_WORKERS", str(min(32, (os.cpu_count() or 1) + 4))))
+# Finished jobs kept per owner for the status panel
+JOB_HISTORY = 20
+# Owners idle this long have their jobs cancelled and their records and results dropped
+JOB_TTL_SECONDS = float(os.environ.get("RFP_JOB_TTL_SECONDS", "1800"))
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+FINISHED = (DONE, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised inside a job function when its job has been cancelled"""
+
+
+class Job:
+    """A unit of background work with progress and cooperative cancellation"""
+    def __init__(self, owner: str, name: str, fn: Callable, args: tuple, kwargs: Dict,
+                 apply: Optional[Callable[[Any], None]] = None):
+        self.job_id = uuid.uuid4().hex[:12]
+        self.owner = owner
+        self.name = name
+        self.status = QUEUED
+        self.progress = 0.0
+        self.message = ""
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created = time.time()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+        self.applied = False
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._apply = apply
+        self._cancel = threading.Event()
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel.is_set()
+
+    @property
+    def active(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.time()) - self.started
+
+    def report(self, progress: Optional[float] = None, message: Optional[str] = None):
+        """Update progress (0-1); raises JobCancelled once cancellation is requested"""
+        if progress is not None:
+            self.progress = min(1.0, max(0.0, progress))
+        if message is not None:
+            self.message = message
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def apply(self):
+        """Apply the result on the owning session's script thread (once)"""
+        if self.applied or self.status != DONE:
+            return
+        self.applied = True
+        apply, result = self._apply, self.result
+        # Applied results live in the session; the record only feeds the status panel
+        self._apply, self.result = None, None
+        if apply is not None:
+            apply(result)
+
+    def _run(self):
+        self.status = RUNNING
+        self.started = time.time()
+        try:
+            self.report()
+            self.result = self._fn(self, *self._args, **self._kwargs)
+            self.progress = 1.0
+            self.status = DONE
+        except JobCancelled:
+            self.status = CANCELLED
+        except Exception as exc:
+            self.error = f"{type(exc).__name__}: {exc}"
+            self.status = FAILED
+        finally:
+            self.finished = time.time()
+            # Drop references to inputs so finished jobs stay small
+            self._fn, self._args, self._kwargs = None, (), {}
+
+    def as_dict(self) -> Dict:
+        return {
+            "job_id": self.job_id,
+            "name": self.name,
+            "status": self.status,
+            "progress": self.progress,
+            "message": self.message,
+            "error": self.error,
+            "elapsed": round(self.elapsed, 3),
+        }
+
+
+class JobManager:
+    """Shared worker threads with per-owner round-robin scheduling"""
+    def __init__(self, workers: int = JOB_WORKERS, history: int = JOB_HISTORY,
+                 ttl: float = JOB_TTL_SECONDS):
+        self.workers = workers
+        self.history = history
+        self.ttl = ttl
+        self._jobs: Dict[str, Job] = {}
+        self._by_owner: Dict[str, Deque[str]] = {}
+        # owner -> last time it submitted or checked on its jobs
+        self._seen: Dict[str, float] = {}
+        self._next_sweep = time.time() + ttl
+        # owner -> queued jobs; owners rotate to the back after each dispatch
+        self._queues: "OrderedDict[str, Deque[Job]]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._closed = False
+
+    def _ensure_workers(self):
+        # Called with the condition held; threads start lazily on first submit
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._worker, name=f"rfp-job-{len(self._threads)}",
+                                      daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _next_job(self) -> Optional[Job]:
+        with self._cond:
+            while not self._queues and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                return None
+            owner, queue = next(iter(self._queues.items()))
+            job = queue.popleft()
+            if queue:
+                self._queues.move_to_end(owner)
+            else:
+                del self._queues[owner]
+            return job
+
+    def _worker(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            if job.cancel_requested:
+                job.status = CANCELLED
+                job.finished = time.time()
+                continue
+            job._run()
+
+    def submit(self, owner: str, name: str, fn: Callable, *args,
+               apply: Optional[Callable[[Any], None]] = None, **kwargs) -> Job:
+        """Queue fn(job, *args, **kwargs); apply(result) runs later on the owner's thread"""
+        job = Job(owner, name, fn, args, kwargs, apply)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("JobManager is shut down")
+            self._jobs[job.job_id] = job
+            self._by_owner.setdefault(owner, deque()).append(job.job_id)
+            self._queues.setdefault(owner, deque()).append(job)
+            self._touch(owner)
+            self._prune(owner)
+            self._ensure_workers()
+            self._cond.notify()
+        return job
+
+    def _prune(self, owner: str):
+        """Forget the oldest finished, applied jobs beyond the history limit"""
+        ids = self._by_owner[owner]
+        excess = len(ids) - self.history
+        for job_id in list(ids):
+            if excess <= 0:
+                break
+            job = self._jobs[job_id]
+            if job.status in FINISHED and (job.applied or job.status != DONE):
+                ids.remove(job_id)
+                del self._jobs[job_id]
+                excess -= 1
+
+    def _touch(self, owner: str):
+        """Record that owner is still around; sweeps idle owners at most every ttl/10 seconds"""
+        now = time.time()
+        if owner in self._by_owner:
+            self._seen[owner] = now
+        if now >= self._next_sweep:
+            self._next_sweep = now + self.ttl / 10
+            self._expire(now - self.ttl)
+
+    def _expire(self, cutoff: float):
+        """Cancel and drop the jobs of owners not seen since cutoff"""
+        for owner in [o for o, seen in self._seen.items() if seen < cutoff]:
+            for job_id in self._by_owner.get(owner, ()):
+                job = self._jobs.pop(job_id, None)
+                if job is not None:
+                    # A running job stops at its next report(); its worker drops the last reference
+                    job._cancel.set()
+                    job._apply, job.result = None, None
+            self._by_owner.pop(owner, None)
+            self._queues.pop(owner, None)
+            del self._seen[owner]
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def jobs_for(self, owner: str) -> List[Job]:
+        with self._cond:
+            self._touch(owner)
+            return [self._jobs[job_id] for job_id in self._by_owner.get(owner, ())]
+
+    def active_for(self, owner: str) -> List[Job]:
+        return [job for job in self.jobs_for(owner) if job.active]
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job outright or ask a running one to stop"""
+        job = self._jobs.get(job_id)
+        if job is None or not job.active:
+            return False
+        job._cancel.set()
+        with self._cond:
+            queue = self._queues.get(job.owner)
+            if queue is not None and job in queue:
+                queue.remove(job)
+                if not queue:
+                    del self._queues[job.owner]
+                job.status = CANCELLED
+                job.finished = time.time()
+        return True
+
+    def apply_finished(self, owner: str) -> List[Job]:
+        """Apply results of the owner's finished jobs, returns jobs that finished since last call"""
+        finished = []
+        for job in self.jobs_for(owner):
+            if job.status in FINISHED and not job.applied:
+                if job.status == DONE:
+                    job.apply()
+                else:
+                    job.applied = True
+                finished.append(job)
+        return finished
+
+    def forget(self, owner: str):
+        """Cancel an owner's outstanding jobs and drop its history"""
+        for job in self.jobs_for(owner):
+            self.cancel(job.job_id)
+        with self._cond:
+            for job_id in self._by_owner.pop(owner, ()):
+                self._jobs.pop(job_id, None)
+            self._seen.pop(owner, None)
+
+    def shutdown(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join()
+
+
+# ========================================
+# BENCHMARK
+# ========================================
+
+def benchmark(sessions: int = 50, jobs_per_session: int = 20, job_seconds: float = 0.01,
+              workers: int = JOB_WORKERS) -> Dict:
+    """Many sessions submitting at once: throughput and per-session first-result latency"""
+    manager = JobManager(workers=workers)
+
+    def work(job):
+        time.sleep(job_seconds)
+        return job.job_id
+
+    start = time.perf_counter()
+    first_done: Dict[str, float] = {}
+    jobs = []
+    # One greedy session queues everything first; fair scheduling keeps the others moving
+    for session in range(sessions):
+        count = jobs_per_session * (5 if session == 0 else 1)
+        for _ in range(count):
+            jobs.append(manager.submit(f"session-{session}", "bench", work))
+    while any(job.active for job in jobs):
+        now = time.perf_counter() - start
+        for job in jobs:
+            if job.status == DONE and job.owner not in first_done:
+                first_done[job.owner] = now
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    manager.shutdown()
+
+    waits = sorted(first_done.values())
+    return {
+        "sessions": sessions,
+        "jobs": len(jobs),
+        "workers": workers,
+        "seconds": round(elapsed, 3),
+        "jobs_per_sec": round(len(jobs) / elapsed, 1),
+        "ideal_jobs_per_sec": round(workers / job_seconds, 1),
+        "first_result_p50_ms": round(waits[len(waits) // 2] * 1000, 1),
+        "first_result_max_ms": round(waits[-1] * 1000, 1),
+    }
+
+
+if __name__ == "__main__":
+    print(benchmark())
@@ -0,0 +1,295 @@
+"""
+Inverted-index requirement matcher
+Indexes vendor proposal text (terms, requirement bigrams and numeric facts
+such as "650,000 sq ft" or "99.95% uptime") and scores every SOW requirement
+for every vendor in one pass over the postings. New submissions are indexed
+incrementally.
+"""
+
+import math
+import re
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:[-/][a-z0-9]+)*")
+
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "into",
+    "is", "it", "of", "on", "or", "the", "to", "with", "within", "equivalent",
+    "required", "requirement", "capability", "capabilities", "services", "service",
+    "minimum", "maximum", "least", "than", "less", "more", "per", "day", "days",
+}
+
+# Unit spellings normalised to one key
+UNIT_ALIASES = {
+    "sq ft": "sqft", "sq. ft": "sqft", "sq. ft.": "sqft", "sqft": "sqft",
+    "square feet": "sqft", "square foot": "sqft",
+    "%": "%",
+    "hour": "hours", "hours": "hours", "hr": "hours", "hrs": "hours",
+    "minute": "minutes", "minutes": "minutes", "mins": "minutes", "min": "minutes",
+    "day": "days", "days": "days",
+    "units/day": "units/day", "units per day": "units/day", "units a day": "units/day",
+}
+
+# Units where a smaller number is better unless the text says otherwise
+LOWER_IS_BETTER = {"hours", "minutes", "days"}
+
+# Words after a percentage that name what it measures
+PERCENT_CONTEXT = {"uptime": "uptime", "availability": "uptime", "accuracy": "accuracy",
+                   "on-time": "on-time", "fill": "fill"}
+
+_NUMBER = r"(?P<num>\d{1,3}(?:,\d{3})+|\d+(?:\.\d+)?)"
+_UNIT = r"(?P<unit>sq\.? ?ft\.?|sqft|square (?:feet|foot)|%|hours?|hrs?|minutes?|mins?|days?|units(?: per| a)? ?/?day)"
+_NUMERIC_RE = re.compile(
+    _NUMBER + r"\s*(?P<plus>\+)?\s*" + _UNIT + r"(?:\s+(?P<context>[a-z-]+))?",
+    re.IGNORECASE,
+)
+
+# Comparators looked up in the few characters before a number (longest first)
+_AT_MOST = ("less than", "maximum of", "at most", "maximum", "up to", "within",
+            "under", "below", "max", "<=", "<")
+_AT_LEAST = ("minimum of", "more than", "at least", "minimum", "above", "over",
+             "min", ">=", ">")
+_OP_WINDOW = 12
+
+
+def tokenize(text: str) -> List[str]:
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+@lru_cache(maxsize=4096)
+def _unit_key(unit: str, context: Optional[str]) -> str:
+    unit = re.sub(r"\s+", " ", unit.lower().strip())
+    key = UNIT_ALIASES.get(unit)
+    if key is None:
+        key = "units/day" if unit.startswith("units") else unit
+    if key == "%" and context:
+        key = "%" + PERCENT_CONTEXT.get(context.lower(), context.lower())
+    return key
+
+
+def extract_numeric(text: str) -> List[Tuple[str, str, float]]:
+    """Numeric facts/thresholds as (unit_key, op, value), op is '>=' or '<='"""
+    facts = []
+    for match in _NUMERIC_RE.finditer(text):
+        value = float(match.group("num").replace(",", ""))
+        unit = _unit_key(match.group("unit"), match.group("context"))
+        before = text[max(0, match.start() - _OP_WINDOW):match.start()].lower().rstrip()
+        if match.group("plus") or before.endswith(_AT_LEAST):
+            op = ">="
+        elif before.endswith(_AT_MOST):
+            op = "<="
+        else:
+            op = "<=" if unit in LOWER_IS_BETTER else ">="
+        facts.append((unit, op, value))
+    return facts
+
+
+def numeric_extremes(text: str) -> Dict[str, Tuple[float, float]]:
+    """Smallest and largest value stated per unit, for indexing proposal text"""
+    extremes: Dict[str, Tuple[float, float]] = {}
+    for num, _, unit, context in _NUMERIC_RE.findall(text):
+        value = float(num.replace(",", ""))
+        key = _unit_key(unit, context or None)
+        seen = extremes.get(key)
+        extremes[key] = (value, value) if seen is None else (min(seen[0], value), max(seen[1], value))
+    return extremes
+
+
+class Requirement:
+    """A parsed SOW requirement"""
+    def __init__(self, service: str, text: str):
+        self.service = service
+        self.text = text
+        tokens = tokenize(_NUMERIC_RE.sub(" ", text))
+        self.terms = sorted(set(tokens))
+        self.bigrams = sorted({f"{a} {b}" for a, b in zip(tokens, tokens[1:])})
+        self.thresholds = extract_numeric(text)
+
+
+class RequirementMatcher:
+    """Inverted index over proposal text, scored against SOW requirements"""
+
+    # Share of a requirement's score coming from numeric thresholds when it has any
+    NUMERIC_WEIGHT = 0.4
+    BIGRAM_WEIGHT = 0.3
+
+    def __init__(self, requirements: Dict[str, Sequence[str]]):
+        self.requirements: List[Requirement] = [
+            Requirement(service, text) for service, texts in requirements.items() for text in texts
+        ]
+        self._bigram_vocabulary: Set[str] = {b for r in self.requirements for b in r.bigrams}
+        self._bigram_first_words: Set[str] = {b.split(" ", 1)[0] for b in self._bigram_vocabulary}
+
+        self.vendor_ids: List[str] = []
+        self._vendor_cols: Dict[str, int] = {}
+        self._indexed: Set[Tuple[str, str]] = set()
+
+        # term -> set of vendor columns containing it
+        self.postings: Dict[str, Set[int]] = {}
+        # unit -> vendor column -> best value seen (max and min)
+        self._numeric_max: Dict[str, Dict[int, float]] = {}
+        self._numeric_min: Dict[str, Dict[int, float]] = {}
+        self.version = 0
+
+    def __len__(self):
+        return len(self.vendor_ids)
+
+    def _vendor_col(self, vendor_id: str) -> int:
+        col = self._vendor_cols.get(vendor_id)
+        if col is None:
+            col = self._vendor_cols[vendor_id] = len(self.vendor_ids)
+            self.vendor_ids.append(vendor_id)
+        return col
+
+    def add_document(self, vendor_id: str, doc_key: str, texts: Iterable[str]) -> bool:
+        """Index one vendor document (an iterable of text chunks)"""
+        if (vendor_id, doc_key) in self._indexed:
+            return False
+        self._indexed.add((vendor_id, doc_key))
+        col = self._vendor_col(vendor_id)
+
+        # One pass over the whole document; chunk boundaries only split bigrams
+        text = "\n".join(texts)
+        tokens = tokenize(text)
+        for term in set(tokens):
+            self.postings.setdefault(term, set()).add(col)
+        first_words = self._bigram_first_words
+        for i in range(len(tokens) - 1):
+            if tokens[i] in first_words:
+                bigram = f"{tokens[i]} {tokens[i + 1]}"
+                if bigram in self._bigram_vocabulary:
+                    self.postings.setdefault(bigram, set()).add(col)
+        for unit, (smallest, largest) in numeric_extremes(text).items():
+            high = self._numeric_max.setdefault(unit, {})
+            low = self._numeric_min.setdefault(unit, {})
+            high[col] = max(largest, high.get(col, largest))
+            low[col] = min(smallest, low.get(col, smallest))
+        self.version += 1
+        return True
+
+    def sync(self, vendor_documents: Dict[str, Dict[str, Dict]]) -> int:
+        """Index any ingested vendor documents not seen yet, returns count added"""
+        added = 0
+        for vendor_id, documents in vendor_documents.items():
+            for doc_key, record in documents.items():
+                if (vendor_id, doc_key) not in self._indexed:
+                    chunks = (chunk["text"] for chunk in record.get("chunks", []))
+                    added += self.add_document(vendor_id, doc_key, chunks)
+        return added
+
+    def _idf(self, term: str) -> float:
+        n = len(self.vendor_ids)
+        df = len(self.postings.get(term, ()))
+        return math.log((n + 1) / (df + 1)) + 1.0
+
+    def coverage(self) -> np.ndarray:
+        """Vendors x requirements matrix of coverage scores in [0, 1]"""
+        n_vendors = len(self.vendor_ids)
+        matrix = np.zeros((n_vendors, len(self.requirements)))
+        if not n_vendors:
+            return matrix
+
+        for j, requirement in enumerate(self.requirements):
+            term_score = np.zeros(n_vendors)
+            term_total = 0.0
+            for terms, weight in ((requirement.terms, 1.0 - self.BIGRAM_WEIGHT),
+                                  (requirement.bigrams, self.BIGRAM_WEIGHT)):
+                if not terms:
+                    continue
+                idfs = [self._idf(t) for t in terms]
+                partial = np.zeros(n_vendors)
+                for term, idf in zip(terms, idfs):
+                    cols = self.postings.get(term)
+                    if cols:
+                        partial[np.fromiter(cols, dtype=np.intp, count=len(cols))] += idf
+                term_score += weight * partial / sum(idfs)
+                term_total += weight
+            score = term_score / term_total if term_total else term_score
+
+            if requirement.thresholds:
+                satisfied = np.zeros(n_vendors)
+                for unit, op, threshold in requirement.thresholds:
+                    best = (self._numeric_max if op == ">=" else self._numeric_min).get(unit, {})
+                    if not best:
+                        continue
+                    cols = np.fromiter(best.keys(), dtype=np.intp, count=len(best))
+                    values = np.fromiter(best.values(), dtype=np.float64, count=len(best))
+                    ok = values >= threshold if op == ">=" else values <= threshold
+                    satisfied[cols] += ok
+                satisfied /= len(requirement.thresholds)
+                score = (1 - self.NUMERIC_WEIGHT) * score + self.NUMERIC_WEIGHT * satisfied
+            matrix[:, j] = score
+        return matrix
+
+    def requirement_columns(self, services: Optional[Iterable[str]] = None,
+                            keywords: Optional[Iterable[str]] = None) -> List[int]:
+        services = set(services) if services is not None else None
+        keywords = [k.lower() for k in keywords] if keywords else None
+        return [j for j, r in enumerate(self.requirements)
+                if (services is None or r.service in services)
+                and (keywords is None or any(k in r.text.lower() for k in keywords))]
+
+    def vendor_coverage(self, coverage: np.ndarray, vendor_id: str,
+                        columns: Sequence[int]) -> Optional[float]:
+        """Mean coverage for a vendor over the given requirement columns"""
+        col = self._vendor_cols.get(vendor_id)
+        if col is None or not len(columns):
+            return None
+        return float(coverage[col, list(columns)].mean())
+
+
+# ========================================
+# BENCHMARK
+# ========================================
+
+def benchmark(requirements: Dict[str, Sequence[str]], vendors: int = 200,
+              pages_per_vendor: int = 1000, seed: int = 0) -> Dict:
+    """Index synthetic proposals and score every requirement for every vendor"""
+    rng = np.random.default_rng(seed)
+    vocabulary = sorted({t for texts in requirements.values() for text in texts for t in tokenize(text)})
+    filler = "the vendor provides logistics operations across regional facilities".split()
+    matcher = RequirementMatcher(requirements)
+
+    documents = []
+    for v in range(vendors):
+        texts = []
+        for _ in range(pages_per_vendor):
+            words = list(rng.choice(vocabulary, 20)) + filler
+            words.append(f"{int(rng.integers(300, 900)) * 1000:,} sq ft")
+            words.append(f"{rng.uniform(99, 100):.2f}% uptime")
+            words.append(f"response < {int(rng.integers(1, 5))} hours")
+            texts.append(" ".join(words))
+        documents.append((f"V{v}", texts))
+    pages = vendors * pages_per_vendor
+
+    start = time.perf_counter()
+    for vendor_id, texts in documents:
+        matcher.add_document(vendor_id, "proposal", texts)
+    index_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    coverage = matcher.coverage()
+    score_seconds = time.perf_counter() - start
+    return {
+        "vendors": vendors,
+        "pages": pages,
+        "requirements": coverage.shape[1],
+        "index_seconds": round(index_seconds, 3),
+        "pages_per_sec": round(pages / index_seconds, 1),
+        "score_ms": round(score_seconds * 1000, 3),
+    }
+
+
+if __name__ == "__main__":
+    sample = {
+        "Warehouse Services": ["Storage capacity (minimum 500,000 sq ft)",
+                               "24/7 operations capability with 99.9% uptime"],
+        "Customer Service Operations": ["Response time SLAs (< 2 hours)",
+                                        "Quality inspection processes (99.5% accuracy)"],
+        "Consumer Solutions Group": ["Kitting services (10,000+ units/day capacity)"],
+    }
+    print(benchmark(sample, vendors=100, pages_per_vendor=200))
@@ -0,0 +1,463 @@
+"""
+Pluggable persistence for RFP state
+Vendors, workflow stage state and RFP documents are stored per workspace;
+each RFP in the portfolio is one workspace. The SQLite backend runs in WAL
+mode so many evaluator sessions can read while one writes; writes are
+batched into single transactions and vendor details are loaded lazily, one
+row at a time, on demand. Per-vendor-name rollups for cross-RFP analytics
+are updated in the same transactions as the vendor rows they summarise.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+DEFAULT_STATE_URL = "sqlite:///rfp_state.db"
+WRITE_BATCH_SIZE = 1000
+# Ids bound per "IN (...)" query; SQLite before 3.32 allows 999 parameters
+QUERY_ID_LIMIT = 900
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    return str(value)
+
+
+def _json_hook(value):
+    if "__datetime__" in value and len(value) == 1:
+        return datetime.fromisoformat(value["__datetime__"])
+    return value
+
+
+def dumps(value) -> str:
+    return json.dumps(value, default=_json_default, separators=(",", ":"))
+
+
+def loads(text: Optional[str]):
+    return json.loads(text, object_hook=_json_hook) if text else None
+
+
+class StateBackend:
+    """Interface for RFP state storage, keyed by workspace"""
+
+    # False when saved state is not kept anywhere outside the session
+    persistent = True
+
+    def load_vendor_summaries(self, workspace: str, since_seq: int = 0) -> Tuple[List[Dict], int]:
+        """Columnar vendor fields changed after since_seq, plus the latest seq"""
+        raise NotImplementedError
+
+    def load_vendor_details(self, workspace: str, vendor_id: str) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def existing_vendor_ids(self, workspace: str, vendor_ids: Iterable[str]) -> Set[str]:
+        """The subset of vendor_ids already stored in workspace"""
+        raise NotImplementedError
+
+    def save_vendors(self, workspace: str, records: Iterable[Dict]):
+        raise NotImplementedError
+
+    def delete_vendors(self, workspace: str, vendor_ids: Iterable[str]):
+        raise NotImplementedError
+
+    def load_stages(self, workspace: str) -> Dict[str, Dict]:
+        raise NotImplementedError
+
+    def save_stages(self, workspace: str, records: Iterable[Dict]):
+        raise NotImplementedError
+
+    def load_documents(self, workspace: str) -> Dict[str, Dict]:
+        raise NotImplementedError
+
+    def save_documents(self, workspace: str, documents: Dict[str, Dict]):
+        raise NotImplementedError
+
+    def clear_workspace(self, workspace: str):
+        raise NotImplementedError
+
+    def list_rfps(self) -> List[Dict]:
+        """Portfolio entries (workspace, title, created), oldest first"""
+        raise NotImplementedError
+
+    def save_rfp(self, workspace: str, title: str, created: datetime):
+        raise NotImplementedError
+
+    def load_rollups(self) -> List[Dict]:
+        """Per workspace and vendor name: proposals, evaluated and score_sum"""
+        raise NotImplementedError
+
+    def load_awards(self) -> List[Dict]:
+        raise NotImplementedError
+
+    def save_award(self, workspace: str, assignments: Dict[str, Tuple[str, str]]):
+        """Record the awarded (vendor_id, name) per service, replacing any earlier award"""
+        raise NotImplementedError
+
+
+class SessionOnlyBackend(StateBackend):
+    """No-op backend: state lives only in the Streamlit session"""
+    persistent = False
+
+    def load_vendor_summaries(self, workspace, since_seq=0):
+        return [], since_seq
+
+    def load_vendor_details(self, workspace, vendor_id):
+        return None
+
+    def existing_vendor_ids(self, workspace, vendor_ids):
+        return set()
+
+    def save_vendors(self, workspace, records):
+        pass
+
+    def delete_vendors(self, workspace, vendor_ids):
+        pass
+
+    def load_stages(self, workspace):
+        return {}
+
+    def save_stages(self, workspace, records):
+        pass
+
+    def load_documents(self, workspace):
+        return {}
+
+    def save_documents(self, workspace, documents):
+        pass
+
+    def clear_workspace(self, workspace):
+        pass
+
+    def list_rfps(self):
+        return []
+
+    def save_rfp(self, workspace, title, created):
+        pass
+
+    def load_rollups(self):
+        return []
+
+    def load_awards(self):
+        return []
+
+    def save_award(self, workspace, assignments):
+        pass
+
+
+class SQLiteBackend(StateBackend):
+    """SQLite (WAL) backend with one connection per thread"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS vendors (
+        workspace TEXT NOT NULL,
+        vendor_id TEXT NOT NULL,
+        name TEXT,
+        status TEXT,
+        service_model TEXT,
+        services TEXT,
+        certifications TEXT,
+        overall_score REAL,
+        scores TEXT,
+        details TEXT,
+        seq INTEGER NOT NULL,
+        PRIMARY KEY (workspace, vendor_id)
+    );
+    CREATE INDEX IF NOT EXISTS vendors_seq ON vendors (workspace, seq);
+    CREATE TABLE IF NOT EXISTS vendor_tombstones (
+        workspace TEXT NOT NULL,
+        vendor_id TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        PRIMARY KEY (workspace, vendor_id)
+    );
+    CREATE TABLE IF NOT EXISTS stages (
+        workspace TEXT NOT NULL,
+        stage_id TEXT NOT NULL,
+        state TEXT,
+        PRIMARY KEY (workspace, stage_id)
+    );
+    CREATE TABLE IF NOT EXISTS documents (
+        workspace TEXT NOT NULL,
+        doc_key TEXT NOT NULL,
+        document TEXT,
+        PRIMARY KEY (workspace, doc_key)
+    );
+    CREATE TABLE IF NOT EXISTS sequence (
+        workspace TEXT PRIMARY KEY,
+        seq INTEGER NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS rfps (
+        workspace TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        created TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS vendor_rollups (
+        workspace TEXT NOT NULL,
+        name TEXT NOT NULL,
+        proposals INTEGER NOT NULL,
+        evaluated INTEGER NOT NULL,
+        score_sum REAL NOT NULL,
+        PRIMARY KEY (workspace, name)
+    );
+    CREATE TABLE IF NOT EXISTS awards (
+        workspace TEXT NOT NULL,
+        service TEXT NOT NULL,
+        vendor_id TEXT NOT NULL,
+        name TEXT NOT NULL,
+        awarded TEXT NOT NULL,
+        PRIMARY KEY (workspace, service)
+    );
+    """
+    # Title given to workspaces that predate the portfolio
+    UNTITLED = "Untitled RFP"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._connect().executescript(self.SCHEMA)
+        self._migrate()
+
+    def _migrate(self):
+        """Register pre-portfolio workspaces, build their rollups and lift certifications once"""
+        with self._transaction() as conn:
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(vendors)")}
+            if "certifications" not in columns:
+                # Older databases kept certifications in the details JSON only
+                conn.execute("ALTER TABLE vendors ADD COLUMN certifications TEXT")
+                conn.execute("UPDATE vendors SET certifications = json_extract(details, '$.certifications')")
+            conn.execute(
+                "INSERT OR IGNORE INTO rfps (workspace, title, created) "
+                "SELECT workspace, ?, ? FROM (SELECT workspace FROM sequence UNION "
+                "SELECT workspace FROM stages UNION SELECT workspace FROM documents)",
+                (self.UNTITLED, datetime.now().isoformat()))
+            if (conn.execute("SELECT 1 FROM vendors LIMIT 1").fetchone()
+                    and not conn.execute("SELECT 1 FROM vendor_rollups LIMIT 1").fetchone()):
+                conn.execute(
+                    "INSERT INTO vendor_rollups (workspace, name, proposals, evaluated, score_sum) "
+                    "SELECT workspace, name, COUNT(*), SUM(status = 'Evaluated'), "
+                    "TOTAL(CASE WHEN status = 'Evaluated' THEN overall_score END) "
+                    "FROM vendors GROUP BY workspace, name")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _apply_rollups(self, conn, workspace: str, vendor_ids: List[str], new_rows: Iterable[Dict] = ()):
+        """Move per-name rollups from the stored rows of vendor_ids to new_rows"""
+        deltas: Dict[str, List[float]] = {}
+
+        def add(name, status, score, sign):
+            delta = deltas.setdefault(name or "", [0, 0, 0.0])
+            delta[0] += sign
+            if status == "Evaluated":
+                delta[1] += sign
+                delta[2] += sign * (score or 0.0)
+
+        # Distinct ids, so a vendor split across chunks is not subtracted twice
+        stored = list(dict.fromkeys(vendor_ids))
+        for start in range(0, len(stored), QUERY_ID_LIMIT):
+            chunk = stored[start:start + QUERY_ID_LIMIT]
+            for name, status, score in conn.execute(
+                    f"SELECT name, status, overall_score FROM vendors "
+                    f"WHERE workspace = ? AND vendor_id IN ({','.join('?' * len(chunk))})", (workspace, *chunk)):
+                add(name, status, score, -1)
+        # A vendor listed twice in one batch is stored once, with its last record
+        for r in {r["vendor_id"]: r for r in new_rows}.values():
+            add(r["name"], r["status"], r["overall_score"], 1)
+        conn.executemany(
+            "INSERT INTO vendor_rollups (workspace, name, proposals, evaluated, score_sum) "
+            "VALUES (?, ?, ?, ?, ?) ON CONFLICT (workspace, name) DO UPDATE SET "
+            "proposals = proposals + excluded.proposals, evaluated = evaluated + excluded.evaluated, "
+            "score_sum = score_sum + excluded.score_sum",
+            [(workspace, name, *delta) for name, delta in deltas.items() if any(delta)])
+        conn.execute("DELETE FROM vendor_rollups WHERE workspace = ? AND proposals <= 0", (workspace,))
+
+    def _next_seq(self, conn, workspace: str) -> int:
+        conn.execute("INSERT OR IGNORE INTO sequence (workspace, seq) VALUES (?, 0)", (workspace,))
+        conn.execute("UPDATE sequence SET seq = seq + 1 WHERE workspace = ?", (workspace,))
+        return conn.execute("SELECT seq FROM sequence WHERE workspace = ?", (workspace,)).fetchone()[0]
+
+    # ---- vendors ----
+
+    def load_vendor_summaries(self, workspace, since_seq=0):
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT vendor_id, name, status, service_model, services, certifications, overall_score, "
+            "scores, seq "
+            "FROM vendors WHERE workspace = ? AND seq > ? ORDER BY seq",
+            (workspace, since_seq)).fetchall()
+        tombstones = conn.execute(
+            "SELECT vendor_id, seq FROM vendor_tombstones WHERE workspace = ? AND seq > ?",
+            (workspace, since_seq)).fetchall()
+
+        latest = since_seq
+        records = []
+        for vendor_id, name, status, model, services, certifications, overall, scores, seq in rows:
+            records.append({
+                "vendor_id": vendor_id,
+                "name": name,
+                "status": status,
+                "service_model": model,
+                "services_offered": loads(services) or [],
+                "certifications": loads(certifications) or [],
+                "overall_score": overall or 0,
+                "scores": loads(scores) or {},
+            })
+            latest = max(latest, seq)
+        for vendor_id, seq in tombstones:
+            records.append({"vendor_id": vendor_id, "deleted": True})
+            latest = max(latest, seq)
+        return records, latest
+
+    def load_vendor_details(self, workspace, vendor_id):
+        row = self._connect().execute(
+            "SELECT details FROM vendors WHERE workspace = ? AND vendor_id = ?",
+            (workspace, vendor_id)).fetchone()
+        return loads(row[0]) if row else None
+
+    def existing_vendor_ids(self, workspace, vendor_ids):
+        vendor_ids = list(vendor_ids)
+        conn = self._connect()
+        found = set()
+        for start in range(0, len(vendor_ids), QUERY_ID_LIMIT):
+            chunk = vendor_ids[start:start + QUERY_ID_LIMIT]
+            found.update(vendor_id for (vendor_id,) in conn.execute(
+                f"SELECT vendor_id FROM vendors WHERE workspace = ? AND vendor_id IN ({','.join('?' * len(chunk))})",
+                (workspace, *chunk)))
+        return found
+
+    def save_vendors(self, workspace, records):
+        records = list(records)
+        for start in range(0, len(records), WRITE_BATCH_SIZE):
+            batch = records[start:start + WRITE_BATCH_SIZE]
+            with self._transaction() as conn:
+                seq = self._next_seq(conn, workspace)
+                self._apply_rollups(conn, workspace, [r["vendor_id"] for r in batch], batch)
+                conn.executemany(
+                    "INSERT OR REPLACE INTO vendors (workspace, vendor_id, name, status, service_model, "
+                    "services, certifications, overall_score, scores, details, seq) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(workspace, r["vendor_id"], r["name"], r["status"], r["service_model"],
+                      dumps(r["services_offered"]), dumps(r["certifications"]), r["overall_score"],
+                      dumps(r["scores"]), dumps(r.get("details", {})), seq) for r in batch])
+                conn.executemany(
+                    "DELETE FROM vendor_tombstones WHERE workspace = ? AND vendor_id = ?",
+                    [(workspace, r["vendor_id"]) for r in batch])
+
+    def delete_vendors(self, workspace, vendor_ids):
+        vendor_ids = list(vendor_ids)
+        if not vendor_ids:
+            return
+        with self._transaction() as conn:
+            seq = self._next_seq(conn, workspace)
+            for start in range(0, len(vendor_ids), WRITE_BATCH_SIZE):
+                self._apply_rollups(conn, workspace, vendor_ids[start:start + WRITE_BATCH_SIZE])
+            conn.executemany("DELETE FROM vendors WHERE workspace = ? AND vendor_id = ?",
+                             [(workspace, vid) for vid in vendor_ids])
+            conn.executemany(
+                "INSERT OR REPLACE INTO vendor_tombstones (workspace, vendor_id, seq) VALUES (?, ?, ?)",
+                [(workspace, vid, seq) for vid in vendor_ids])
+
+    # ---- workflow stages ----
+
+    def load_stages(self, workspace):
+        rows = self._connect().execute(
+            "SELECT stage_id, state FROM stages WHERE workspace = ?", (workspace,)).fetchall()
+        return {stage_id: loads(state) for stage_id, state in rows}
+
+    def save_stages(self, workspace, records):
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO stages (workspace, stage_id, state) VALUES (?, ?, ?)",
+                [(workspace, r["stage_id"], dumps(r)) for r in records])
+
+    # ---- documents ----
+
+    def load_documents(self, workspace):
+        rows = self._connect().execute(
+            "SELECT doc_key, document FROM documents WHERE workspace = ?", (workspace,)).fetchall()
+        return {key: loads(doc) for key, doc in rows}
+
+    def save_documents(self, workspace, documents):
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM documents WHERE workspace = ?", (workspace,))
+            conn.executemany(
+                "INSERT INTO documents (workspace, doc_key, document) VALUES (?, ?, ?)",
+                [(workspace, key, dumps(doc)) for key, doc in documents.items()])
+
+    def clear_workspace(self, workspace):
+        with self._transaction() as conn:
+            seq = self._next_seq(conn, workspace)
+            conn.execute(
+                "INSERT OR REPLACE INTO vendor_tombstones (workspace, vendor_id, seq) "
+                "SELECT workspace, vendor_id, ? FROM vendors WHERE workspace = ?", (seq, workspace))
+            for table in ("vendors", "stages", "documents", "vendor_rollups", "awards"):
+                conn.execute(f"DELETE FROM {table} WHERE workspace = ?", (workspace,))
+
+    # ---- portfolio ----
+
+    def list_rfps(self):
+        rows = self._connect().execute(
+            "SELECT workspace, title, created FROM rfps ORDER BY created, workspace").fetchall()
+        return [{"workspace": w, "title": t, "created": datetime.fromisoformat(c)} for w, t, c in rows]
+
+    def save_rfp(self, workspace, title, created):
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO rfps (workspace, title, created) VALUES (?, ?, ?) "
+                "ON CONFLICT (workspace) DO UPDATE SET title = excluded.title",
+                (workspace, title, created.isoformat()))
+
+    def load_rollups(self):
+        rows = self._connect().execute(
+            "SELECT workspace, name, proposals, evaluated, score_sum FROM vendor_rollups").fetchall()
+        return [{"workspace": w, "name": n, "proposals": p, "evaluated": e, "score_sum": s}
+                for w, n, p, e, s in rows]
+
+    def load_awards(self):
+        rows = self._connect().execute(
+            "SELECT workspace, service, vendor_id, name, awarded FROM awards").fetchall()
+        return [{"workspace": w, "service": s, "vendor_id": v, "name": n, "awarded": datetime.fromisoformat(a)}
+                for w, s, v, n, a in rows]
+
+    def save_award(self, workspace, assignments):
+        awarded = datetime.now().isoformat()
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM awards WHERE workspace = ?", (workspace,))
+            conn.executemany(
+                "INSERT INTO awards (workspace, service, vendor_id, name, awarded) VALUES (?, ?, ?, ?, ?)",
+                [(workspace, service, vendor_id, name, awarded)
+                 for service, (vendor_id, name) in assignments.items()])
+
+
+def open_backend(url: Optional[str] = None) -> StateBackend:
+    """Open a backend from a URL: sqlite:///path.db or session://"""
+    url = url or os.environ.get("RFP_STATE_URL", DEFAULT_STATE_URL)
+    if url.startswith("session://"):
+        return SessionOnlyBackend()
+    if url.startswith("sqlite:///"):
+        return SQLiteBackend(url[len("sqlite:///"):])
+    raise ValueError(f"Unsupported state backend URL: {url}")
@@ -0,0 +1,201 @@
+"""
+Portfolio of RFPs
+Each RFP is one workspace in the state backend, holding its own workflow,
+vendors and documents; a session loads only the active one. Cross-RFP
+analytics (per-RFP summaries, vendor participation and win rates, score
+trends) are built from the backend's per-vendor-name rollups and award
+records, so they never read vendor rows from any workspace.
+"""
+
+import re
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+
+class RFPSummary(NamedTuple):
+    """One RFP's rollup: proposals are vendor rows of any status"""
+    workspace: str
+    title: str
+    created: datetime
+    proposals: int
+    evaluated: int
+    mean_score: Optional[float]
+    winners: Tuple[str, ...]
+
+
+class VendorRecord(NamedTuple):
+    """A vendor's history across the portfolio, keyed by name"""
+    name: str
+    rfps: int
+    evaluated_rfps: int
+    wins: int
+    mean_score: Optional[float]
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.rfps if self.rfps else 0.0
+
+
+def new_workspace(title: str) -> str:
+    """Workspace key for a new RFP: a slug of the title plus a short unique suffix"""
+    slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-")[:40] or "rfp"
+    return f"{slug}-{uuid.uuid4().hex[:6]}"
+
+
+class PortfolioView:
+    """Cross-RFP analytics over rollup rows
+
+    rfps, rollups and awards are the rows returned by a backend's
+    list_rfps(), load_rollups() and load_awards().
+    """
+    def __init__(self, rfps: Iterable[Dict], rollups: Iterable[Dict], awards: Iterable[Dict],
+                 untitled: str = "Untitled RFP"):
+        self._rollups: Dict[str, List[Dict]] = {}
+        for row in rollups:
+            self._rollups.setdefault(row["workspace"], []).append(row)
+        winners: Dict[str, set] = {}
+        for award in awards:
+            winners.setdefault(award["workspace"], set()).add(award["name"])
+        self._winners = winners
+
+        entries = {rfp["workspace"]: rfp for rfp in rfps}
+        # Workspaces with data but no portfolio entry still count
+        for workspace in set(self._rollups) - set(entries):
+            entries[workspace] = {"workspace": workspace, "title": untitled, "created": datetime.min}
+
+        self.rfps: List[RFPSummary] = []
+        for rfp in sorted(entries.values(), key=lambda r: (r["created"], r["workspace"])):
+            rows = self._rollups.get(rfp["workspace"], [])
+            evaluated = sum(r["evaluated"] for r in rows)
+            score_sum = sum(r["score_sum"] for r in rows)
+            self.rfps.append(RFPSummary(
+                rfp["workspace"], rfp["title"], rfp["created"],
+                proposals=sum(r["proposals"] for r in rows),
+                evaluated=evaluated,
+                mean_score=score_sum / evaluated if evaluated else None,
+                winners=tuple(sorted(winners.get(rfp["workspace"], ()))),
+            ))
+        self._created = {summary.workspace: summary.created for summary in self.rfps}
+        self._titles = {summary.workspace: summary.title for summary in self.rfps}
+
+    def vendors(self, min_rfps: int = 1) -> List[VendorRecord]:
+        """Vendors in at least min_rfps RFPs, most wins then most RFPs first"""
+        totals: Dict[str, List] = {}
+        for workspace, rows in self._rollups.items():
+            won = self._winners.get(workspace, ())
+            for row in rows:
+                total = totals.setdefault(row["name"], [0, 0, 0, 0, 0.0])
+                total[0] += 1
+                total[1] += row["evaluated"] > 0
+                total[2] += row["name"] in won
+                total[3] += row["evaluated"]
+                total[4] += row["score_sum"]
+        records = [VendorRecord(name, rfps, evaluated_rfps, wins, score_sum / evaluated if evaluated else None)
+                   for name, (rfps, evaluated_rfps, wins, evaluated, score_sum) in totals.items()
+                   if rfps >= min_rfps]
+        records.sort(key=lambda v: (-v.wins, -v.rfps, v.name))
+        return records
+
+    def score_trend(self) -> List[RFPSummary]:
+        """RFPs with evaluated vendors, oldest first"""
+        return [summary for summary in self.rfps if summary.evaluated]
+
+    def vendor_history(self, name: str) -> List[Tuple[str, datetime, float, bool]]:
+        """(title, created, mean score, won) for each RFP where name was evaluated, oldest first"""
+        history = []
+        for workspace, rows in self._rollups.items():
+            for row in rows:
+                if row["name"] == name and row["evaluated"]:
+                    history.append((self._titles[workspace], self._created[workspace],
+                                    row["score_sum"] / row["evaluated"],
+                                    name in self._winners.get(workspace, ())))
+        history.sort(key=lambda h: h[1])
+        return history
+
+
+def load_portfolio(backend) -> PortfolioView:
+    return PortfolioView(backend.list_rfps(), backend.load_rollups(), backend.load_awards())
+
+
+def verify_rollups(backend, workspace: str) -> List[str]:
+    """Compare one workspace's rollups against a full scan of its vendors"""
+    records, _ = backend.load_vendor_summaries(workspace)
+    expected: Dict[str, List] = {}
+    for record in records:
+        if record.get("deleted"):
+            continue
+        total = expected.setdefault(record["name"] or "", [0, 0, 0.0])
+        total[0] += 1
+        if record["status"] == "Evaluated":
+            total[1] += 1
+            total[2] += record["overall_score"] or 0.0
+    stored = {r["name"]: [r["proposals"], r["evaluated"], r["score_sum"]]
+              for r in backend.load_rollups() if r["workspace"] == workspace}
+    mismatches = []
+    for name in set(expected) | set(stored):
+        want, have = expected.get(name, [0, 0, 0.0]), stored.get(name, [0, 0, 0.0])
+        if want[:2] != have[:2] or abs(want[2] - have[2]) > 1e-6 * max(1.0, abs(want[2])):
+            mismatches.append(f"rollup[{name}]: {have} != {want}")
+    return mismatches
+
+
+def benchmark(rfps: int = 40, vendors_per_rfp: int = 2000, names: int = 300, seed: int = 0) -> Dict:
+    """Portfolio analytics from rollups vs a scan of every workspace's vendors"""
+    import os
+    import random
+    import tempfile
+    from datetime import timedelta
+
+    from rfp_persistence import SQLiteBackend
+
+    rng = random.Random(seed)
+    backend = SQLiteBackend(os.path.join(tempfile.mkdtemp(prefix="rfp_portfolio_"), "state.db"))
+    pool = [f"Vendor {i:03d}" for i in range(names)]
+    start_date = datetime(2024, 1, 1)
+    for r in range(rfps):
+        workspace = f"rfp-{r:03d}"
+        backend.save_rfp(workspace, f"RFP {r}", start_date + timedelta(days=7 * r))
+        records = []
+        for v in range(vendors_per_rfp):
+            evaluated = rng.random() < 0.6
+            records.append({"vendor_id": f"VND-{v:05d}", "name": rng.choice(pool),
+                            "status": "Evaluated" if evaluated else "Submitted",
+                            "service_model": "Standalone", "services_offered": [], "certifications": [],
+                            "overall_score": rng.uniform(55, 95) if evaluated else 0, "scores": {}})
+        backend.save_vendors(workspace, records)
+        backend.save_award(workspace, {"Warehouse Services": ("VND-00000", records[0]["name"])})
+
+    start = time.perf_counter()
+    view = load_portfolio(backend)
+    vendors = view.vendors()
+    rollup_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scanned: Dict[str, Dict[str, List]] = {}
+    for summary in view.rfps:
+        records, _ = backend.load_vendor_summaries(summary.workspace)
+        for record in records:
+            total = scanned.setdefault(summary.workspace, {}).setdefault(record["name"], [0, 0.0])
+            if record["status"] == "Evaluated":
+                total[0] += 1
+                total[1] += record["overall_score"]
+    scan_seconds = time.perf_counter() - start
+
+    mismatches = [m for summary in view.rfps for m in verify_rollups(backend, summary.workspace)]
+    return {
+        "rfps": rfps,
+        "vendor_rows": rfps * vendors_per_rfp,
+        "rollup_rows": len(backend.load_rollups()),
+        "rollup_ms": round(rollup_seconds * 1000, 2),
+        "scan_ms": round(scan_seconds * 1000, 2),
+        "speedup": round(scan_seconds / rollup_seconds, 1),
+        "vendors": len(vendors),
+        "top_win_rate": round(vendors[0].win_rate, 3) if vendors else 0.0,
+        "consistent": not mismatches,
+    }
+
+
+if __name__ == "__main__":
+    print(benchmark())
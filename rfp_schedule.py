@@ -0,0 +1,355 @@
+"""
+Dependency-graph workflow scheduling
+Stages form a DAG with structured durations. Earliest/latest start and
+finish, slack and the critical path of the remaining work are kept up to
+date incrementally: a stage change re-propagates forward only through the
+descendants whose earliest finish moved, and backward only through the
+ancestors whose latest start moved, with a full backward pass only when the
+project finish itself moves.
+"""
+
+import heapq
+import math
+import re
+import time
+from datetime import date, timedelta
+from typing import Dict, List, Mapping, NamedTuple, Optional
+
+import plotly.graph_objects as go
+
+UNIT_DAYS = {"day": 1, "week": 7}
+_DURATION = re.compile(r"^\s*(\d+)\s*(days?|weeks?|d|w)\s*$", re.IGNORECASE)
+
+CRITICAL_COLOR = "#ef4444"
+STAGE_COLOR = "#3b82f6"
+SLACK_COLOR = "rgba(148, 163, 184, 0.35)"
+# Gantt rows are this many pixels high
+GANTT_ROW_PX = 22
+
+
+class Duration(NamedTuple):
+    """A whole number of days or weeks"""
+    amount: int
+    unit: str
+
+    @property
+    def days(self) -> int:
+        return self.amount * UNIT_DAYS[self.unit]
+
+    def __str__(self) -> str:
+        return f"{self.amount} {self.unit}{'' if self.amount == 1 else 's'}"
+
+
+def parse_duration(text: str) -> Duration:
+    """Parse "7 days", "1 day", "2 weeks", "3d" or "1w" into a Duration"""
+    match = _DURATION.match(text)
+    if not match:
+        raise ValueError(f"Unrecognised duration: {text!r}")
+    unit = match.group(2).lower()
+    return Duration(int(match.group(1)), "week" if unit.startswith("w") else "day")
+
+
+class ScheduleError(ValueError):
+    """Stage dependencies are unknown or cyclic"""
+
+
+class StageTiming(NamedTuple):
+    """Days from today; slack is how far a stage can slip without delaying the finish"""
+    earliest_start: int
+    earliest_finish: int
+    latest_start: int
+    latest_finish: int
+    remaining: int
+
+    @property
+    def slack(self) -> int:
+        return self.latest_start - self.earliest_start
+
+    @property
+    def critical(self) -> bool:
+        return self.slack == 0
+
+
+def remaining_days(stage) -> int:
+    """Days of work left: none when complete, the unfinished share when active"""
+    if stage.status == "complete":
+        return 0
+    days = stage.duration.days
+    if stage.status == "active":
+        return math.ceil(days * (100 - stage.progress) / 100)
+    return days
+
+
+class Schedule:
+    """Critical-path schedule of a workflow's remaining work
+
+    Stages need stage_id, depends_on, duration (a Duration), status and
+    progress. Attached stages report changes through stage_changed(); they
+    are applied on the next read.
+    """
+    def __init__(self, stages: Mapping[str, object]):
+        self.stages = stages
+        self.ids: List[str] = list(stages)
+        self._index = {stage_id: i for i, stage_id in enumerate(self.ids)}
+        self._preds: List[List[int]] = [[] for _ in self.ids]
+        self._succs: List[List[int]] = [[] for _ in self.ids]
+        for i, stage in enumerate(stages.values()):
+            for dependency in stage.depends_on:
+                if dependency not in self._index:
+                    raise ScheduleError(f"{stage.stage_id} depends on unknown stage {dependency}")
+                self._preds[i].append(self._index[dependency])
+                self._succs[self._index[dependency]].append(i)
+        self.order = self._topological_order()
+        self._rank = [0] * len(self.ids)
+        for rank, i in enumerate(self.order):
+            self._rank[i] = rank
+
+        self._duration = [remaining_days(stage) for stage in stages.values()]
+        n = len(self.ids)
+        self._es, self._ef, self._ls, self._lf = [0] * n, [0] * n, [0] * n, [0] * n
+        self.finish = self._forward(self._es, self._ef, self._duration)
+        self._backward(self._ls, self._lf, self._duration, self.finish)
+        self._pending = set()
+        # Bumped whenever a timing changes, for callers caching derived views
+        self.version = 0
+        # Stages recomputed by the last refresh (a full backward pass counts every stage)
+        self.touched = 0
+        for stage in stages.values():
+            stage._schedule = self
+
+    def _topological_order(self) -> List[int]:
+        indegree = [len(p) for p in self._preds]
+        # Ties resolved by workflow position, so independent stages keep their order
+        ready = [i for i, d in enumerate(indegree) if d == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            i = heapq.heappop(ready)
+            order.append(i)
+            for s in self._succs[i]:
+                indegree[s] -= 1
+                if indegree[s] == 0:
+                    heapq.heappush(ready, s)
+        if len(order) != len(self.ids):
+            cyclic = sorted(self.ids[i] for i, d in enumerate(indegree) if d > 0)
+            raise ScheduleError(f"Dependency cycle among: {', '.join(cyclic)}")
+        return order
+
+    def _forward(self, es: List[int], ef: List[int], duration: List[int]) -> int:
+        """Full forward pass; returns the project finish"""
+        for i in self.order:
+            es[i] = max((ef[p] for p in self._preds[i]), default=0)
+            ef[i] = es[i] + duration[i]
+        return max(ef, default=0)
+
+    def _backward(self, ls: List[int], lf: List[int], duration: List[int], finish: int):
+        for i in reversed(self.order):
+            lf[i] = min((ls[s] for s in self._succs[i]), default=finish)
+            ls[i] = lf[i] - duration[i]
+
+    def stage_changed(self, stage):
+        """Called by an attached stage after its status or progress changes"""
+        self._pending.add(self._index[stage.stage_id])
+
+    def refresh(self):
+        """Apply pending stage changes, touching only the stages they affect"""
+        if not self._pending:
+            return
+        changed = []
+        for i in self._pending:
+            days = remaining_days(self.stages[self.ids[i]])
+            if days != self._duration[i]:
+                self._duration[i] = days
+                changed.append(i)
+        self._pending.clear()
+        if not changed:
+            self.touched = 0
+            return
+
+        es, ef, ls, lf, duration, rank = self._es, self._ef, self._ls, self._lf, self._duration, self._rank
+        touched = 0
+        heap = [(rank[i], i) for i in changed]
+        heapq.heapify(heap)
+        queued = set(changed)
+        while heap:
+            _, i = heapq.heappop(heap)
+            touched += 1
+            es[i] = max((ef[p] for p in self._preds[i]), default=0)
+            finish = es[i] + duration[i]
+            if finish != ef[i]:
+                ef[i] = finish
+                for s in self._succs[i]:
+                    if s not in queued:
+                        queued.add(s)
+                        heapq.heappush(heap, (rank[s], s))
+
+        finish = max(ef, default=0)
+        if finish != self.finish:
+            self.finish = finish
+            self._backward(ls, lf, duration, finish)
+            touched += len(self.ids)
+        else:
+            heap = [(-rank[i], i) for i in changed]
+            heapq.heapify(heap)
+            queued = set(changed)
+            while heap:
+                _, i = heapq.heappop(heap)
+                touched += 1
+                lf[i] = min((ls[s] for s in self._succs[i]), default=self.finish)
+                start = lf[i] - duration[i]
+                if start != ls[i]:
+                    ls[i] = start
+                    for p in self._preds[i]:
+                        if p not in queued:
+                            queued.add(p)
+                            heapq.heappush(heap, (-rank[p], p))
+        self.touched = touched
+        self.version += 1
+
+    def timing(self, stage_id: str) -> StageTiming:
+        self.refresh()
+        i = self._index[stage_id]
+        return StageTiming(self._es[i], self._ef[i], self._ls[i], self._lf[i], self._duration[i])
+
+    def timings(self) -> Dict[str, StageTiming]:
+        """Every stage's timing, in topological order"""
+        self.refresh()
+        return {self.ids[i]: StageTiming(self._es[i], self._ef[i], self._ls[i], self._lf[i], self._duration[i])
+                for i in self.order}
+
+    def critical_path(self) -> List[str]:
+        """Zero-slack chain of remaining work from today to the finish"""
+        self.refresh()
+        es, ef, ls = self._es, self._ef, self._ls
+        current: Optional[int] = next((i for i in self.order if es[i] == ls[i] == 0), None)
+        path = []
+        while current is not None:
+            # Completed stages take no time, the chain runs through them
+            if self._duration[current]:
+                path.append(self.ids[current])
+            current = next((s for s in sorted(self._succs[current], key=self._rank.__getitem__)
+                            if ls[s] == es[s] == ef[current]), None)
+        return path
+
+    def blocked_by(self, stage_id: str) -> List[str]:
+        """Dependencies of a stage that are not complete yet"""
+        return [self.ids[p] for p in self._preds[self._index[stage_id]]
+                if self.stages[self.ids[p]].status != "complete"]
+
+    def verify(self) -> List[str]:
+        """Compare against a full recompute, returns a list of mismatches"""
+        incremental = self.timings()
+        duration = [remaining_days(stage) for stage in self.stages.values()]
+        n = len(self.ids)
+        es, ef, ls, lf = [0] * n, [0] * n, [0] * n, [0] * n
+        finish = self._forward(es, ef, duration)
+        self._backward(ls, lf, duration, finish)
+        mismatches = []
+        if finish != self.finish:
+            mismatches.append(f"schedule finish: {self.finish} != {finish}")
+        for i in self.order:
+            expected = (es[i], ef[i], ls[i], lf[i], duration[i])
+            if tuple(incremental[self.ids[i]]) != expected:
+                mismatches.append(f"schedule[{self.ids[i]}]: {tuple(incremental[self.ids[i]])} != {expected}")
+        return mismatches
+
+
+# ========================================
+# GANTT TIMELINE
+# ========================================
+
+def gantt_figure(schedule: Schedule, today: date) -> go.Figure:
+    """Remaining stages from their earliest start, with slack shaded; critical stages in red"""
+    timings = schedule.timings()
+    rows = [(schedule.stages[stage_id], timing) for stage_id, timing in timings.items() if timing.remaining]
+    day_ms = 86_400_000
+    labels = [stage.name for stage, _ in rows]
+    starts = [(today + timedelta(days=t.earliest_start)).isoformat() for _, t in rows]
+    finishes = [(today + timedelta(days=t.earliest_finish)).isoformat() for _, t in rows]
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        y=labels,
+        x=[t.remaining * day_ms for _, t in rows],
+        base=starts,
+        orientation="h",
+        name="Remaining work",
+        marker_color=[CRITICAL_COLOR if t.critical else STAGE_COLOR for _, t in rows],
+        customdata=[[t.remaining, t.slack, stage.status] for stage, t in rows],
+        hovertemplate="%{y}<br>%{customdata[0]} days left, %{customdata[1]} days slack "
+                      "(%{customdata[2]})<extra></extra>",
+    ))
+    fig.add_trace(go.Bar(
+        y=labels,
+        x=[t.slack * day_ms for _, t in rows],
+        base=finishes,
+        orientation="h",
+        name="Slack",
+        marker_color=SLACK_COLOR,
+        hoverinfo="skip",
+    ))
+    fig.add_vline(x=today.isoformat(), line_dash="dot", line_color="#64748b")
+    fig.update_layout(
+        title=f"Remaining schedule: {schedule.finish} days, {len(rows)} of {len(timings)} stages open",
+        barmode="overlay",
+        xaxis_type="date",
+        yaxis=dict(autorange="reversed", automargin=True),
+        height=max(300, 120 + GANTT_ROW_PX * len(rows)),
+        showlegend=False,
+    )
+    return fig
+
+
+def benchmark(lots: int = 50, changes: int = 2000, seed: int = 0) -> Dict:
+    """Incremental refresh vs full recompute on a multi-lot workflow"""
+    import random
+
+    from rfp_templates import new_workflow, workflow_template
+
+    rng = random.Random(seed)
+    stages = new_workflow(workflow_template(lots))
+    start = time.perf_counter()
+    schedule = Schedule(stages)
+    build = time.perf_counter() - start
+
+    ids = list(stages)
+    refreshes, mismatches = [], []
+    for step in range(changes):
+        # Progress moves in small steps, so stages stay open for most of the run
+        stage = stages[rng.choice(ids)]
+        if stage.status == "pending":
+            stage.start()
+        elif stage.status == "active":
+            stage.update_progress(stage.progress + rng.randint(1, 5))
+        else:
+            continue
+        start = time.perf_counter()
+        schedule.refresh()
+        refreshes.append((time.perf_counter() - start, schedule.touched))
+        if step % 50 == 0:
+            mismatches += schedule.verify()
+
+    n = len(ids)
+    es, ef, ls, lf = [0] * n, [0] * n, [0] * n, [0] * n
+    start = time.perf_counter()
+    finish = schedule._forward(es, ef, schedule._duration)
+    schedule._backward(ls, lf, schedule._duration, finish)
+    full = time.perf_counter() - start
+    # Refreshes where a stage's remaining days actually moved
+    moved = sorted(seconds for seconds, touched in refreshes if touched)
+    return {
+        "stages": n,
+        "build_ms": round(build * 1000, 3),
+        "full_recompute_ms": round(full * 1000, 3),
+        "refreshes": len(refreshes),
+        "moved_refreshes": len(moved),
+        "moved_median_ms": round(moved[len(moved) // 2] * 1000, 4),
+        "moved_p99_ms": round(moved[int(len(moved) * 0.99)] * 1000, 4),
+        "mean_stages_touched": round(sum(t for _, t in refreshes if t) / len(moved), 1),
+        "critical_path": len(schedule.critical_path()),
+        "consistent": not mismatches + schedule.verify(),
+    }
+
+
+if __name__ == "__main__":
+    print(benchmark())
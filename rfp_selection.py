@@ -0,0 +1,359 @@
+"""
+Vendor selection
+Keeps evaluated vendors in score-ordered heaps per (service model, service)
+so the Selection tab reads the best k vendors without scanning or sorting
+everyone. Heaps are updated as vendors are evaluated and read with a
+best-first walk, so a top-k query costs O(k log k) in the common case
+rather than a pass over every vendor.
+
+The award optimizer decides between one consolidated award and a set of
+per-service awards: an exact multiple-choice knapsack over the services,
+kept small by discarding bids another bid beats on both price and score.
+"""
+
+import heapq
+import re
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+# Wildcard for "any service model" / "any service" heaps
+ANY = None
+# Rebuild a heap once stale entries outnumber live ones by this factor
+COMPACT_RATIO = 2
+
+Entry = Tuple[float, int, str]  # (-score, sequence, vendor_id)
+
+
+class SelectionIndex:
+    """Max-heaps of vendors by score, one per (service_model, service) pair
+
+    Updates push a fresh entry and leave the old one behind; entries are
+    recognised as stale by their sequence number and skipped on reads.
+    Each heap is compacted once it is mostly stale.
+    """
+    def __init__(self):
+        self._heaps: Dict[Tuple[Optional[str], Optional[str]], List[Entry]] = {}
+        self._live: Dict[Tuple[Optional[str], Optional[str]], int] = {}
+        # vendor_id -> (sequence, score, heap keys)
+        self._current: Dict[str, Tuple[int, float, Tuple]] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._current)
+
+    def __contains__(self, vendor_id: str) -> bool:
+        return vendor_id in self._current
+
+    @staticmethod
+    def _keys(service_model: str, services: Iterable[str]) -> Tuple:
+        keys = [(service_model, ANY), (ANY, ANY)]
+        for service in services:
+            keys.append((service_model, service))
+            keys.append((ANY, service))
+        return tuple(keys)
+
+    def update(self, vendor_id: str, score: float, service_model: str, services: Iterable[str]):
+        """Insert or re-score a vendor"""
+        self.discard(vendor_id)
+        self._seq += 1
+        keys = self._keys(service_model, services)
+        entry = (-float(score), self._seq, vendor_id)
+        for key in keys:
+            heapq.heappush(self._heaps.setdefault(key, []), entry)
+            self._live[key] = self._live.get(key, 0) + 1
+        self._current[vendor_id] = (self._seq, float(score), keys)
+
+    def discard(self, vendor_id: str):
+        current = self._current.pop(vendor_id, None)
+        if current is None:
+            return
+        for key in current[2]:
+            self._live[key] -= 1
+            if len(self._heaps[key]) > COMPACT_RATIO * self._live[key] + 64:
+                self._compact(key)
+
+    def _compact(self, key):
+        heap = [entry for entry in self._heaps[key] if self._is_live(entry)]
+        heapq.heapify(heap)
+        self._heaps[key] = heap
+
+    def _is_live(self, entry: Entry) -> bool:
+        current = self._current.get(entry[2])
+        return current is not None and current[0] == entry[1]
+
+    @classmethod
+    def build(cls, vendors: Iterable[Tuple[str, float, str, Sequence[str]]]) -> "SelectionIndex":
+        """Bulk-load (vendor_id, score, service_model, services) with one heapify per heap"""
+        index = cls()
+        for vendor_id, score, service_model, services in vendors:
+            index._seq += 1
+            keys = cls._keys(service_model, services)
+            entry = (-float(score), index._seq, vendor_id)
+            for key in keys:
+                index._heaps.setdefault(key, []).append(entry)
+            index._current[vendor_id] = (index._seq, float(score), keys)
+        for key, heap in index._heaps.items():
+            heapq.heapify(heap)
+            index._live[key] = len(heap)
+        return index
+
+    def _walk(self, key) -> Iterable[Entry]:
+        """Live entries of one heap in descending score order, expanded lazily"""
+        heap = self._heaps.get(key)
+        if not heap:
+            return
+        frontier = [(heap[0], 0)]
+        while frontier:
+            entry, i = heapq.heappop(frontier)
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+            if self._is_live(entry):
+                yield entry
+
+    def top(self, k: int, service_model: Optional[str] = ANY, service: Optional[str] = ANY,
+            tie_break: Optional[Callable[[str], Any]] = None,
+            where: Optional[Callable[[str], bool]] = None) -> List[Tuple[str, float]]:
+        """Best k (vendor_id, score) pairs, highest score first
+
+        tie_break maps a vendor_id to a sort key for vendors with equal
+        scores (default: the order they were evaluated in). where filters
+        candidates, e.g. on required certifications; it is only called on
+        vendors visited before k matches are found.
+        """
+        if k <= 0:
+            return []
+        picked: List[Entry] = []
+        for entry in self._walk((service_model, service)):
+            # Keep collecting vendors tied with the k-th so tie_break sees all of them
+            if len(picked) >= k and entry[0] != picked[k - 1][0]:
+                break
+            if where is not None and not where(entry[2]):
+                continue
+            picked.append(entry)
+        if tie_break is not None:
+            picked.sort(key=lambda e: (e[0], tie_break(e[2])))
+        return [(entry[2], -entry[0]) for entry in picked[:k]]
+
+
+# ========================================
+# AWARD OPTIMIZER
+# ========================================
+
+# Pricing key for a consolidated vendor's price for all services together
+BUNDLE = "bundle"
+
+_AMOUNT_RE = re.compile(r"\$?\s*([\d,]+(?:\.\d+)?)\s*([KMB])?", re.IGNORECASE)
+_MULTIPLIERS = {"": 1, "K": 1e3, "M": 1e6, "B": 1e9}
+
+
+def parse_budget_range(text: str) -> Tuple[Optional[float], Optional[float]]:
+    """'$5M - $25M annually' -> (5e6, 25e6); a single amount is an upper bound"""
+    amounts = [float(number.replace(",", "")) * _MULTIPLIERS[(suffix or "").upper()]
+               for number, suffix in _AMOUNT_RE.findall(text or "") if number.strip(",")]
+    if not amounts:
+        return None, None
+    if len(amounts) == 1:
+        return None, amounts[0]
+    return min(amounts[:2]), max(amounts[:2])
+
+
+class Bid(NamedTuple):
+    """An evaluated vendor's annual prices per service (and bundle, if consolidated)"""
+    vendor_id: str
+    name: str
+    service_model: str
+    score: float
+    prices: Dict[str, float]
+
+
+class Award(NamedTuple):
+    assignments: Dict[str, str]  # service -> vendor_id
+    cost: float
+    score: float  # mean score of the awarded vendors across services
+    consolidated: bool
+
+
+class AwardResult(NamedTuple):
+    award: Optional[Award]
+    best_consolidated: Optional[Award]
+    best_split: Optional[Award]
+    budget: Optional[float]
+    bids: int
+    frontier: int  # largest Pareto set kept while combining services
+    solve_seconds: float
+
+
+def _pareto(options: List[Tuple[float, float, Any]]) -> List[Tuple[float, float, Any]]:
+    """Options (cost, value, payload) not beaten by a cheaper-or-equal, better-or-equal one"""
+    options.sort(key=lambda o: (o[0], -o[1]))
+    kept, best = [], float("-inf")
+    for option in options:
+        if option[1] > best:
+            kept.append(option)
+            best = option[1]
+    return kept
+
+
+def optimize_award(bids: Iterable[Bid], services: Sequence[str],
+                   budget: Optional[float] = None) -> AwardResult:
+    """Highest-scoring way to cover every service within budget (cheapest on ties)
+
+    Split awards give each service to the bidder of its choice at that
+    bidder's per-service price. Consolidated awards give every service to
+    one consolidated vendor at its bundle price. Per-service bids are
+    reduced to their price/score Pareto frontier and combined service by
+    service, pruning dominated and over-budget partial awards, so the work
+    grows with the frontier sizes rather than the product of bidder counts.
+    """
+    start = time.perf_counter()
+    bids = list(bids)
+    limit = float("inf") if budget is None else budget
+    n = len(services)
+
+    best_consolidated = None
+    for bid in bids:
+        bundle = bid.prices.get(BUNDLE)
+        if bundle is None or bundle > limit:
+            continue
+        award = Award({service: bid.vendor_id for service in services}, bundle, bid.score, True)
+        if best_consolidated is None or (award.score, -award.cost) > (best_consolidated.score,
+                                                                        -best_consolidated.cost):
+            best_consolidated = award
+
+    # Partial awards as (cost, total score, chosen vendor ids), one service at a time
+    partial = [(0.0, 0.0, ())]
+    frontier = 1
+    for service in services:
+        options = _pareto([(bid.prices[service], bid.score, bid.vendor_id)
+                           for bid in bids if bid.prices.get(service) is not None])
+        partial = _pareto([(cost + price, value + score, chosen + (vendor_id,))
+                           for cost, value, chosen in partial
+                           for price, score, vendor_id in options
+                           if cost + price <= limit])
+        frontier = max(frontier, len(partial))
+        if not partial:
+            break
+    best_split = None
+    if partial and n:
+        cost, value, chosen = partial[-1]
+        best_split = Award(dict(zip(services, chosen)), cost, value / n, False)
+
+    candidates = [a for a in (best_consolidated, best_split) if a is not None]
+    award = max(candidates, key=lambda a: (a.score, -a.cost)) if candidates else None
+    return AwardResult(award, best_consolidated, best_split, budget, len(bids), frontier,
+                       time.perf_counter() - start)
+
+
+# ========================================
+# BENCHMARK
+# ========================================
+
+class _BenchProfile:
+    def __init__(self, vendor_id: str):
+        self.vendor_id = vendor_id
+
+
+def benchmark(count: int = 100000, k: int = 3, repeats: int = 20, seed: int = 0) -> Dict:
+    """Maintained index vs filter-and-sort over every vendor for the Selection tab queries"""
+    import random
+
+    rng = random.Random(seed)
+    services = ["Warehouse Services", "Customer Service Operations", "Consumer Solutions Group"]
+    vendors = []
+    for i in range(count):
+        consolidated = rng.random() < 0.3
+        vendors.append((f"VND-{i:06d}", round(rng.uniform(50, 100), 1),
+                        "Consolidated" if consolidated else "Standalone",
+                        services if consolidated else [rng.choice(services)]))
+
+    def current():
+        # What the Selection tab did: filter everyone, fully sort, slice
+        consolidated = [v for v in vendors if v[2] == "Consolidated"]
+        best = sorted(consolidated, key=lambda v: v[1], reverse=True)[:k]
+        per_service = []
+        for service in services:
+            standalone = [v for v in vendors if v[2] == "Standalone" and service in v[3]]
+            per_service.append(sorted(standalone, key=lambda v: v[1], reverse=True)[0])
+        return best, per_service
+
+    def partitioned():
+        # The store's mask-and-argpartition top(), still a pass over every row
+        best = store.top(k, status="Evaluated", service_model="Consolidated")
+        return best, [store.top(1, status="Evaluated", service_model="Standalone", service=service)[0]
+                      for service in services]
+
+    def indexed():
+        best = index.top(k, "Consolidated")
+        return best, [index.top(1, "Standalone", service)[0] for service in services]
+
+    from rfp_store import VendorStore
+
+    store = VendorStore(["overall"], services)
+    store.materialize = lambda vendor_id: _BenchProfile(vendor_id)
+    store.load_records({"vendor_id": v[0], "name": v[0], "status": "Evaluated", "service_model": v[2],
+                        "services_offered": v[3], "certifications": [], "overall_score": v[1], "scores": {}}
+                       for v in vendors)
+
+    start = time.perf_counter()
+    index = SelectionIndex.build(vendors)
+    build = time.perf_counter() - start
+
+    timings = {}
+    for name, fn in (("full_sort", current), ("partition", partitioned), ("index", indexed)):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            fn()
+        timings[name] = (time.perf_counter() - start) / repeats
+
+    # Re-scoring cost: evaluate 1% of vendors again
+    start = time.perf_counter()
+    for vendor_id, _, model, offered in rng.sample(vendors, count // 100):
+        index.update(vendor_id, rng.uniform(50, 100), model, offered)
+    update = (time.perf_counter() - start) / (count // 100)
+
+    return {
+        "vendors": count,
+        "k": k,
+        "build_ms": round(build * 1000, 1),
+        "full_sort_query_ms": round(timings["full_sort"] * 1000, 2),
+        "store_partition_query_ms": round(timings["partition"] * 1000, 2),
+        "index_query_ms": round(timings["index"] * 1000, 3),
+        "speedup": round(timings["full_sort"] / timings["index"], 1),
+        "update_us": round(update * 1e6, 1),
+    }
+
+
+def benchmark_award(bidders_per_service: int = 300, consolidated: int = 50,
+                    budget: float = 25e6, seed: int = 0) -> Dict:
+    """Award optimizer solve time with hundreds of standalone bidders per service"""
+    import random
+
+    rng = random.Random(seed)
+    services = ["Warehouse Services", "Customer Service Operations", "Consumer Solutions Group"]
+    base = {services[0]: (4e6, 10e6), services[1]: (3e6, 8e6), services[2]: (2e6, 6e6)}
+    bids = []
+    for service in services:
+        for i in range(bidders_per_service):
+            bids.append(Bid(f"{service[:3]}-{i}", f"{service[:3]}-{i}", "Standalone",
+                            rng.uniform(55, 98), {service: rng.uniform(*base[service])}))
+    for i in range(consolidated):
+        prices = {service: rng.uniform(*base[service]) for service in services}
+        prices[BUNDLE] = sum(prices.values()) * rng.uniform(0.85, 0.95)
+        bids.append(Bid(f"CON-{i}", f"CON-{i}", "Consolidated", rng.uniform(60, 95), prices))
+
+    result = optimize_award(bids, services, budget)
+    return {
+        "bids": result.bids,
+        "budget": budget,
+        "frontier": result.frontier,
+        "solve_ms": round(result.solve_seconds * 1000, 2),
+        "consolidated": result.award.consolidated if result.award else None,
+        "score": round(result.award.score, 2) if result.award else None,
+        "cost": round(result.award.cost) if result.award else None,
+    }
+
+
+if __name__ == "__main__":
+    print(benchmark())
+    print(benchmark_award())
@@ -0,0 +1,220 @@
+"""
+Score sensitivity analysis
+Monte Carlo over the evaluation weights: each draw perturbs the criterion
+weights (Dirichlet around the chosen weights) and the vendors' criterion
+scores (Gaussian noise), re-ranks the vendors and counts where each one
+lands. Draws run in fixed-size chunks so memory stays bounded whatever
+the draw count, and large runs can fan out across processes.
+"""
+
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+# Higher concentration keeps sampled weights closer to the chosen ones
+DEFAULT_CONCENTRATION = 100.0
+# Standard deviation of per-criterion score noise, in score points
+DEFAULT_NOISE = 2.0
+# Upper bound on draws x vendors held in memory per chunk (~8 MB per float64 array)
+CHUNK_ELEMENTS = 1_000_000
+SENSITIVITY_WORKERS = int(os.environ.get("RFP_SENSITIVITY_WORKERS", str(os.cpu_count() or 1)))
+# Work items per worker process, so progress updates arrive during a run
+TASKS_PER_WORKER = 4
+
+
+def reweight(weights: Dict[str, float], criterion: str, value: float) -> Dict[str, float]:
+    """Set one criterion's weight and rescale the others so weights still sum to 1"""
+    rest = sum(w for c, w in weights.items() if c != criterion)
+    scale = (1.0 - value) / rest if rest else 0.0
+    return {c: (value if c == criterion else w * scale) for c, w in weights.items()}
+
+
+def weighted_totals(scores: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    return np.asarray(scores, dtype=np.float64) @ np.asarray(weights, dtype=np.float64)
+
+
+def ranks_of(totals: np.ndarray) -> np.ndarray:
+    """0-based rank of each vendor (0 = best) along the last axis, ties by position"""
+    order = np.argsort(-totals, axis=-1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.broadcast_to(np.arange(totals.shape[-1]), order.shape), axis=-1)
+    return ranks
+
+
+def _fill_missing(scores: np.ndarray) -> np.ndarray:
+    """Replace missing criterion scores with that criterion's mean across vendors"""
+    scores = np.array(scores, dtype=np.float64)
+    missing = np.isnan(scores)
+    if missing.any():
+        counts = (~missing).sum(axis=0)
+        means = np.where(missing, 0.0, scores).sum(axis=0) / np.maximum(counts, 1)
+        scores = np.where(missing, means, scores)
+    return scores
+
+
+def simulate(scores: np.ndarray, weights: np.ndarray, draws: int,
+             concentration: float = DEFAULT_CONCENTRATION, noise: float = DEFAULT_NOISE,
+             seed=None, chunk_elements: int = CHUNK_ELEMENTS,
+             progress: Optional[Callable[[int], None]] = None) -> np.ndarray:
+    """Rank histogram (vendors x ranks) over draws perturbed weight/score samples
+
+    Noise is i.i.d. per vendor, criterion and draw, so a vendor's weighted
+    noise is Normal(0, noise * |w|) and is sampled directly instead of
+    materializing the draws x vendors x criteria tensor.
+    """
+    n = scores.shape[0]
+    rng = np.random.default_rng(seed)
+    alpha = np.maximum(np.asarray(weights, dtype=np.float64) * concentration, 1e-6)
+    chunk = max(1, chunk_elements // max(n, 1))
+    offsets = (np.arange(n) * n)[None, :]
+    counts = np.zeros(n * n, dtype=np.int64)
+    done = 0
+    while done < draws:
+        size = min(chunk, draws - done)
+        sampled = rng.dirichlet(alpha, size)
+        totals = sampled @ scores.T
+        if noise:
+            totals += rng.standard_normal((size, n)) * (noise * np.linalg.norm(sampled, axis=1))[:, None]
+        counts += np.bincount((ranks_of(totals) + offsets).ravel(), minlength=n * n)
+        done += size
+        if progress is not None:
+            progress(size)
+    return counts.reshape(n, n)
+
+
+def _simulate_task(args):
+    scores, weights, draws, concentration, noise, seed, chunk_elements = args
+    return simulate(scores, weights, draws, concentration, noise, seed, chunk_elements)
+
+
+class SensitivityResult(NamedTuple):
+    vendor_ids: List[str]
+    names: List[str]
+    weights: Dict[str, float]
+    base_rank: np.ndarray  # 1-based, under the chosen weights without noise
+    rank_counts: np.ndarray  # vendors x ranks
+    draws: int
+    top_k: int
+    seconds: float
+
+    @property
+    def probabilities(self) -> np.ndarray:
+        return self.rank_counts / max(self.draws, 1)
+
+    def summary(self):
+        """Per-vendor rank stability as a pandas DataFrame, in base-rank order"""
+        import pandas as pd
+
+        probs = self.probabilities
+        n = len(self.vendor_ids)
+        ranks = np.arange(1, n + 1)
+        cumulative = np.cumsum(probs, axis=1)
+        low = (cumulative >= 0.05).argmax(axis=1) + 1
+        high = (cumulative >= 0.95).argmax(axis=1) + 1
+        frame = pd.DataFrame({
+            "vendor_id": self.vendor_ids,
+            "name": self.names,
+            "base_rank": self.base_rank,
+            "p_first": probs[:, 0],
+            f"p_top_{self.top_k}": probs[:, :self.top_k].sum(axis=1),
+            "p_keeps_rank": probs[np.arange(n), self.base_rank - 1],
+            "mean_rank": probs @ ranks,
+            "rank_90": [f"{lo}-{hi}" for lo, hi in zip(low, high)],
+        })
+        return frame.sort_values("base_rank").reset_index(drop=True)
+
+
+def analyze(vendor_ids: Sequence[str], names: Sequence[str], scores: np.ndarray,
+            weights: Dict[str, float], criteria: Sequence[str], draws: int = 100_000,
+            concentration: float = DEFAULT_CONCENTRATION, noise: float = DEFAULT_NOISE,
+            top_k: int = 3, workers: int = 1, seed=None,
+            chunk_elements: int = CHUNK_ELEMENTS,
+            progress: Optional[Callable[[float], None]] = None) -> SensitivityResult:
+    """Rank stability of each vendor under weight and score uncertainty
+
+    scores is vendors x criteria in the order of criteria. With workers > 1
+    the draws are split across a process pool; every task gets an
+    independent stream spawned from one SeedSequence, so results are
+    reproducible for a given seed and worker count.
+    """
+    start = time.perf_counter()
+    scores = _fill_missing(scores)
+    w = np.array([weights.get(c, 0.0) for c in criteria], dtype=np.float64)
+    w = w / w.sum() if w.sum() else np.full(len(criteria), 1.0 / max(len(criteria), 1))
+    base_rank = ranks_of(weighted_totals(scores, w)) + 1
+    n = len(vendor_ids)
+
+    if workers <= 1:
+        done = [0]
+
+        def step(size):
+            done[0] += size
+            if progress is not None:
+                progress(done[0] / draws)
+
+        counts = simulate(scores, w, draws, concentration, noise, seed, chunk_elements, step)
+    else:
+        tasks = max(1, min(draws, workers * TASKS_PER_WORKER))
+        sizes = [draws // tasks + (1 if i < draws % tasks else 0) for i in range(tasks)]
+        seeds = np.random.SeedSequence(seed).spawn(tasks)
+        counts = np.zeros((n, n), dtype=np.int64)
+        finished = 0
+        # spawn: forking a process that runs server threads is not safe
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            futures = {pool.submit(_simulate_task, (scores, w, size, concentration, noise,
+                                                    task_seed, chunk_elements)): size
+                       for size, task_seed in zip(sizes, seeds)}
+            try:
+                for future in as_completed(futures):
+                    counts += future.result()
+                    finished += futures[future]
+                    if progress is not None:
+                        progress(finished / draws)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    return SensitivityResult(list(vendor_ids), list(names), dict(zip(criteria, w.tolist())),
+                             base_rank, counts, draws, min(top_k, n), time.perf_counter() - start)
+
+
+# ========================================
+# BENCHMARK
+# ========================================
+
+def benchmark(vendors: int = 50, draws: int = 1_000_000, workers: int = SENSITIVITY_WORKERS,
+              seed: int = 0) -> Dict:
+    """Draw throughput single- vs multi-process and peak chunk memory"""
+    import tracemalloc
+
+    rng = np.random.default_rng(seed)
+    criteria = ["technical", "operations", "pricing", "compliance", "experience", "innovation"]
+    weights = dict(zip(criteria, [0.25, 0.20, 0.20, 0.15, 0.10, 0.10]))
+    scores = rng.uniform(60, 95, (vendors, len(criteria)))
+    ids = [f"VND-{i:04d}" for i in range(vendors)]
+
+    tracemalloc.start()
+    single = analyze(ids, ids, scores, weights, criteria, draws=draws, seed=seed)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    multi = analyze(ids, ids, scores, weights, criteria, draws=draws, workers=workers, seed=seed)
+    return {
+        "vendors": vendors,
+        "draws": draws,
+        "single_seconds": round(single.seconds, 2),
+        "single_draws_per_sec": round(draws / single.seconds),
+        "workers": workers,
+        "multi_seconds": round(multi.seconds, 2),
+        "multi_draws_per_sec": round(draws / multi.seconds),
+        "peak_mb": round(peak / 1e6, 1),
+        "p_first_leader": round(float(single.probabilities[:, 0].max()), 3),
+    }
+
+
+if __name__ == "__main__":
+    print(benchmark())
@@ -0,0 +1,749 @@
+"""
+Columnar vendor store
+Keeps vendor status, service model, services, certifications, names and
+scores in NumPy columns (interned codes for status and model, bitsets for
+services and certifications) with per-value counts, so dashboard aggregates
+and rankings are lookups or single vectorized reductions.
+Vendor profile objects attach to the store and become row views over it;
+rows loaded from a persistence backend get their profile built lazily.
+"""
+
+import uuid
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from rfp_aggregates import AggregateMismatchError, VendorAggregates
+from rfp_selection import SelectionIndex
+
+
+class StoreColumn:
+    """Profile attribute that reads and writes a store column once attached"""
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.local = f"_{name}"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        store = obj._store
+        if store is not None:
+            return store.get_field(obj._row, self.name)
+        return getattr(obj, self.local)
+
+    def __set__(self, obj, value):
+        store = getattr(obj, "_store", None)
+        if store is not None:
+            store.set_field(obj._row, self.name, value)
+        else:
+            setattr(obj, self.local, value)
+
+
+class VendorStore:
+    """Columnar storage for vendor profiles, keyed by vendor_id"""
+
+    FIELDS = ("name", "status", "service_model", "services_offered", "certifications",
+              "overall_score", "scores")
+
+    def __init__(self, criteria: Sequence[str], services: Sequence[str], capacity: int = 64):
+        self.criteria = list(criteria)
+        self._criterion_index = {c: j for j, c in enumerate(self.criteria)}
+        self.services = list(services)
+        self._service_bits = {s: 1 << i for i, s in enumerate(self.services)}
+        self.certifications: List[str] = []
+        self._certification_bits: Dict[str, int] = {}
+
+        self._size = 0
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        self._profiles: List[Optional[object]] = []
+
+        # Builds a profile for a row loaded without one (lazy loading)
+        self.materialize: Optional[Callable[[str], object]] = None
+
+        # Change tracking for persistence
+        self._dirty: Set[str] = set()
+        self._deleted: Set[str] = set()
+        self._tracking = True
+
+        # Interned codes for repeated strings
+        self._status_names: List[str] = []
+        self._status_codes: Dict[str, int] = {}
+        self._model_names: List[str] = []
+        self._model_codes: Dict[str, int] = {}
+
+        # Columns
+        self._names = np.empty(capacity, dtype=object)
+        self._status = np.zeros(capacity, dtype=np.int16)
+        self._model = np.zeros(capacity, dtype=np.int16)
+        self._services = np.zeros(capacity, dtype=np.uint32)
+        # Python-int bitsets: certifications come from free-form sources, so no fixed width
+        self._certifications = np.zeros(capacity, dtype=object)
+        self._overall = np.zeros(capacity, dtype=np.float64)
+        self._scores = np.full((capacity, len(self.criteria)), np.nan)
+
+        # Value -> live row count for O(1) single-filter counts; status counts
+        # live in the aggregates. Row lookups scan the code/bitset columns.
+        self._model_counts: Dict[str, int] = {}
+        self._service_counts: Dict[str, int] = {s: 0 for s in self.services}
+
+        self.aggregates = VendorAggregates()
+        self.version = 0
+        # Unique per store so cache keys never collide with a replaced store
+        self.uid = uuid.uuid4().hex
+        # status -> counter bumped whenever a row with that status changes
+        self._status_versions: Dict[str, int] = {}
+        # sort key -> (version, ascending row order) for paged listings
+        self._sort_cache: Dict[str, Tuple[int, np.ndarray]] = {}
+        # Top-k heaps over evaluated vendors, built on first use then kept current
+        self._selection: Optional[SelectionIndex] = None
+
+    # ---- mapping protocol (drop-in for the old vendors dict) ----
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __contains__(self, vendor_id):
+        return vendor_id in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._ids))
+
+    def __getitem__(self, vendor_id: str):
+        return self._profile(self._rows[vendor_id])
+
+    def __setitem__(self, vendor_id: str, profile):
+        if vendor_id != profile.vendor_id:
+            raise KeyError(f"Key {vendor_id} does not match vendor_id {profile.vendor_id}")
+        self.add(profile)
+
+    def __delitem__(self, vendor_id: str):
+        self.remove(vendor_id)
+
+    def get(self, vendor_id: str, default=None):
+        row = self._rows.get(vendor_id)
+        return default if row is None else self._profile(row)
+
+    def keys(self) -> List[str]:
+        return list(self._ids)
+
+    def values(self) -> List[object]:
+        return [self._profile(row) for row in range(self._size)]
+
+    def items(self):
+        return list(zip(self._ids, self.values()))
+
+    def _profile(self, row: int):
+        profile = self._profiles[row]
+        if profile is None:
+            if self.materialize is None:
+                raise LookupError(f"No profile loaded for {self._ids[row]}")
+            profile = self.materialize(self._ids[row])
+            profile._store, profile._row = self, row
+            for name in self.FIELDS:
+                setattr(profile, f"_{name}", None)
+            self._profiles[row] = profile
+        return profile
+
+    # ---- codes ----
+
+    def _status_code(self, status: str) -> int:
+        code = self._status_codes.get(status)
+        if code is None:
+            code = self._status_codes[status] = len(self._status_names)
+            self._status_names.append(status)
+        return code
+
+    def _model_code(self, model: str) -> int:
+        code = self._model_codes.get(model)
+        if code is None:
+            code = self._model_codes[model] = len(self._model_names)
+            self._model_names.append(model)
+            self._model_counts[model] = 0
+        return code
+
+    def _service_bit(self, service: str) -> int:
+        bit = self._service_bits.get(service)
+        if bit is None:
+            if len(self.services) >= 32:
+                raise ValueError("VendorStore supports at most 32 distinct services")
+            bit = self._service_bits[service] = 1 << len(self.services)
+            self.services.append(service)
+            self._service_counts[service] = 0
+        return bit
+
+    def _service_list(self, mask: int) -> List[str]:
+        return [s for s in self.services if mask & self._service_bits[s]]
+
+    def _certification_bit(self, certification: str) -> int:
+        bit = self._certification_bits.get(certification)
+        if bit is None:
+            bit = self._certification_bits[certification] = 1 << len(self.certifications)
+            self.certifications.append(certification)
+        return bit
+
+    def _certification_list(self, mask: int) -> List[str]:
+        return [c for c in self.certifications if mask & self._certification_bits[c]]
+
+    # ---- row management ----
+
+    def _grow(self, needed: int):
+        capacity = len(self._status)
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2)
+        extra = new_capacity - capacity
+        self._names = np.concatenate([self._names, np.empty(extra, dtype=object)])
+        self._status = np.concatenate([self._status, np.zeros(extra, dtype=self._status.dtype)])
+        self._model = np.concatenate([self._model, np.zeros(extra, dtype=self._model.dtype)])
+        self._services = np.concatenate([self._services, np.zeros(extra, dtype=self._services.dtype)])
+        self._certifications = np.concatenate([self._certifications,
+                                               np.zeros(extra, dtype=self._certifications.dtype)])
+        self._overall = np.concatenate([self._overall, np.zeros(extra)])
+        self._scores = np.vstack([self._scores, np.full((extra, len(self.criteria)), np.nan)])
+
+    def add(self, profile):
+        """Attach a profile to the store, replacing any row with the same id"""
+        if profile._store is self:
+            return
+        values = {name: getattr(profile, name) for name in self.FIELDS}
+        if profile._store is not None:
+            profile._store._detach(profile)
+
+        row = self._rows.get(profile.vendor_id)
+        if row is None:
+            row = self._append_row(profile.vendor_id, values["status"], values["service_model"])
+        elif self._profiles[row] is not None:
+            self._detach(self._profiles[row])
+        self._profiles[row] = profile
+
+        profile._store, profile._row = self, row
+        for name, value in values.items():
+            self.set_field(row, name, value)
+            setattr(profile, f"_{name}", None)
+        self._mark_dirty(row)
+        self.version += 1
+
+    def _append_row(self, vendor_id: str, status: str, service_model: str) -> int:
+        row = self._size
+        self._grow(row + 1)
+        self._size += 1
+        self._ids.append(vendor_id)
+        self._profiles.append(None)
+        self._rows[vendor_id] = row
+        self._services[row] = 0
+        self._certifications[row] = 0
+        self._overall[row] = 0
+        self._scores[row] = np.nan
+        self._status[row] = self._status_code(status)
+        self._model[row] = self._model_code(service_model)
+        self._model_counts[service_model] += 1
+        self.aggregates.add(status, 0.0)
+        self._touch_status(status)
+        self._deleted.discard(vendor_id)
+        return row
+
+    def load_records(self, records: Iterable[Dict]):
+        """Upsert summary records from a backend without building profiles
+        
+        Records carry the columnar fields only; any profile already built for
+        an updated row is dropped so it is rebuilt with fresh details.
+        """
+        self._tracking = False
+        # New vendors are appended in one columnar pass after the updates
+        fresh: Dict[str, Dict] = {}
+        try:
+            for record in records:
+                vendor_id = record["vendor_id"]
+                if record.get("deleted"):
+                    fresh.pop(vendor_id, None)
+                    if vendor_id in self._rows:
+                        self.remove(vendor_id)
+                    continue
+                row = self._rows.get(vendor_id)
+                if row is None:
+                    fresh[vendor_id] = record
+                    continue
+                if self._profiles[row] is not None:
+                    stale = self._profiles[row]
+                    stale._store, stale._row = None, -1
+                    self._profiles[row] = None
+                for name in self.FIELDS:
+                    self.set_field(row, name, record[name])
+            if fresh:
+                self._extend_records(list(fresh.values()))
+        finally:
+            self._tracking = True
+        self._selection = None
+        self.version += 1
+
+    def _extend_records(self, records: List[Dict]):
+        masks = np.zeros(len(records), dtype=np.uint32)
+        certification_masks = np.zeros(len(records), dtype=object)
+        scores = np.full((len(records), len(self.criteria)), np.nan)
+        for i, record in enumerate(records):
+            for service in record["services_offered"] or []:
+                masks[i] |= self._service_bit(service)
+            for certification in record["certifications"] or []:
+                certification_masks[i] |= self._certification_bit(certification)
+            for criterion, score in (record["scores"] or {}).items():
+                j = self._criterion_index.get(criterion)
+                if j is not None:
+                    scores[i, j] = score
+        self.extend_columns(
+            [r["vendor_id"] for r in records], [r["name"] for r in records],
+            [r["status"] for r in records], [r["service_model"] for r in records],
+            masks, self.services, [r["overall_score"] for r in records], scores,
+            certification_masks, self.certifications,
+        )
+
+    def extend_columns(self, vendor_ids: Sequence[str], names: Sequence[str], status: Sequence[str],
+                       service_model: Sequence[str], service_masks: np.ndarray,
+                       service_names: Sequence[str], overall: Sequence[float], scores: np.ndarray,
+                       certification_masks: Optional[np.ndarray] = None,
+                       certification_names: Sequence[str] = ()):
+        """Append new vendors from whole columns without building profiles
+
+        service_masks and certification_masks are bitsets over service_names
+        and certification_names (no certifications when omitted; integer
+        arrays, or object arrays of ints for more than 64 names); scores is a
+        rows x criteria matrix in self.criteria order. The rows are not marked dirty:
+        callers load them from a backend or can rebuild their details (see
+        materialize), so there is nothing to write back.
+        """
+        n = len(vendor_ids)
+        if not n:
+            return
+        if len(set(vendor_ids)) != n or any(vendor_id in self._rows for vendor_id in vendor_ids):
+            raise KeyError("extend_columns only appends new, distinct vendor ids")
+        start, end = self._size, self._size + n
+        self._grow(end)
+
+        status = self._codes(status, self._status_code, self._status.dtype, n)
+        model = self._codes(service_model, self._model_code, self._model.dtype, n)
+        service_masks = np.asarray(service_masks, dtype=np.uint32)
+        masks = np.zeros(n, dtype=np.uint32)
+        for i, service in enumerate(service_names):
+            offered = (service_masks & np.uint32(1 << i)) != 0
+            masks[offered] |= np.uint32(self._service_bit(service))
+            self._service_counts[service] += int(offered.sum())
+        certifications = np.zeros(n, dtype=object)
+        if certification_masks is not None:
+            # Few distinct combinations occur, so translate each one once
+            bits = [self._certification_bit(certification) for certification in certification_names]
+            combos, inverse = np.unique(np.asarray(certification_masks), return_inverse=True)
+            translated = np.empty(len(combos), dtype=object)
+            for k, combo in enumerate(combos.tolist()):
+                translated[k] = sum(bit for i, bit in enumerate(bits) if combo >> i & 1)
+            certifications = translated[inverse.reshape(-1)]
+        overall = np.asarray(overall, dtype=np.float64)
+
+        self._names[start:end] = np.asarray(names, dtype=object)
+        self._status[start:end] = status
+        self._model[start:end] = model
+        self._services[start:end] = masks
+        self._certifications[start:end] = certifications
+        self._overall[start:end] = overall
+        self._scores[start:end] = scores
+        self._ids.extend(vendor_ids)
+        self._profiles.extend([None] * n)
+        self._rows.update(zip(vendor_ids, range(start, end)))
+        self._size = end
+        self._deleted.difference_update(vendor_ids)
+
+        for code, count in enumerate(np.bincount(model, minlength=len(self._model_names)).tolist()):
+            if count:
+                self._model_counts[self._model_names[code]] += count
+        counts = np.bincount(status, minlength=len(self._status_names))
+        sums = np.bincount(status, weights=overall, minlength=len(self._status_names))
+        for code in np.flatnonzero(counts):
+            name = self._status_names[code]
+            self.aggregates.add_many(name, int(counts[code]), float(sums[code]))
+            self._touch_status(name)
+        self._selection = None
+        self.version += 1
+
+    @staticmethod
+    def _codes(values: Sequence[str], code_of: Callable[[str], int], dtype, n: int) -> np.ndarray:
+        """Interned codes for a column of names, looking each distinct name up once"""
+        seen: Dict[str, int] = {}
+        return np.fromiter((seen[v] if v in seen else seen.setdefault(v, code_of(v)) for v in values),
+                           dtype=dtype, count=n)
+
+    def _touch_status(self, status: str):
+        self._status_versions[status] = self._status_versions.get(status, 0) + 1
+
+    def status_version(self, status: str) -> Tuple[str, int]:
+        """Stamp that changes whenever any vendor with this status changes"""
+        return self.uid, self._status_versions.get(status, 0)
+
+    def _mark_dirty(self, row: int):
+        if self._tracking:
+            self._dirty.add(self._ids[row])
+
+    def mark_dirty(self, vendor_id: str):
+        """Flag non-columnar profile changes for the next persistence flush"""
+        if vendor_id in self._rows:
+            self._mark_dirty(self._rows[vendor_id])
+
+    def pop_changes(self) -> Tuple[List[object], List[str]]:
+        """Changed profiles and deleted ids since the last call"""
+        changed = [self._profile(self._rows[vid]) for vid in self._dirty if vid in self._rows]
+        deleted = list(self._deleted)
+        self._dirty.clear()
+        self._deleted.clear()
+        return changed, deleted
+
+    def _detach(self, profile):
+        """Copy column values back onto the profile and unlink it"""
+        values = {name: getattr(profile, name) for name in self.FIELDS}
+        profile._store, profile._row = None, -1
+        for name, value in values.items():
+            setattr(profile, name, value)
+
+    def remove(self, vendor_id: str):
+        """Remove a vendor, moving the last row into its slot"""
+        row = self._rows.pop(vendor_id)
+        profile = self._profiles[row]
+        self._touch_status(self._status_names[self._status[row]])
+        self.aggregates.remove(self._status_names[self._status[row]], float(self._overall[row]))
+        self._count(row, -1)
+        if profile is not None:
+            self._detach(profile)
+        self._dirty.discard(vendor_id)
+        if self._tracking:
+            self._deleted.add(vendor_id)
+        if self._selection is not None:
+            self._selection.discard(vendor_id)
+
+        last = self._size - 1
+        if row != last:
+            moved_id = self._ids[last]
+            self._touch_status(self._status_names[self._status[last]])
+            for column in (self._names, self._status, self._model, self._services,
+                           self._certifications, self._overall, self._scores):
+                column[row] = column[last]
+            self._ids[row] = moved_id
+            self._profiles[row] = self._profiles[last]
+            if self._profiles[row] is not None:
+                self._profiles[row]._row = row
+            self._rows[moved_id] = row
+        self._ids.pop()
+        self._profiles.pop()
+        self._size -= 1
+        self.version += 1
+
+    def clear(self):
+        for vendor_id in list(self._ids):
+            self.remove(vendor_id)
+
+    def _count(self, row: int, delta: int):
+        self._model_counts[self._model_names[self._model[row]]] += delta
+        for service in self._service_list(int(self._services[row])):
+            self._service_counts[service] += delta
+
+    # ---- field access used by StoreColumn ----
+
+    def get_field(self, row: int, name: str):
+        if name == "status":
+            return self._status_names[self._status[row]]
+        if name == "service_model":
+            return self._model_names[self._model[row]]
+        if name == "overall_score":
+            return float(self._overall[row])
+        if name == "services_offered":
+            return self._service_list(int(self._services[row]))
+        if name == "certifications":
+            return self._certification_list(self._certifications[row])
+        if name == "scores":
+            values = self._scores[row]
+            return {c: float(values[j]) for j, c in enumerate(self.criteria)
+                    if not np.isnan(values[j])}
+        if name == "name":
+            return self._names[row]
+        raise AttributeError(name)
+
+    SELECTION_FIELDS = ("status", "service_model", "services_offered", "overall_score")
+
+    def set_field(self, row: int, name: str, value):
+        if name == "status":
+            old = self._status_names[self._status[row]]
+            if old != value:
+                self._touch_status(old)
+                self._status[row] = self._status_code(value)
+                self.aggregates.move(old, value, float(self._overall[row]))
+        elif name == "service_model":
+            old = self._model_names[self._model[row]]
+            if old != value:
+                self._model_counts[old] -= 1
+                self._model[row] = self._model_code(value)
+                self._model_counts[value] += 1
+        elif name == "overall_score":
+            self.aggregates.rescore(self._status_names[self._status[row]],
+                                    float(self._overall[row]), float(value))
+            self._overall[row] = value
+        elif name == "services_offered":
+            mask = 0
+            for service in value or []:
+                mask |= self._service_bit(service)
+            old_mask = int(self._services[row])
+            for service in self._service_list(old_mask & ~mask):
+                self._service_counts[service] -= 1
+            for service in self._service_list(mask & ~old_mask):
+                self._service_counts[service] += 1
+            self._services[row] = mask
+        elif name == "certifications":
+            mask = 0
+            for certification in value or []:
+                mask |= self._certification_bit(certification)
+            self._certifications[row] = mask
+        elif name == "scores":
+            self._scores[row] = np.nan
+            for criterion, score in (value or {}).items():
+                j = self._criterion_index.get(criterion)
+                if j is not None:
+                    self._scores[row, j] = score
+        elif name == "name":
+            self._names[row] = value
+        else:
+            raise AttributeError(name)
+        if self._selection is not None and name in self.SELECTION_FIELDS:
+            self._reselect(row)
+        self._touch_status(self._status_names[self._status[row]])
+        self._mark_dirty(row)
+        self.version += 1
+
+    # ---- aggregates ----
+
+    def verify_aggregates(self) -> list:
+        """Check the incremental aggregates against a full recompute"""
+        n = self._size
+        statuses = [self._status_names[c] for c in self._status[:n]]
+        mismatches = self.aggregates.verify(statuses, self._overall[:n].tolist())
+        for model, code in self._model_codes.items():
+            actual = int((self._model[:n] == code).sum())
+            if actual != self._model_counts[model]:
+                mismatches.append(f"count[{model}]: {self._model_counts[model]} != {actual}")
+        for service, bit in self._service_bits.items():
+            actual = int(((self._services[:n] & bit) != 0).sum())
+            if actual != self._service_counts[service]:
+                mismatches.append(f"count[{service}]: {self._service_counts[service]} != {actual}")
+        return mismatches
+
+    def _check_aggregates(self):
+        if self.aggregates.check:
+            mismatches = self.verify_aggregates()
+            if mismatches:
+                raise AggregateMismatchError("; ".join(mismatches))
+
+    # ---- queries ----
+
+    def count(self, status: Optional[str] = None, service_model: Optional[str] = None,
+              service: Optional[str] = None) -> int:
+        """Count vendors matching the filters, O(1) for a single filter"""
+        if service_model is None and service is None and status is not None:
+            self._check_aggregates()
+            return self.aggregates.count(status)
+        if status is None and service is None:
+            return self._size if service_model is None else self._model_counts.get(service_model, 0)
+        if status is None and service_model is None:
+            return self._service_counts.get(service, 0)
+        return int(self.mask(status, service_model, service).sum())
+
+    def mask(self, status: Optional[str] = None, service_model: Optional[str] = None,
+             service: Optional[str] = None) -> np.ndarray:
+        """Boolean mask over live rows matching the filters"""
+        n = self._size
+        mask = np.ones(n, dtype=bool)
+        if status is not None:
+            code = self._status_codes.get(status)
+            mask &= (self._status[:n] == code) if code is not None else False
+        if service_model is not None:
+            code = self._model_codes.get(service_model)
+            mask &= (self._model[:n] == code) if code is not None else False
+        if service is not None:
+            bit = self._service_bits.get(service, 0)
+            mask &= (self._services[:n] & bit) != 0
+        return mask
+
+    def rows(self, **filters) -> np.ndarray:
+        return np.flatnonzero(self.mask(**filters))
+
+    def mean_score(self, **filters) -> float:
+        """Average overall score over matching vendors (0 when none match)"""
+        if list(filters) == ["status"]:
+            self._check_aggregates()
+            return self.aggregates.mean_score(filters["status"])
+        scores = self._overall[:self._size][self.mask(**filters)]
+        return float(scores.mean()) if len(scores) else 0.0
+
+    SORT_KEYS = ("overall_score", "name", "status", "service_model")
+
+    def _sort_order(self, sort_by: str) -> np.ndarray:
+        """All live rows in ascending order of a text column, cached per store version"""
+        cached = self._sort_cache.get(sort_by)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        n = self._size
+        if sort_by == "name":
+            keys = self._names[:n].astype(str)
+        elif sort_by in ("status", "service_model"):
+            names, codes = ((self._status_names, self._status) if sort_by == "status"
+                            else (self._model_names, self._model))
+            # Rank codes alphabetically so the order follows the displayed value
+            rank = np.empty(max(len(names), 1), dtype=np.int32)
+            rank[sorted(range(len(names)), key=names.__getitem__)] = np.arange(len(names))
+            keys = rank[codes[:n]]
+        else:
+            raise ValueError(f"Unknown sort key: {sort_by}")
+        order = np.argsort(keys, kind="stable")
+        self._sort_cache[sort_by] = (self.version, order)
+        return order
+
+    def page(self, offset: int = 0, limit: int = 25, sort_by: str = "overall_score",
+             descending: bool = True, min_score: Optional[float] = None,
+             max_score: Optional[float] = None, **filters) -> Tuple[np.ndarray, int]:
+        """One sorted page of matching rows plus the total number of matches
+
+        Filters are the mask() filters and an inclusive overall-score band.
+        Score sorting partitions out only the rows up to the end of the page;
+        ties are broken by row so consecutive pages never overlap.
+        """
+        n = self._size
+        mask = self.mask(**filters)
+        if min_score is not None:
+            mask &= self._overall[:n] >= min_score
+        if max_score is not None:
+            mask &= self._overall[:n] <= max_score
+        total = int(mask.sum())
+        end = min(offset + limit, total)
+        if offset >= end:
+            return np.empty(0, dtype=np.intp), total
+
+        if sort_by == "overall_score":
+            rows = np.flatnonzero(mask)
+            keys = -self._overall[rows] if descending else self._overall[rows]
+            if end < total:
+                kth = np.partition(keys, end - 1)[end - 1]
+                ahead = np.flatnonzero(keys < kth)
+                ties = np.flatnonzero(keys == kth)[:end - len(ahead)]
+                keep = np.concatenate([ahead, ties])
+                rows, keys = rows[keep], keys[keep]
+            order = np.lexsort((rows, keys))
+            return rows[order][offset:end], total
+
+        order = self._sort_order(sort_by)
+        ranked = order[mask[order]]
+        if descending:
+            ranked = ranked[::-1]
+        return ranked[offset:end], total
+
+    def top(self, k: int, **filters) -> List[object]:
+        """Top-k profiles by overall score among matching vendors"""
+        rows = self.rows(**filters)
+        if len(rows) == 0 or k <= 0:
+            return []
+        scores = self._overall[rows]
+        if len(rows) > k:
+            part = np.argpartition(-scores, k - 1)[:k]
+            rows, scores = rows[part], scores[part]
+        order = np.argsort(-scores, kind="stable")
+        return [self._profile(r) for r in rows[order]]
+
+    SELECTION_STATUS = "Evaluated"
+    TIE_BREAKS = ("evaluated_first", "name", "vendor_id")
+
+    def _selection_entry(self, row: int):
+        return (self._ids[row], float(self._overall[row]), self._model_names[self._model[row]],
+                self._service_list(int(self._services[row])))
+
+    def _reselect(self, row: int):
+        if self._status_names[self._status[row]] == self.SELECTION_STATUS:
+            self._selection.update(*self._selection_entry(row))
+        else:
+            self._selection.discard(self._ids[row])
+
+    def select_top(self, k: int, service_model: Optional[str] = None, service: Optional[str] = None,
+                   tie_break: str = "evaluated_first",
+                   required_certifications: Sequence[str] = ()) -> List[object]:
+        """Top-k evaluated profiles from the maintained selection heaps
+
+        Equal scores are ordered by tie_break (one of TIE_BREAKS). Vendors
+        must hold every certification in required_certifications.
+        """
+        if tie_break not in self.TIE_BREAKS:
+            raise ValueError(f"Unknown tie break: {tie_break}")
+        if self._selection is None:
+            rows = self.rows(status=self.SELECTION_STATUS)
+            self._selection = SelectionIndex.build(self._selection_entry(r) for r in rows)
+        where = None
+        if required_certifications:
+            if any(c not in self._certification_bits for c in required_certifications):
+                return []
+            required = 0
+            for certification in required_certifications:
+                required |= self._certification_bits[certification]
+            held = self._certifications
+            where = lambda vid: (held[self._rows[vid]] & required) == required
+        tie_key = None
+        if tie_break == "name":
+            tie_key = lambda vid: self._names[self._rows[vid]]
+        elif tie_break == "vendor_id":
+            tie_key = lambda vid: vid
+        picked = self._selection.top(k, service_model, service, tie_break=tie_key, where=where)
+        return [self[vendor_id] for vendor_id, _ in picked]
+
+    def search(self, text: str, limit: int = 50) -> np.ndarray:
+        """Rows whose name or vendor_id contains text (case-insensitive), in row order"""
+        n = self._size
+        text = text.strip().lower()
+        if not text:
+            return np.arange(min(n, limit))
+        rows = []
+        for row in range(n):
+            if text in self._names[row].lower() or text in self._ids[row].lower():
+                rows.append(row)
+                if len(rows) == limit:
+                    break
+        return np.asarray(rows, dtype=np.intp)
+
+    def id_by_name(self) -> Dict[str, str]:
+        """Vendor name -> vendor_id (first registered wins)"""
+        index: Dict[str, str] = {}
+        for row in range(self._size - 1, -1, -1):
+            index[self._names[row]] = self._ids[row]
+        return index
+
+    def ids(self, rows: Sequence[int]) -> List[str]:
+        return [self._ids[r] for r in rows]
+
+    def service_lists(self, rows: Sequence[int]) -> List[List[str]]:
+        return [self._service_list(int(mask)) for mask in self._services[np.asarray(rows, dtype=np.intp)]]
+
+    def profiles(self, rows: Sequence[int]) -> List[object]:
+        return [self._profile(r) for r in rows]
+
+    def score_matrix(self, rows: Optional[Sequence[int]] = None) -> np.ndarray:
+        if rows is None:
+            return self._scores[:self._size]
+        return self._scores[np.asarray(rows, dtype=np.intp)]
+
+    def frame(self, rows: Optional[Sequence[int]] = None):
+        """Summary columns as a pandas DataFrame"""
+        import pandas as pd
+
+        if rows is None:
+            rows = np.arange(self._size)
+        rows = np.asarray(rows, dtype=np.intp)
+        return pd.DataFrame({
+            "vendor_id": [self._ids[r] for r in rows],
+            "name": self._names[rows],
+            "service_model": np.array(self._model_names, dtype=object)[self._model[rows]]
+            if len(rows) else [],
+            "status": np.array(self._status_names, dtype=object)[self._status[rows]]
+            if len(rows) else [],
+            "overall_score": self._overall[rows],
+        })
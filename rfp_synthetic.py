@@ -0,0 +1,377 @@
+"""
+Synthetic vendor populations for load testing
+Generates 10k-1M vendors in fixed-size blocks with NumPy: correlated
+criterion scores around a latent vendor quality, prices that rise with
+quality, certifications, statuses and registration dates. Every block is
+drawn from its own seeded stream, so vendor i is identical for a given seed
+whatever the population size or batch order, and any vendor's details can
+be regenerated on demand instead of being kept in memory.
+"""
+
+import csv
+import os
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from rfp_ingest import write_synthetic_pdf
+from rfp_scoring import ScoringEngine
+from rfp_selection import BUNDLE
+
+BLOCK_SIZE = 4096
+# Population share per status (the rest of the pipeline keys off these names)
+STATUS_MIX = {"Registered": 0.25, "Submitted": 0.25, "Evaluated": 0.5}
+CONSOLIDATED_SHARE = 0.3
+STANDALONE = "Standalone"
+CONSOLIDATED = "Consolidated"
+
+# Latent quality (mean, sd) and per-criterion noise around it, in score points
+QUALITY = (74.0, 8.0)
+CRITERION_NOISE = 6.0
+# Criteria scored against price rather than quality
+PRICE_CRITERION = "pricing_competitiveness"
+# Consolidated bundles are discounted by this range off the sum of services
+BUNDLE_DISCOUNT = (0.05, 0.15)
+REGISTRATION_WINDOW_DAYS = 60
+
+NAME_PREFIXES = ["Atlas", "Summit", "Pioneer", "Keystone", "Horizon", "Meridian", "Liberty", "Cascade",
+                 "Granite", "Harbor", "Northstar", "Redwood", "Sterling", "Vanguard", "Beacon", "Crescent",
+                 "Evergreen", "Frontier", "Ironwood", "Lakeshore", "Metro", "Pinnacle", "Quantum", "Riverbend",
+                 "Silverline", "Trident", "Unity", "Westgate", "Apex", "Bluewater", "Cornerstone", "Delta"]
+NAME_CORES = ["Logistics", "Distribution", "Fulfillment", "Supply Chain", "Warehousing", "Freight",
+              "Transport", "Commerce", "Operations", "Solutions", "Services", "Systems", "Network",
+              "Partners", "Global", "Integrated"]
+NAME_SUFFIXES = ["LLC", "Inc.", "Corp.", "Co.", "Group", "Holdings", "Ltd.", "Partners"]
+FILLER_LINES = [
+    "Our team brings proven experience operating multi-site programs for national retailers.",
+    "We provide dedicated account management with quarterly business reviews.",
+    "Continuous improvement is driven by lean practices and weekly KPI reviews.",
+    "Transition plans include parallel runs, staff training and a 90 day stabilization period.",
+    "All sites operate a documented safety management program with monthly audits.",
+]
+
+
+class VendorBlock(NamedTuple):
+    """One block of synthetic vendors as columns"""
+    start: int
+    vendor_ids: List[str]
+    names: List[str]
+    statuses: np.ndarray  # object array of status names
+    models: np.ndarray  # object array of service model names
+    service_masks: np.ndarray  # bitsets over SyntheticVendors.services
+    scores: np.ndarray  # vendors x criteria, NaN until evaluated
+    overall: np.ndarray
+    strengths: np.ndarray  # vendors x criteria bool
+    weaknesses: np.ndarray
+    certification_masks: np.ndarray  # bitsets over SyntheticVendors.certifications
+    prices: np.ndarray  # vendors x services, NaN where not offered
+    bundle_prices: np.ndarray  # NaN for standalone vendors
+    registered_days_ago: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.vendor_ids)
+
+
+class SyntheticVendors:
+    """A reproducible synthetic vendor population of a given size"""
+
+    def __init__(self, count: int, seed: int = 0, engine: Optional[ScoringEngine] = None,
+                 services: Sequence[str] = ("Warehouse Services", "Customer Service Operations",
+                                            "Consumer Solutions Group"),
+                 certifications: Sequence[str] = ("C-TPAT", "TAPA", "ISO 9001", "ISO 27001", "SOC 2",
+                                                  "Six Sigma"),
+                 price_ranges: Optional[Dict[str, Tuple[float, float]]] = None,
+                 requirements: Optional[Dict[str, Sequence[str]]] = None,
+                 document_bundle: Optional[Dict[str, str]] = None,
+                 status_mix: Optional[Dict[str, float]] = None,
+                 consolidated_share: float = CONSOLIDATED_SHARE, id_prefix: str = "VND-SYN",
+                 block_size: int = BLOCK_SIZE, as_of: Optional[datetime] = None):
+        if engine is None:
+            engine = ScoringEngine({c: {"weight": w} for c, w in zip(
+                ["technical_capability", "operational_excellence", "pricing_competitiveness",
+                 "compliance_security", "experience_references", "innovation_flexibility"],
+                [0.25, 0.20, 0.20, 0.15, 0.10, 0.10])})
+        self.count = count
+        self.seed = seed
+        self.engine = engine
+        self.criteria = engine.criteria
+        self.services = list(services)
+        self.certifications = list(certifications)
+        self.price_ranges = price_ranges or {s: (2_000_000, 10_000_000) for s in self.services}
+        self.requirements = requirements or {}
+        self.document_bundle = document_bundle or {}
+        mix = status_mix or STATUS_MIX
+        self.statuses = np.array(list(mix), dtype=object)
+        self.status_p = np.array(list(mix.values()), dtype=np.float64) / sum(mix.values())
+        self.consolidated_share = consolidated_share
+        self.id_prefix = f"{id_prefix}-{seed}-"
+        self.block_size = block_size
+        # Dates are drawn relative to as_of; pass it to reproduce them exactly
+        self.as_of = as_of or datetime.now().replace(microsecond=0)
+        # A few blocks so details() for neighbouring vendors reuses one generation
+        self._cached_block = lru_cache(maxsize=4)(self.block)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def blocks(self) -> int:
+        return -(-self.count // self.block_size)
+
+    def vendor_id(self, index: int) -> str:
+        return f"{self.id_prefix}{index:07d}"
+
+    def index_of(self, vendor_id: str) -> Optional[int]:
+        if not vendor_id.startswith(self.id_prefix):
+            return None
+        try:
+            index = int(vendor_id[len(self.id_prefix):])
+        except ValueError:
+            return None
+        return index if 0 <= index < self.count else None
+
+    # ---- generation ----
+
+    def block(self, b: int) -> VendorBlock:
+        """Generate block b; the same (seed, b) always yields the same vendors"""
+        start = b * self.block_size
+        n = max(0, min(self.block_size, self.count - start))
+        rng = np.random.default_rng([self.seed, b])
+        c, s = len(self.criteria), len(self.services)
+
+        quality = rng.normal(*QUALITY, n)
+        z = (quality - QUALITY[0]) / QUALITY[1]
+        # Better vendors price higher: position within each service's price range
+        price_level = np.clip(0.5 + 0.25 * z + rng.normal(0, 0.15, n), 0.0, 1.0)
+        scores = quality[:, None] + rng.normal(0, CRITERION_NOISE, (n, c))
+        if PRICE_CRITERION in self.criteria:
+            j = self.criteria.index(PRICE_CRITERION)
+            scores[:, j] = 95 - 35 * price_level + rng.normal(0, 4, n)
+        scores = np.clip(np.round(scores, 1), 0, 100)
+
+        statuses = self.statuses[rng.choice(len(self.statuses), n, p=self.status_p)]
+        evaluated = statuses == "Evaluated"
+        scores[~evaluated] = np.nan
+        batch = self.engine.score_matrix(scores)
+
+        consolidated = rng.random(n) < self.consolidated_share
+        all_services = (1 << s) - 1
+        masks = np.where(consolidated, all_services, 1 << rng.integers(0, s, n)).astype(np.uint32)
+        models = np.where(consolidated, CONSOLIDATED, STANDALONE).astype(object)
+
+        low = np.array([self.price_ranges[sv][0] for sv in self.services])
+        high = np.array([self.price_ranges[sv][1] for sv in self.services])
+        level = np.clip(price_level[:, None] + rng.normal(0, 0.05, (n, s)), 0, 1)
+        prices = np.round(low + (high - low) * level, -3)
+        offered = (masks[:, None] >> np.arange(s, dtype=np.uint32)) & 1 == 1
+        prices[~offered] = np.nan
+        discount = 1 - rng.uniform(*BUNDLE_DISCOUNT, n)
+        bundle = np.where(consolidated, np.round(np.nansum(prices, axis=1) * discount, -3), np.nan)
+
+        held = rng.random((n, len(self.certifications))) < np.clip(0.25 + 0.1 * z, 0.05, 0.9)[:, None]
+        cert_masks = (held * (1 << np.arange(len(self.certifications)))).sum(axis=1).astype(np.uint32)
+
+        a, p, x = (rng.integers(0, len(words), n) for words in (NAME_PREFIXES, NAME_CORES, NAME_SUFFIXES))
+        names = [f"{NAME_PREFIXES[i]} {NAME_CORES[j]} {NAME_SUFFIXES[k]}"
+                 for i, j, k in zip(a.tolist(), p.tolist(), x.tolist())]
+        return VendorBlock(
+            start=start,
+            vendor_ids=[self.vendor_id(i) for i in range(start, start + n)],
+            names=names,
+            statuses=statuses,
+            models=models,
+            service_masks=masks,
+            scores=scores,
+            overall=np.round(batch.overall, 2),
+            strengths=batch.strengths,
+            weaknesses=batch.weaknesses,
+            certification_masks=cert_masks,
+            prices=prices,
+            bundle_prices=bundle,
+            registered_days_ago=rng.uniform(0, REGISTRATION_WINDOW_DAYS, n),
+        )
+
+    def iter_blocks(self) -> Iterator[VendorBlock]:
+        for b in range(self.blocks):
+            yield self.block(b)
+
+    # ---- records ----
+
+    def _services_of(self, mask: int) -> List[str]:
+        return [sv for i, sv in enumerate(self.services) if mask >> i & 1]
+
+    def _certifications_of(self, mask: int) -> List[str]:
+        return [cert for j, cert in enumerate(self.certifications) if mask >> j & 1]
+
+    def details_at(self, block: VendorBlock, i: int) -> Dict:
+        """Profile detail fields for row i of a block"""
+        status = block.statuses[i]
+        registered = self.as_of - timedelta(days=float(block.registered_days_ago[i]))
+        submitted = registered + timedelta(days=7) if status != "Registered" else None
+        pricing = {sv: float(block.prices[i, j]) for j, sv in enumerate(self.services)
+                   if not np.isnan(block.prices[i, j])}
+        if not np.isnan(block.bundle_prices[i]):
+            pricing[BUNDLE] = float(block.bundle_prices[i])
+        labels = self.engine.labels
+        return {
+            "registration_date": registered,
+            "documents": ({key: f"{block.names[i]}_{suffix}" for key, suffix in self.document_bundle.items()}
+                          if submitted else {}),
+            "pricing": pricing,
+            "submission_date": submitted,
+            "evaluation_date": submitted + timedelta(days=7) if status == "Evaluated" else None,
+            "capabilities": {},
+            "strengths": [labels[j] for j in np.flatnonzero(block.strengths[i])],
+            "weaknesses": [labels[j] for j in np.flatnonzero(block.weaknesses[i])],
+            "decision": None,
+        }
+
+    def details(self, vendor_id: str) -> Optional[Dict]:
+        """Regenerate one vendor's details (None if the id is not from this population)"""
+        index = self.index_of(vendor_id)
+        if index is None:
+            return None
+        b, i = divmod(index, self.block_size)
+        return self.details_at(self._cached_block(b), i)
+
+    def records(self, block: VendorBlock) -> List[Dict]:
+        """Backend records (summary columns plus details) for a block"""
+        records = []
+        for i, vendor_id in enumerate(block.vendor_ids):
+            scores = block.scores[i]
+            records.append({
+                "vendor_id": vendor_id,
+                "name": block.names[i],
+                "status": block.statuses[i],
+                "service_model": block.models[i],
+                "services_offered": self._services_of(int(block.service_masks[i])),
+                "certifications": self._certifications_of(int(block.certification_masks[i])),
+                "overall_score": float(block.overall[i]),
+                "scores": {c: float(v) for c, v in zip(self.criteria, scores) if not np.isnan(v)},
+                "details": self.details_at(block, i),
+            })
+        return records
+
+    # ---- sinks ----
+
+    def extend_store(self, store, block: VendorBlock):
+        """Append a block to a VendorStore column-wise, without building profiles"""
+        store.extend_columns(block.vendor_ids, block.names, block.statuses, block.models,
+                             block.service_masks, self.services, block.overall,
+                             self._store_scores(store, block), block.certification_masks, self.certifications)
+
+    def load_into(self, store, progress: Optional[Callable[[float], None]] = None):
+        for block in self.iter_blocks():
+            self.extend_store(store, block)
+            if progress is not None:
+                progress((block.start + len(block)) / self.count)
+
+    def _store_scores(self, store, block: VendorBlock) -> np.ndarray:
+        if list(store.criteria) == self.criteria:
+            return block.scores
+        scores = np.full((len(block), len(store.criteria)), np.nan)
+        for j, criterion in enumerate(store.criteria):
+            if criterion in self.criteria:
+                scores[:, j] = block.scores[:, self.criteria.index(criterion)]
+        return scores
+
+    def save_to(self, save: Callable[[List[Dict]], None], progress: Optional[Callable[[float], None]] = None):
+        """Hand backend records to save one block at a time (e.g. backend.save_vendors)"""
+        for block in self.iter_blocks():
+            save(self.records(block))
+            if progress is not None:
+                progress((block.start + len(block)) / self.count)
+
+    def write_registration_sheet(self, path: str):
+        """Registration rows as a CSV accepted by the bulk vendor import"""
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["Vendor ID", "Vendor Name", "Service Model", "Services", "Certifications"])
+            for block in self.iter_blocks():
+                for i, vendor_id in enumerate(block.vendor_ids):
+                    writer.writerow([
+                        vendor_id, block.names[i], block.models[i],
+                        "; ".join(self._services_of(int(block.service_masks[i]))),
+                        "; ".join(self._certifications_of(int(block.certification_masks[i]))),
+                    ])
+
+    def proposal_lines(self, block: VendorBlock, i: int) -> List[str]:
+        """Proposal text: the offered services' requirements a vendor covers, plus filler
+
+        Stronger vendors address more of the SOW requirements.
+        """
+        rng = np.random.default_rng([self.seed, block.start + i, 1])
+        score = block.overall[i] if block.overall[i] else QUALITY[0]
+        coverage = float(np.clip((score - 50) / 45, 0.1, 1.0))
+        lines = [f"{block.names[i]} - Technical Proposal"]
+        for service in self._services_of(int(block.service_masks[i])):
+            lines.append(f"{service}: approach and capabilities")
+            for requirement in self.requirements.get(service, []):
+                if rng.random() < coverage:
+                    lines.append(f"We meet the requirement: {requirement}.")
+        lines.extend(FILLER_LINES)
+        return lines
+
+    def write_proposals(self, directory: str, limit: int, pages: int = 20,
+                        status: str = "Evaluated") -> List[Tuple[str, str, str]]:
+        """Multi-page proposal PDFs for the first limit vendors with status
+
+        Returns (vendor_id, path, file name) for each written file.
+        """
+        os.makedirs(directory, exist_ok=True)
+        written = []
+        for block in self.iter_blocks():
+            for i in np.flatnonzero(block.statuses == status):
+                if len(written) >= limit:
+                    return written
+                vendor_id = block.vendor_ids[i]
+                filename = f"{block.names[i]}_Technical_Proposal.pdf"
+                path = os.path.join(directory, f"{vendor_id}_Technical_Proposal.pdf")
+                write_synthetic_pdf(path, pages, lines=self.proposal_lines(block, i))
+                written.append((vendor_id, path, filename))
+        return written
+
+
+# ========================================
+# BENCHMARK
+# ========================================
+
+def benchmark(counts: Sequence[int] = (10_000, 100_000, 1_000_000), seed: int = 0) -> List[Dict]:
+    """Generation and store load throughput, and block reproducibility"""
+    from rfp_store import VendorStore
+
+    results = []
+    for count in counts:
+        population = SyntheticVendors(count, seed)
+        start = time.perf_counter()
+        for _ in population.iter_blocks():
+            pass
+        generate = time.perf_counter() - start
+
+        store = VendorStore(population.criteria, population.services)
+        start = time.perf_counter()
+        population.load_into(store)
+        load = time.perf_counter() - start
+
+        start = time.perf_counter()
+        records = population.records(population.block(0))
+        per_record_us = (time.perf_counter() - start) / len(records) * 1e6
+        results.append({
+            "vendors": count,
+            "generate_s": round(generate, 2),
+            "vendors_per_sec": round(count / generate),
+            "store_load_s": round(load, 2),
+            "record_us": round(per_record_us, 1),
+            "evaluated": store.count(status="Evaluated"),
+            "mean_evaluated_score": round(store.mean_score(status="Evaluated"), 1),
+            "reproducible": SyntheticVendors(count, seed).block(0).names == population.block(0).names,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    for result in benchmark():
+        print(result)
@@ -0,0 +1,365 @@
+"""
+Immutable RFP templates shared by every session in the process
+Workflow stage definitions, evaluation criteria, SOW requirement catalogs and
+the RFP header are built once at import and frozen (tuples, NamedTuples and
+read-only mappings), so sessions hold references instead of copies. A
+session's workflow is a set of WorkflowStage views whose status, progress,
+dates and documents live in a copy-on-write overlay over the shared template.
+"""
+
+import hashlib
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, NamedTuple, Optional, Tuple
+
+from rfp_schedule import Duration, parse_duration
+
+WAREHOUSE = "Warehouse Services"
+CSO = "Customer Service Operations"
+CSG = "Consumer Solutions Group"
+SERVICES: Tuple[str, ...] = (WAREHOUSE, CSO, CSG)
+
+STANDALONE = "Standalone"
+CONSOLIDATED = "Consolidated"
+
+# SOW requirements per service
+REQUIREMENT_CATALOG: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    WAREHOUSE: (
+        "Storage capacity (minimum 500,000 sq ft)",
+        "Temperature-controlled zones (ambient, cooled, frozen)",
+        "24/7 operations capability with 99.9% uptime",
+        "WMS integration (SAP EWM, Manhattan, or equivalent)",
+        "Cross-docking and transloading capabilities",
+        "Security: C-TPAT and TAPA certifications required",
+    ),
+    CSO: (
+        "RMA processing (same-day turnaround)",
+        "Returns management system integration",
+        "Customer support (24/7, multi-channel)",
+        "Replacement fulfillment within 24 hours",
+        "Quality inspection processes (99.5% accuracy)",
+        "Response time SLAs (< 2 hours)",
+    ),
+    CSG: (
+        "Kitting services (10,000+ units/day capacity)",
+        "Custom packaging capabilities",
+        "Assembly operations (electronics, mechanical)",
+        "Labeling services (barcode, RFID)",
+        "Custom fulfillment solutions",
+        "Quality control (Six Sigma processes)",
+    ),
+})
+
+# Evaluation criteria and weights shared by the manager and the scoring engine
+EVALUATION_CRITERIA: Mapping[str, Mapping] = MappingProxyType({
+    name: MappingProxyType({"weight": weight, "description": description})
+    for name, weight, description in (
+        ("technical_capability", 0.25, "Technology and infrastructure"),
+        ("operational_excellence", 0.20, "Service quality and reliability"),
+        ("pricing_competitiveness", 0.20, "Cost structure and value"),
+        ("compliance_security", 0.15, "Certifications and security"),
+        ("experience_references", 0.10, "Past performance"),
+        ("innovation_flexibility", 0.10, "Innovation capabilities"),
+    )
+})
+CRITERIA_WEIGHTS: Mapping[str, float] = MappingProxyType(
+    {name: c["weight"] for name, c in EVALUATION_CRITERIA.items()})
+
+
+class StageTemplate(NamedTuple):
+    """Fixed definition of one workflow stage"""
+    stage_id: str
+    stage_num: int
+    name: str
+    description: str
+    required_docs: Tuple[str, ...]
+    deliverables: Tuple[str, ...]
+    duration: Duration
+    # Stages that must be complete before this one starts
+    depends_on: Tuple[str, ...] = ()
+
+
+# Registration and Q&A both follow publication and run in parallel
+WORKFLOW_TEMPLATE: Tuple[StageTemplate, ...] = tuple(
+    StageTemplate(stage_id, num, name, description, docs, deliverables, parse_duration(duration), depends_on)
+    for num, (stage_id, name, description, docs, deliverables, duration, depends_on) in enumerate((
+        ("requirements", "Requirements Definition",
+         "Define service requirements and prepare RFP documentation",
+         ("Service Requirements", "Budget Approval", "Stakeholder Input"),
+         ("RFP Package", "Evaluation Criteria", "SOWs"), "5 days", ()),
+        ("rfp_publication", "RFP Publication",
+         "Publish RFP and invite vendors to participate",
+         ("RFP Package", "Vendor List", "Legal Terms"),
+         ("Published RFP", "Vendor Invitations"), "2 days", ("requirements",)),
+        ("vendor_registration", "Vendor Registration",
+         "Vendors register and indicate service model preference",
+         ("Registration Forms", "NDA Agreements"),
+         ("Vendor List", "Service Model Selections"), "7 days", ("rfp_publication",)),
+        ("qa_clarifications", "Q&A and Clarifications",
+         "Address vendor questions and provide clarifications",
+         ("Vendor Questions", "Technical Specs"),
+         ("Q&A Responses", "RFP Addendums"), "5 days", ("rfp_publication",)),
+        ("proposal_submission", "Proposal Submission",
+         "Receive and validate vendor proposals",
+         ("Technical Proposals", "Pricing", "Compliance"),
+         ("Submission Log", "Completeness Check"), "1 day", ("vendor_registration", "qa_clarifications")),
+        ("initial_evaluation", "Initial Evaluation",
+         "Evaluate proposals against requirements",
+         ("Evaluation Matrix", "Scoring Sheets"),
+         ("Initial Scores", "Compliance Status"), "7 days", ("proposal_submission",)),
+        ("detailed_assessment", "Detailed Assessment",
+         "Deep dive into shortlisted vendors",
+         ("Technical Reviews", "Reference Checks"),
+         ("Evaluation Report", "Risk Assessment"), "10 days", ("initial_evaluation",)),
+        ("vendor_selection", "Vendor Selection",
+         "Select vendors for each service model",
+         ("Final Evaluation", "Selection Criteria"),
+         ("Selected Vendors", "Service Assignments"), "3 days", ("detailed_assessment",)),
+        ("negotiation", "Contract Negotiation",
+         "Negotiate terms with selected vendors",
+         ("Draft Contracts", "SLAs", "Pricing"),
+         ("Negotiated Terms", "Final Pricing"), "7 days", ("vendor_selection",)),
+        ("award", "Contract Award",
+         "Award contracts to selected vendors",
+         ("Final Contracts", "Legal Approval"),
+         ("Executed Contracts", "Implementation Schedule"), "2 days", ("negotiation",)),
+        ("implementation", "Implementation Planning",
+         "Plan service transition and implementation",
+         ("Transition Plan", "Resource Allocation"),
+         ("Kickoff Meeting", "Go-Live Schedule"), "5 days", ("award",)),
+    ), 1)
+)
+
+# Stages a multi-lot procurement runs once per lot, after the shared tender stages
+LOT_STAGES = ("initial_evaluation", "detailed_assessment", "vendor_selection",
+              "negotiation", "award", "implementation")
+
+
+@lru_cache(maxsize=None)
+def workflow_template(lots: int = 1) -> Tuple[StageTemplate, ...]:
+    """Stage templates for a procurement split into lots
+
+    One lot is the standard workflow. With more, the tender stages are shared
+    and every lot gets its own parallel chain from initial evaluation on.
+    """
+    if lots <= 1:
+        return WORKFLOW_TEMPLATE
+    stages = [t for t in WORKFLOW_TEMPLATE if t.stage_id not in LOT_STAGES]
+    for lot in range(1, lots + 1):
+        for t in WORKFLOW_TEMPLATE:
+            if t.stage_id in LOT_STAGES:
+                stages.append(t._replace(
+                    stage_id=f"{t.stage_id}_lot{lot}",
+                    stage_num=len(stages) + 1,
+                    name=f"{t.name} (Lot {lot})",
+                    depends_on=tuple(f"{d}_lot{lot}" if d in LOT_STAGES else d for d in t.depends_on),
+                ))
+    return tuple(stages)
+
+
+DEFAULT_RFP_TITLE = "Request for Proposal - Logistics & Warehouse Services"
+
+
+@lru_cache(maxsize=None)
+def rfp_details(workspace: str, issued: date, title: str = DEFAULT_RFP_TITLE) -> Mapping:
+    """RFP header for a workspace issued on a given day
+
+    The id is derived from the workspace and the issue dates from issued
+    (the RFP's creation day), so the header is the same on every rerun, in
+    every session and after a restart.
+    """
+    digest = hashlib.sha1(workspace.encode("utf-8")).hexdigest()[:8].upper()
+    issued = datetime(issued.year, issued.month, issued.day)
+    return MappingProxyType({
+        "rfp_id": f"RFP-{issued.year}-{digest}",
+        "title": title,
+        "issue_date": issued,
+        "due_date": issued + timedelta(days=30),
+        "services_required": SERVICES,
+        "service_models": (STANDALONE, CONSOLIDATED),
+        "budget_range": "$5M - $25M annually",
+        "contract_duration": "3 years with 2 optional 1-year extensions",
+    })
+
+
+# ========================================
+# PER-SESSION WORKFLOW
+# ========================================
+
+# Stage fields a session can change, as they read until its first write
+STAGE_DEFAULTS: Mapping = MappingProxyType({
+    "status": "pending",
+    "progress": 0,
+    "start_date": None,
+    "end_date": None,
+    "documents": MappingProxyType({}),
+})
+
+
+class WorkflowStage:
+    """One session's view of a shared StageTemplate
+
+    Template fields (stage_id, name, required_docs, ...) read through to the
+    template. Status, progress, dates and documents come from an overlay that
+    is the shared STAGE_DEFAULTS until the first write, which copies it.
+    """
+    __slots__ = ("template", "_overlay", "_tracker", "_schedule", "dirty")
+
+    def __init__(self, template: StageTemplate):
+        self.template = template
+        self._overlay = STAGE_DEFAULTS
+        self._tracker = None
+        self._schedule = None
+        self.dirty = False
+
+    def __getattr__(self, name):
+        # Only reached for names that are neither slots nor properties
+        if name.startswith("_") or name == "template":
+            raise AttributeError(name)
+        return getattr(self.template, name)
+
+    def _write(self, field: str, value):
+        if self._overlay is STAGE_DEFAULTS:
+            self._overlay = dict(STAGE_DEFAULTS)
+        self._overlay[field] = value
+        self.dirty = True
+
+    @property
+    def overlaid(self) -> bool:
+        """True once this session has changed the stage"""
+        return self._overlay is not STAGE_DEFAULTS
+
+    @property
+    def status(self) -> str:
+        return self._overlay["status"]
+
+    @status.setter
+    def status(self, value: str):
+        if self._tracker is not None:
+            self._tracker.stage_changed(self.status, self.progress, value, self.progress)
+        self._write("status", value)
+        if self._schedule is not None:
+            self._schedule.stage_changed(self)
+
+    @property
+    def progress(self) -> int:
+        return self._overlay["progress"]
+
+    @progress.setter
+    def progress(self, value: int):
+        if self._tracker is not None:
+            self._tracker.stage_changed(self.status, self.progress, self.status, value)
+        self._write("progress", value)
+        if self._schedule is not None:
+            self._schedule.stage_changed(self)
+
+    @property
+    def start_date(self) -> Optional[datetime]:
+        return self._overlay["start_date"]
+
+    @start_date.setter
+    def start_date(self, value: Optional[datetime]):
+        self._write("start_date", value)
+
+    @property
+    def end_date(self) -> Optional[datetime]:
+        return self._overlay["end_date"]
+
+    @end_date.setter
+    def end_date(self, value: Optional[datetime]):
+        self._write("end_date", value)
+
+    @property
+    def documents(self) -> Mapping:
+        return self._overlay["documents"]
+
+    @documents.setter
+    def documents(self, value: Dict):
+        self._write("documents", value)
+
+    def to_state(self) -> Dict:
+        """Mutable stage state for persistence"""
+        return {
+            "stage_id": self.stage_id,
+            "status": self.status,
+            "progress": self.progress,
+            "start_date": self.start_date,
+            "end_date": self.end_date,
+            "documents": dict(self.documents),
+        }
+
+    def apply_state(self, state: Dict):
+        self.status = state.get("status", "pending")
+        self.progress = state.get("progress", 0)
+        self.start_date = state.get("start_date")
+        self.end_date = state.get("end_date")
+        self.documents = state.get("documents") or {}
+        self.dirty = False
+
+    def can_start(self, stages: Mapping[str, "WorkflowStage"]) -> bool:
+        """True once every stage this one depends on is complete"""
+        return all(stages[d].status == "complete" for d in self.depends_on)
+
+    def start(self):
+        self.status = "active"
+        self.start_date = datetime.now()
+        self.progress = 10
+        return True
+
+    def complete(self):
+        self.status = "complete"
+        self.end_date = datetime.now()
+        self.progress = 100
+        return True
+
+    def update_progress(self, progress: int):
+        self.progress = min(100, max(0, progress))
+        if self.progress == 100 and self.status != "complete":
+            self.complete()
+        return True
+
+
+def new_workflow(templates: Tuple[StageTemplate, ...] = WORKFLOW_TEMPLATE) -> Dict[str, WorkflowStage]:
+    """Fresh per-session workflow over the shared stage templates"""
+    return {template.stage_id: WorkflowStage(template) for template in templates}
+
+
+def benchmark(sessions: int = 10_000) -> Dict:
+    """Bytes and microseconds per session workflow, shared templates vs per-session copies"""
+    import time
+    import tracemalloc
+
+    def copied_workflow():
+        # What every session used to build: its own stage definition lists and state
+        return {t.stage_id: {"name": t.name, "description": t.description,
+                             "required_docs": list(t.required_docs), "deliverables": list(t.deliverables),
+                             "duration": t.duration, "status": "pending", "progress": 0,
+                             "start_date": None, "end_date": None, "documents": {}}
+                for t in WORKFLOW_TEMPLATE}
+
+    results = {"sessions": sessions, "stages": len(WORKFLOW_TEMPLATE)}
+    for label, build in (("copied", copied_workflow), ("shared", new_workflow)):
+        tracemalloc.start()
+        start = time.perf_counter()
+        workflows = [build() for _ in range(sessions)]
+        elapsed = time.perf_counter() - start
+        results[f"{label}_bytes_per_session"] = round(tracemalloc.get_traced_memory()[0] / sessions)
+        tracemalloc.stop()
+        results[f"{label}_us_per_session"] = round(elapsed / sessions * 1e6, 1)
+        del workflows
+
+    # A session that has started one stage copies only that stage's overlay
+    workflows = [new_workflow() for _ in range(sessions)]
+    tracemalloc.start()
+    for workflow in workflows:
+        workflow["requirements"].start()
+    results["overlay_bytes_per_write"] = round(tracemalloc.get_traced_memory()[0] / sessions)
+    tracemalloc.stop()
+    results["untouched_stages_share_defaults"] = all(
+        not stage.overlaid for workflow in workflows for stage in list(workflow.values())[1:])
+    return results
+
+
+if __name__ == "__main__":
+    print(benchmark())
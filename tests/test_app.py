@@ -0,0 +1,34 @@
+import os
+
+import pytest
+
+pytest.importorskip("streamlit")
+from streamlit.testing.v1 import AppTest
+
+from rfp_templates import workflow_template
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app_RFP.py")
+
+
+@pytest.fixture
+def app(monkeypatch):
+    import streamlit as st
+
+    monkeypatch.setenv("RFP_STATE_URL", "session://")
+    for name in ("ANTHROPIC_API_KEY", "ANTHROPIC_BASE_URL"):
+        monkeypatch.delenv(name, raising=False)
+    # The backend is a process-wide resource; drop any opened under other settings
+    st.cache_resource.clear()
+    yield lambda: AppTest.from_file(APP, default_timeout=120)
+    st.cache_resource.clear()
+
+
+@pytest.mark.parametrize("lots", [1, 3])
+def test_stage_picker_offers_every_stage_of_the_template(app, monkeypatch, lots):
+    monkeypatch.setenv("RFP_LOTS", str(lots))
+    at = app().run()
+    at.sidebar.checkbox[0].check().run()
+    assert not at.exception
+    picker = at.selectbox(key="test_target_stage")
+    assert list(picker.options) == [f"Stage {n}: {stage.name}"
+                                    for n, stage in enumerate(workflow_template(lots), start=1)]
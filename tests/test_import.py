@@ -0,0 +1,86 @@
+import csv
+
+import pytest
+
+from rfp_import import import_vendors
+
+SERVICES = ["Warehouse Services", "Customer Service Operations", "Consumer Solutions Group"]
+CERTIFICATIONS = ["C-TPAT", "TAPA", "ISO 9001"]
+HEADER = ["Vendor ID", "Vendor Name", "Service Model", "Services", "Certifications"]
+
+
+@pytest.fixture
+def run_import(tmp_path):
+    def run(rows, existing=None, batch_size=100):
+        path = tmp_path / "vendors.csv"
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(HEADER)
+            writer.writerows(rows)
+        records = []
+        report = import_vendors(str(path), records.extend, SERVICES, CERTIFICATIONS,
+                                batch_size=batch_size, existing=existing)
+        return report, records
+    return run
+
+
+def errors(report):
+    return [(e.row, e.field, e.message) for e in report.errors]
+
+
+def test_valid_rows_become_records(run_import):
+    report, records = run_import([
+        ["VND-1", "Acme", "Standalone", "warehouse services", "tapa; ISO 9001"],
+        ["", "Cons Co", "Consolidated", "", ""],
+    ])
+    assert (report.rows, report.imported, report.failed) == (2, 2, 0)
+    assert records[0]["vendor_id"] == "VND-1"
+    assert records[0]["services_offered"] == ["Warehouse Services"]
+    assert records[0]["certifications"] == ["TAPA", "ISO 9001"]
+    assert records[1]["vendor_id"].startswith("VND-IMP-")
+    assert records[1]["services_offered"] == SERVICES
+
+
+def test_unknown_certifications_are_row_errors(run_import):
+    report, records = run_import([
+        ["VND-1", "Acme", "Standalone", "Warehouse Services", "TAPA; ISO 9002"],
+        ["VND-2", "Beta", "Standalone", "Warehouse Services", "C-TPAT"],
+    ])
+    assert (report.imported, report.failed) == (1, 1)
+    assert [r["vendor_id"] for r in records] == ["VND-2"]
+    (row, field, message), = errors(report)
+    assert (row, field) == (2, "certifications")
+    assert "unknown certification 'ISO 9002'" in message
+
+
+def test_many_distinct_unknown_certifications_never_reach_the_sink(run_import):
+    report, records = run_import([[f"VND-{i}", f"Vendor {i}", "Standalone", "Warehouse Services", f"CERT-{i}"]
+                                  for i in range(40)])
+    assert (report.imported, report.failed) == (0, 40)
+    assert records == []
+
+
+def test_unknown_services_are_row_errors(run_import):
+    report, _ = run_import([["VND-1", "Acme", "Standalone", "Trucking", ""]])
+    assert report.failed == 1
+    assert "unknown service 'Trucking'" in errors(report)[0][2]
+
+
+def test_duplicate_ids_in_file_are_rejected_across_batches(run_import):
+    report, records = run_import([
+        ["VND-1", "Acme", "Standalone", "Warehouse Services", ""],
+        ["VND-2", "Beta", "Standalone", "Warehouse Services", ""],
+        ["VND-1", "Acme Again", "Standalone", "Warehouse Services", ""],
+    ], batch_size=2)
+    assert [r["vendor_id"] for r in records] == ["VND-1", "VND-2"]
+    assert errors(report) == [(4, "vendor_id", "duplicate vendor_id 'VND-1' in file")]
+
+
+def test_registered_ids_are_rejected(run_import):
+    registered = {"VND-1"}
+    report, records = run_import([
+        ["VND-1", "Acme", "Standalone", "Warehouse Services", ""],
+        ["VND-2", "Beta", "Standalone", "Warehouse Services", ""],
+    ], existing=registered.intersection)
+    assert [r["vendor_id"] for r in records] == ["VND-2"]
+    assert errors(report) == [(2, "vendor_id", "vendor_id 'VND-1' is already registered")]
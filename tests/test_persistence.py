@@ -0,0 +1,135 @@
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from rfp_persistence import SQLiteBackend, dumps
+from rfp_portfolio import load_portfolio, verify_rollups
+
+
+def record(vendor_id, name=None, status="Evaluated", score=80.0, certifications=()):
+    return {"vendor_id": vendor_id, "name": name or vendor_id, "status": status,
+            "service_model": "Standalone", "services_offered": ["Warehouse Services"],
+            "certifications": list(certifications), "overall_score": score, "scores": {"quality": score},
+            "details": {"registration_date": datetime(2025, 1, 2), "strengths": ["Quality"]}}
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return SQLiteBackend(str(tmp_path / "state.db"))
+
+
+def rollups(backend, workspace="w"):
+    return {r["name"]: (r["proposals"], r["evaluated"], r["score_sum"])
+            for r in backend.load_rollups() if r["workspace"] == workspace}
+
+
+def test_summaries_sync_incrementally(backend):
+    backend.save_vendors("w", [record("A"), record("B", certifications=["TAPA"])])
+    records, seq = backend.load_vendor_summaries("w")
+    assert [r["vendor_id"] for r in records] == ["A", "B"]
+    assert records[1]["certifications"] == ["TAPA"]
+    assert "details" not in records[0]
+
+    backend.save_vendors("w", [record("B", score=91.0)])
+    changed, latest = backend.load_vendor_summaries("w", seq)
+    assert [(r["vendor_id"], r["overall_score"]) for r in changed] == [("B", 91.0)]
+    assert latest > seq
+    assert backend.load_vendor_summaries("w", latest) == ([], latest)
+
+
+def test_deletes_sync_as_tombstones(backend):
+    backend.save_vendors("w", [record("A"), record("B")])
+    _, seq = backend.load_vendor_summaries("w")
+    backend.delete_vendors("w", ["A"])
+    changed, seq = backend.load_vendor_summaries("w", seq)
+    assert changed == [{"vendor_id": "A", "deleted": True}]
+
+    # Saving the vendor again replaces its tombstone
+    backend.save_vendors("w", [record("A")])
+    changed, _ = backend.load_vendor_summaries("w", seq)
+    assert [r.get("deleted", False) for r in changed] == [False]
+    records, _ = backend.load_vendor_summaries("w")
+    assert sorted(r["vendor_id"] for r in records) == ["A", "B"]
+
+
+def test_details_load_lazily_per_vendor(backend):
+    backend.save_vendors("w", [record("A")])
+    details = backend.load_vendor_details("w", "A")
+    assert details["registration_date"] == datetime(2025, 1, 2)
+    assert backend.load_vendor_details("w", "missing") is None
+    assert backend.load_vendor_details("other", "A") is None
+
+
+def test_workspaces_are_isolated(backend):
+    backend.save_vendors("w", [record("A")])
+    backend.save_vendors("v", [record("A", score=60.0)])
+    backend.clear_workspace("v")
+    assert [r["vendor_id"] for r in backend.load_vendor_summaries("w")[0]] == ["A"]
+    assert [r.get("deleted") for r in backend.load_vendor_summaries("v")[0]] == [True]
+    assert backend.existing_vendor_ids("w", ["A", "B"]) == {"A"}
+
+
+def test_rollups_follow_inserts_updates_and_deletes(backend):
+    backend.save_vendors("w", [record("A", "Acme", score=80.0), record("B", "Acme", status="Submitted", score=0),
+                               record("C", "Beta", score=70.0)])
+    assert rollups(backend) == {"Acme": (2, 1, 80.0), "Beta": (1, 1, 70.0)}
+
+    backend.save_vendors("w", [record("B", "Acme", score=90.0), record("C", "Gamma", score=75.0)])
+    assert rollups(backend) == {"Acme": (2, 2, 170.0), "Gamma": (1, 1, 75.0)}
+
+    backend.delete_vendors("w", ["A"])
+    assert rollups(backend) == {"Acme": (1, 1, 90.0), "Gamma": (1, 1, 75.0)}
+    assert verify_rollups(backend, "w") == []
+
+
+def test_vendor_listed_twice_in_a_batch_counts_once(backend):
+    backend.save_vendors("w", [record("A", "Acme", score=60.0)])
+    backend.save_vendors("w", [record("A", "Acme", score=70.0), record("A", "Acme", score=90.0)])
+    assert rollups(backend) == {"Acme": (1, 1, 90.0)}
+
+
+def test_full_batches_fit_the_old_sqlite_parameter_limit(backend):
+    # SQLite before 3.32 bound at most 999 parameters per statement
+    backend._connect().setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    vendors = [record(f"V{i:05d}", f"Vendor {i % 7}", score=50.0 + i % 40) for i in range(2500)]
+    backend.save_vendors("w", vendors)
+    backend.save_vendors("w", vendors[::-1] + vendors[:100])
+    backend.delete_vendors("w", [v["vendor_id"] for v in vendors[:1500]])
+    assert verify_rollups(backend, "w") == []
+    assert sum(p for p, _, _ in rollups(backend).values()) == 1000
+
+
+def test_existing_ids_fit_the_old_sqlite_parameter_limit(backend):
+    backend._connect().setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    vendor_ids = [f"V{i:05d}" for i in range(2500)]
+    backend.save_vendors("w", [record(vendor_id) for vendor_id in vendor_ids[::2]])
+    assert backend.existing_vendor_ids("w", vendor_ids) == set(vendor_ids[::2])
+
+
+def test_portfolio_view_reads_rollups_and_awards(backend):
+    backend.save_rfp("old", "Old RFP", datetime(2024, 1, 1))
+    backend.save_rfp("new", "New RFP", datetime(2025, 1, 1))
+    backend.save_vendors("old", [record("A", "Acme", score=80.0), record("B", "Beta", score=60.0)])
+    backend.save_vendors("new", [record("A", "Acme", score=90.0)])
+    backend.save_award("old", {"Warehouse Services": ("A", "Acme")})
+    view = load_portfolio(backend)
+    assert [(s.title, s.proposals, s.mean_score, s.winners) for s in view.rfps] == [
+        ("Old RFP", 2, 70.0, ("Acme",)), ("New RFP", 1, 90.0, ())]
+    acme = view.vendors()[0]
+    assert (acme.name, acme.rfps, acme.wins, acme.mean_score) == ("Acme", 2, 1, 85.0)
+    assert [h[2] for h in view.vendor_history("Acme")] == [80.0, 90.0]
+
+
+def test_older_databases_gain_a_certifications_column(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE vendors (workspace TEXT NOT NULL, vendor_id TEXT NOT NULL, name TEXT, "
+                 "status TEXT, service_model TEXT, services TEXT, overall_score REAL, scores TEXT, "
+                 "details TEXT, seq INTEGER NOT NULL, PRIMARY KEY (workspace, vendor_id))")
+    conn.execute("INSERT INTO vendors VALUES ('w', 'A', 'Acme', 'Evaluated', 'Standalone', '[]', 80, '{}', ?, 1)",
+                 (dumps({"certifications": ["TAPA"]}),))
+    conn.commit()
+    conn.close()
+    records, _ = SQLiteBackend(path).load_vendor_summaries("w")
+    assert records[0]["certifications"] == ["TAPA"]
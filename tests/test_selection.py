@@ -0,0 +1,100 @@
+import itertools
+import random
+
+import pytest
+
+from rfp_selection import BUNDLE, Bid, SelectionIndex, optimize_award, parse_budget_range
+
+SERVICES = ["Warehouse", "Customer Service", "Consumer"]
+
+
+def random_vendors(rng, count):
+    vendors = []
+    for i in range(count):
+        model = rng.choice(["Standalone", "Consolidated"])
+        offered = SERVICES if model == "Consolidated" else [rng.choice(SERVICES)]
+        vendors.append((f"V{i:03d}", float(rng.randint(50, 100)), model, offered))
+    return vendors
+
+
+def expected_top(vendors, k, model=None, service=None, where=lambda vid: True):
+    matching = [(vid, score) for vid, score, m, offered in vendors
+                if (model is None or m == model) and (service is None or service in offered) and where(vid)]
+    # Equal scores keep insertion order, like the index's default tie break
+    return sorted(matching, key=lambda v: -v[1])[:k]
+
+
+def test_index_matches_a_full_sort_through_updates():
+    rng = random.Random(1)
+    vendors = random_vendors(rng, 300)
+    index = SelectionIndex.build(vendors)
+    # Insertion-ordered, so equal scores rank in the order vendors were last (re)scored
+    live = {vid: (vid, score, model, offered) for vid, score, model, offered in vendors}
+    for _ in range(200):
+        vid, _, model, offered = live.pop(rng.choice(list(live)))
+        if rng.random() < 0.2:
+            index.discard(vid)
+        else:
+            live[vid] = (vid, float(rng.randint(50, 100)), model, offered)
+            index.update(*live[vid])
+    live = list(live.values())
+    for model, service in [(None, None), ("Standalone", None), ("Consolidated", "Consumer"), (None, "Warehouse")]:
+        assert index.top(10, model, service) == expected_top(live, 10, model, service)
+    odd = lambda vid: int(vid[1:]) % 2 == 1
+    assert index.top(5, where=odd) == expected_top(live, 5, where=odd)
+
+
+def test_tie_break_orders_equal_scores():
+    index = SelectionIndex.build([("B", 90, "Standalone", ["Warehouse"]), ("A", 90, "Standalone", ["Warehouse"]),
+                                  ("C", 80, "Standalone", ["Warehouse"])])
+    assert index.top(1) == [("B", 90.0)]
+    assert index.top(1, tie_break=lambda vid: vid) == [("A", 90.0)]
+
+
+def test_parse_budget_range():
+    assert parse_budget_range("$5M - $25M annually") == (5e6, 25e6)
+    assert parse_budget_range("up to $750K") == (None, 750e3)
+    assert parse_budget_range("TBD") == (None, None)
+
+
+def brute_force_award(bids, services, budget):
+    best = None
+    for bid in bids:
+        if BUNDLE in bid.prices and bid.prices[BUNDLE] <= budget:
+            best = max(best or (bid.score, -bid.prices[BUNDLE]), (bid.score, -bid.prices[BUNDLE]))
+    for chosen in itertools.product(*[[b for b in bids if service in b.prices] for service in services]):
+        cost = sum(b.prices[service] for b, service in zip(chosen, services))
+        if cost <= budget:
+            option = (sum(b.score for b in chosen) / len(services), -cost)
+            best = max(best or option, option)
+    return best
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_award_is_optimal_on_small_cases(seed):
+    rng = random.Random(seed)
+    bids = []
+    for i in range(8):
+        if rng.random() < 0.3:
+            prices = {service: rng.randint(4, 12) * 1e6 for service in SERVICES}
+            prices[BUNDLE] = sum(prices.values()) * rng.uniform(0.7, 0.95)
+            bids.append(Bid(f"C{i}", f"C{i}", "Consolidated", rng.randint(60, 100), prices))
+        else:
+            service = rng.choice(SERVICES)
+            bids.append(Bid(f"S{i}", f"S{i}", "Standalone", rng.randint(60, 100), {service: rng.randint(3, 10) * 1e6}))
+    budget = rng.choice([15e6, 25e6, 40e6])
+
+    result = optimize_award(bids, SERVICES, budget)
+    expected = brute_force_award(bids, SERVICES, budget)
+    if expected is None:
+        assert result.award is None
+        return
+    award = result.award
+    assert (award.score, -award.cost) == pytest.approx(expected)
+    assert award.cost <= budget
+    assert set(award.assignments) == set(SERVICES)
+    prices = {b.vendor_id: b.prices for b in bids}
+    if award.consolidated:
+        assert len(set(award.assignments.values())) == 1
+    else:
+        assert sum(prices[vid][service] for service, vid in award.assignments.items()) == pytest.approx(award.cost)
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from rfp_store import VendorStore
+
+
+class Profile:
+    """Minimal detached profile for store tests"""
+    def __init__(self, vendor_id):
+        self._store, self._row = None, -1
+        self.vendor_id = vendor_id
+
+
+def record(i, certifications=(), status="Evaluated", score=None):
+    return {"vendor_id": f"V{i:04d}", "name": f"Vendor {i:04d}", "status": status,
+            "service_model": "Standalone", "services_offered": ["Warehouse Services"],
+            "certifications": list(certifications), "overall_score": float(i if score is None else score),
+            "scores": {"quality": 80.0}}
+
+
+@pytest.fixture
+def store():
+    store = VendorStore(["quality"], ["Warehouse Services"])
+    store.materialize = Profile
+    return store
+
+
+def picked(store, *args, **kwargs):
+    return [p.vendor_id for p in store.select_top(*args, **kwargs)]
+
+
+def test_load_records_round_trips_columns(store):
+    store.load_records([record(1, ["TAPA"]), record(2, ["ISO 9001", "TAPA"], status="Submitted")])
+    row = store._rows["V0002"]
+    assert store.get_field(row, "status") == "Submitted"
+    assert sorted(store.get_field(row, "certifications")) == ["ISO 9001", "TAPA"]
+    assert store.get_field(row, "scores") == {"quality": 80.0}
+    assert store.count(status="Evaluated") == 1
+    assert store.verify_aggregates() == []
+
+
+def test_load_records_updates_and_deletes(store):
+    store.load_records([record(1), record(2)])
+    store.load_records([record(1, ["SOC 2"], score=99), {"vendor_id": "V0002", "deleted": True}])
+    assert len(store) == 1
+    row = store._rows["V0001"]
+    assert store.get_field(row, "overall_score") == 99
+    assert store.get_field(row, "certifications") == ["SOC 2"]
+    assert store.verify_aggregates() == []
+
+
+def test_certifications_are_not_limited_to_a_machine_word(store):
+    store.load_records([record(i, [f"CERT-{i}", "Common"]) for i in range(100)])
+    assert len(store.certifications) == 101
+    assert sorted(store.get_field(store._rows["V0099"], "certifications")) == ["CERT-99", "Common"]
+    assert picked(store, 5, required_certifications=["CERT-99", "Common"]) == ["V0099"]
+    store.remove("V0000")
+    assert sorted(store.get_field(store._rows["V0099"], "certifications")) == ["CERT-99", "Common"]
+
+
+def test_extend_columns_accepts_wide_certification_masks(store):
+    names = [f"CERT-{j}" for j in range(70)]
+    store.extend_columns(["A", "B"], ["A", "B"], ["Evaluated"] * 2, ["Standalone"] * 2,
+                         np.array([1, 1]), ["Warehouse Services"], [90.0, 80.0], np.full((2, 1), np.nan),
+                         np.array([1 << 69, 1 | 1 << 69], dtype=object), names)
+    assert store.get_field(store._rows["A"], "certifications") == ["CERT-69"]
+    assert picked(store, 5, required_certifications=["CERT-69"]) == ["A", "B"]
+    assert picked(store, 5, required_certifications=["CERT-0", "CERT-69"]) == ["B"]
+
+
+def test_select_top_filters_on_certifications(store):
+    store.load_records([record(1, ["TAPA"]), record(2, ["TAPA", "ISO 9001"]), record(3, ["ISO 9001"])])
+    assert picked(store, 3) == ["V0003", "V0002", "V0001"]
+    assert picked(store, 3, required_certifications=["TAPA"]) == ["V0002", "V0001"]
+    assert picked(store, 3, required_certifications=["TAPA", "ISO 9001"]) == ["V0002"]
+    assert picked(store, 3, required_certifications=["Unknown"]) == []
+
+
+def test_select_top_sees_certification_changes(store):
+    store.load_records([record(1), record(2)])
+    store.set_field(store._rows["V0001"], "certifications", ["TAPA"])
+    assert picked(store, 3, required_certifications=["TAPA"]) == ["V0001"]
+    store.set_field(store._rows["V0001"], "certifications", [])
+    assert picked(store, 3, required_certifications=["TAPA"]) == []
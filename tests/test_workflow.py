@@ -0,0 +1,84 @@
+import random
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import pytest
+
+from rfp_schedule import Duration, Schedule, ScheduleError, parse_duration
+from rfp_templates import (LOT_STAGES, STAGE_DEFAULTS, WORKFLOW_TEMPLATE, new_workflow, rfp_details,
+                           workflow_template)
+
+
+def test_multi_lot_template_repeats_lot_stages():
+    single, three = workflow_template(1), workflow_template(3)
+    assert single == WORKFLOW_TEMPLATE
+    assert len(three) == len(single) + 2 * len(LOT_STAGES)
+    assert [t.stage_num for t in three] == list(range(1, len(three) + 1))
+    ids = {t.stage_id for t in three}
+    assert len(ids) == len(three)
+    assert all(d in ids for t in three for d in t.depends_on)
+
+
+def test_sessions_share_templates_until_they_write():
+    first, second = new_workflow(), new_workflow()
+    stage_id = WORKFLOW_TEMPLATE[0].stage_id
+    assert first[stage_id].template is second[stage_id].template
+    first[stage_id].start()
+    assert first[stage_id].status == "active" and first[stage_id].dirty
+    assert second[stage_id].status == "pending"
+    assert second[stage_id]._overlay is STAGE_DEFAULTS
+
+
+def test_rfp_details_dates_follow_the_issue_day():
+    details = rfp_details("w", date(2024, 5, 1))
+    assert details["rfp_id"].startswith("RFP-2024-")
+    assert details["issue_date"] == datetime(2024, 5, 1)
+    assert details["due_date"] == datetime(2024, 5, 31)
+    assert rfp_details("w", date(2024, 5, 1)) is details
+    assert rfp_details("w", date(2025, 1, 1))["rfp_id"].startswith("RFP-2025-")
+
+
+def test_parse_duration():
+    assert parse_duration("2 weeks") == Duration(2, "week")
+    assert parse_duration("1d").days == 1
+    with pytest.raises(ValueError):
+        parse_duration("soon")
+
+
+def stage(stage_id, days, depends_on=()):
+    return SimpleNamespace(stage_id=stage_id, duration=Duration(days, "day"), depends_on=tuple(depends_on),
+                           status="pending", progress=0)
+
+
+def test_schedule_finds_the_critical_path():
+    stages = {s.stage_id: s for s in (stage("a", 3), stage("b", 5, ["a"]), stage("c", 2, ["a"]),
+                                      stage("d", 1, ["b", "c"]))}
+    schedule = Schedule(stages)
+    assert schedule.finish == 9
+    assert schedule.critical_path() == ["a", "b", "d"]
+    assert schedule.timing("c").slack == 3
+
+    stages["b"].status = "complete"
+    schedule.stage_changed(stages["b"])
+    assert schedule.critical_path() == ["a", "c", "d"]
+    assert schedule.finish == 6
+    assert schedule.verify() == []
+
+
+def test_schedule_rejects_bad_dependencies():
+    with pytest.raises(ScheduleError):
+        Schedule({"a": stage("a", 1, ["missing"])})
+    with pytest.raises(ScheduleError):
+        Schedule({"a": stage("a", 1, ["b"]), "b": stage("b", 1, ["a"])})
+
+
+def test_incremental_schedule_matches_a_full_recompute():
+    rng = random.Random(0)
+    stages = new_workflow(workflow_template(4))
+    schedule = Schedule(stages)
+    for _ in range(300):
+        current = rng.choice(list(stages.values()))
+        current.update_progress(rng.choice([0, 30, 60, 100]))
+        if current.progress < 100:
+            current.status = rng.choice(["pending", "active"])
+        assert schedule.verify() == []